@@ -7,6 +7,8 @@ value in all solutions), then runs CDCL on the reduced problem.
 """
 
 from .bb_cdcl_solver import BBCDCLSolver, solve_bb_cdcl
-from .backbone_detector import BackboneDetector
+from .backbone_detector import (BackboneDetector, decide_backbone, clear_sample_cache,
+                                shutdown_executors)
 
-__all__ = ['BBCDCLSolver', 'solve_bb_cdcl', 'BackboneDetector']
+__all__ = ['BBCDCLSolver', 'solve_bb_cdcl', 'BackboneDetector',
+           'decide_backbone', 'clear_sample_cache', 'shutdown_executors']
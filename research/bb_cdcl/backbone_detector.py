@@ -10,17 +10,274 @@ it's likely part of the backbone. We use confidence thresholds to decide when
 to fix variables.
 """
 
+import atexit
 import sys
 import os
 import math
+import copy
+import random
+from bisect import bisect_left, insort
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Set, Tuple
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 
 from bsat.cnf import CNFExpression
-from bsat.walksat import WalkSATSolver
+
+
+# Below this many samples a process pool costs more than it saves
+PARALLEL_MIN_SAMPLES = 8
+
+# Sampling results keyed by (formula fingerprint, sampling parameters).
+# Threshold sweeps and repeated solves of the same formula reuse one run.
+SAMPLE_CACHE_SIZE = 128
+_sample_cache: 'OrderedDict[tuple, tuple]' = OrderedDict()
+
+
+def formula_fingerprint(cnf: CNFExpression) -> tuple:
+    """
+    Content key for a formula.
+
+    Clause and literal order are kept: WalkSAT's choices depend on them,
+    so only formulas that sample identically share a key.
+    """
+    return tuple(
+        tuple((lit.variable, lit.negated) for lit in clause.literals)
+        for clause in cnf.clauses
+    )
+
+
+def clear_sample_cache():
+    """Drop all cached sampling results."""
+    _sample_cache.clear()
+
+
+def decide_backbone(confidence_scores: Dict[str, Tuple[float, float]],
+                    threshold: float) -> Dict[str, bool]:
+    """
+    Pick backbone variables from per-variable confidence scores.
+
+    Args:
+        confidence_scores: var -> (conf_true, conf_false)
+        threshold: Minimum confidence to consider backbone
+
+    Returns:
+        Dictionary mapping backbone variables to their forced values
+    """
+    backbone = {}
+
+    for var, (conf_true, conf_false) in confidence_scores.items():
+        if conf_true >= threshold:
+            # Variable is almost always True -> backbone True
+            backbone[var] = True
+        elif conf_false >= threshold:
+            # Variable is almost always False -> backbone False
+            backbone[var] = False
+        # else: not confident enough, not backbone
+
+    return backbone
+
+
+def count_cutoff(threshold: float, num_samples: int) -> int:
+    """
+    Smallest sample count c with c / num_samples >= threshold.
+
+    Comparing integer counts against this cutoff gives exactly the same
+    answers as comparing the float confidences against the threshold.
+
+    Args:
+        threshold: Confidence threshold
+        num_samples: Number of samples the counts are out of (> 0)
+
+    Returns:
+        Count cutoff (num_samples + 1 if no count can reach the threshold)
+    """
+    cutoff = max(0, min(num_samples + 1, math.ceil(threshold * num_samples)))
+    while cutoff > 0 and (cutoff - 1) / num_samples >= threshold:
+        cutoff -= 1
+    while cutoff <= num_samples and cutoff / num_samples < threshold:
+        cutoff += 1
+    return cutoff
+
+
+def decide_backbone_from_counts(variable_stats: Dict[str, Dict[str, int]],
+                                num_samples: int,
+                                threshold: float) -> Dict[str, bool]:
+    """
+    Pick backbone variables by comparing integer True/False sample counts.
+
+    Same result as decide_backbone on the derived confidences, but the
+    threshold is converted to a count once and each variable costs two
+    integer comparisons.
+
+    Args:
+        variable_stats: var -> {'true': count, 'false': count}
+        num_samples: Number of samples the counts are out of (> 0)
+        threshold: Minimum confidence to consider backbone
+
+    Returns:
+        Dictionary mapping backbone variables to their forced values
+    """
+    cutoff = count_cutoff(threshold, num_samples)
+    backbone = {}
+
+    for var, counts in variable_stats.items():
+        if counts['true'] >= cutoff:
+            backbone[var] = True
+        elif counts['false'] >= cutoff:
+            backbone[var] = False
+
+    return backbone
+
+
+# Persistent sampling pools keyed by worker count, until shutdown_executors()
+_executors: Dict[int, ProcessPoolExecutor] = {}
+
+
+def _get_executor(max_workers: int) -> ProcessPoolExecutor:
+    """Return a persistent process pool shared by all detectors of this width."""
+    executor = _executors.get(max_workers)
+    if executor is None:
+        executor = _executors[max_workers] = ProcessPoolExecutor(max_workers=max_workers)
+    return executor
+
+
+def shutdown_executors(wait: bool = True):
+    """
+    Shut down the persistent sampling pools.
+
+    Also runs at interpreter exit. Later parallel sampling starts new pools.
+    """
+    while _executors:
+        _, executor = _executors.popitem()
+        executor.shutdown(wait=wait)
+
+
+atexit.register(shutdown_executors)
+
+
+if hasattr(int, 'bit_count'):
+    def _popcount(x: int) -> int:
+        return x.bit_count()
+else:  # Python < 3.10
+    def _popcount(x: int) -> int:
+        return bin(x).count('1')
+
+
+def _compile_formula(cnf: CNFExpression) -> tuple:
+    """
+    Lower a formula to integer form for the WalkSAT kernel.
+
+    Returns:
+        (variables, clause_masks, clause_vars, occurrences) where variables is
+        sorted (the order WalkSATSolver assigns in); clause_masks[c] is a
+        (positive, negative) pair of bitmasks over var ids; clause_vars[c]
+        lists the var_id of each literal (duplicates kept); and
+        occurrences[v] lists (clause, has_pos, has_neg) per clause containing
+        v, with has_pos/has_neg 0 or 1.
+    """
+    variables = sorted(cnf.get_variables())
+    var_id = {var: i for i, var in enumerate(variables)}
+
+    clause_masks = []
+    clause_vars = []
+    occurrences = [[] for _ in variables]
+
+    for c, clause in enumerate(cnf.clauses):
+        pos_mask = neg_mask = 0
+        ids = []
+        for lit in clause.literals:
+            v = var_id[lit.variable]
+            ids.append(v)
+            if lit.negated:
+                neg_mask |= 1 << v
+            else:
+                pos_mask |= 1 << v
+        clause_masks.append((pos_mask, neg_mask))
+        clause_vars.append(ids)
+
+        for v in dict.fromkeys(ids):
+            occurrences[v].append((c, pos_mask >> v & 1, neg_mask >> v & 1))
+
+    return variables, clause_masks, clause_vars, occurrences
+
+
+def _walksat_sample(compiled: tuple, noise: float, max_flips: int,
+                    seed: int) -> Optional[Dict[str, bool]]:
+    """
+    Run a single seeded WalkSAT try on a compiled formula.
+
+    Makes the same random draws and the same moves as a one-try
+    WalkSATSolver with this seed, so it returns the same solution. Clause
+    states start from a bit-parallel evaluation of the whole assignment
+    (true literals = (bits & pos) | (~bits & neg)); after that, per-clause
+    true-literal counts and a sorted unsatisfied list are kept up to date on
+    each flip, instead of re-evaluating every clause. Module-level so worker
+    processes can pickle it.
+    """
+    variables, clause_masks, clause_vars, occurrences = compiled
+    if not clause_masks or not variables:
+        return {}
+
+    rng = random.Random(seed)
+    choice = rng.choice
+    assignment = [choice([True, False]) for _ in variables]
+
+    bits = 0
+    for v, value in enumerate(assignment):
+        if value:
+            bits |= 1 << v
+    not_bits = ~bits
+
+    # Number of distinct true literals per clause
+    num_true = [_popcount((bits & pos) | (not_bits & neg)) for pos, neg in clause_masks]
+    unsatisfied = [c for c, count in enumerate(num_true) if count == 0]
+
+    for _ in range(max_flips):
+        if not unsatisfied:
+            return dict(zip(variables, assignment))
+
+        # Pick random unsatisfied clause
+        clause = choice(unsatisfied)
+
+        if rng.random() < noise:
+            # Random walk: flip random variable from clause
+            var = choice(clause_vars[clause])
+        else:
+            # Greedy: flip variable that minimizes break count. A satisfied
+            # clause breaks when all of its true literals are on var and none
+            # of var's literals in it are currently false.
+            candidates = clause_vars[clause]
+            min_breaks = float('inf')
+            var = candidates[0]
+            for candidate in candidates:
+                value = assignment[candidate]
+                breaks = 0
+                for c, pos, neg in occurrences[candidate]:
+                    true_here, false_here = (pos, neg) if value else (neg, pos)
+                    if false_here == 0 and num_true[c] == true_here:
+                        breaks += 1
+                if breaks < min_breaks:
+                    min_breaks = breaks
+                    var = candidate
+
+        # Flip the variable and update clause counts
+        value = assignment[var]
+        assignment[var] = not value
+        for c, pos, neg in occurrences[var]:
+            old = num_true[c]
+            new = old + (neg - pos if value else pos - neg)
+            num_true[c] = new
+            if old == 0 and new > 0:
+                del unsatisfied[bisect_left(unsatisfied, c)]
+            elif old > 0 and new == 0:
+                insort(unsatisfied, c)
+
+    # No solution found within limits
+    return None
 
 
 class BackboneDetector:
@@ -45,7 +302,9 @@ class BackboneDetector:
                  num_samples: int = 100,
                  confidence_threshold: float = 0.95,
                  walksat_max_flips: int = 10000,
-                 walksat_noise: float = 0.5):
+                 walksat_noise: float = 0.5,
+                 n_jobs: Optional[int] = 1,
+                 use_cache: bool = True):
         """
         Initialize backbone detector.
 
@@ -55,12 +314,16 @@ class BackboneDetector:
             confidence_threshold: Minimum confidence to consider backbone (0.95 = 95%)
             walksat_max_flips: Max flips per WalkSAT try
             walksat_noise: Noise parameter for WalkSAT
+            n_jobs: Worker processes for sampling (1 = serial, None = all cores)
+            use_cache: Reuse samples from earlier runs on the same formula
         """
         self.cnf = cnf
         self.num_samples = num_samples
         self.confidence_threshold = confidence_threshold
         self.walksat_max_flips = walksat_max_flips
         self.walksat_noise = walksat_noise
+        self.n_jobs = n_jobs
+        self.use_cache = use_cache
 
         # Sample solutions
         self.samples: List[Dict[str, bool]] = []
@@ -70,6 +333,10 @@ class BackboneDetector:
         self.backbone: Dict[str, bool] = {}  # var -> forced_value
         self.confidence_scores: Dict[str, Tuple[float, float]] = {}  # var -> (conf_true, conf_false)
 
+        # Derived views (rebuilt after the samples or backbone change)
+        self._statistics_cache: Optional[Dict] = None
+        self._confidence_data_cache: Optional[List[Dict]] = None
+
     def detect_backbone(self) -> Dict[str, bool]:
         """
         Detect backbone variables via sampling.
@@ -77,81 +344,142 @@ class BackboneDetector:
         Returns:
             Dictionary mapping backbone variables to their forced values
         """
+        self._invalidate_derived()
+
+        cache_key = None
+        if self.use_cache:
+            cache_key = (formula_fingerprint(self.cnf), self.num_samples,
+                         self.walksat_max_flips, self.walksat_noise)
+            cached = _sample_cache.get(cache_key)
+            if cached is not None:
+                _sample_cache.move_to_end(cache_key)
+                samples, variable_stats, confidence_scores = cached
+                self.samples = list(samples)
+                self.variable_stats = {var: dict(counts) for var, counts in variable_stats.items()}
+                self.confidence_scores = dict(confidence_scores)
+                self._identify_backbone()
+                return self.backbone
+
         # Collect samples
         self._collect_samples()
 
         if not self.samples:
             # No samples collected - formula might be UNSAT or very hard
+            self._store_in_cache(cache_key)
             return {}
 
         # Compute statistics
         self._compute_statistics()
+        self._store_in_cache(cache_key)
 
         # Identify backbone
         self._identify_backbone()
 
         return self.backbone
 
+    def with_threshold(self, confidence_threshold: float) -> 'BackboneDetector':
+        """
+        Re-decide the backbone at another threshold without resampling.
+
+        Sampling does not depend on the threshold, so a sweep can sample
+        once and call this per threshold. The returned detector shares this
+        one's samples and confidence table (neither is modified after
+        detection).
+
+        Args:
+            confidence_threshold: Minimum confidence to consider backbone
+
+        Returns:
+            New detector over the same samples
+        """
+        detector = copy.copy(self)
+        detector.confidence_threshold = confidence_threshold
+        detector._identify_backbone()
+        return detector
+
+    def _invalidate_derived(self):
+        """Drop cached statistics and confidence rows."""
+        self._statistics_cache = None
+        self._confidence_data_cache = None
+
+    def _store_in_cache(self, cache_key: Optional[tuple]):
+        """Remember this run's samples and confidence table."""
+        if cache_key is None:
+            return
+
+        _sample_cache[cache_key] = (
+            list(self.samples),
+            {var: dict(counts) for var, counts in self.variable_stats.items()},
+            dict(self.confidence_scores)
+        )
+        if len(_sample_cache) > SAMPLE_CACHE_SIZE:
+            _sample_cache.popitem(last=False)
+
     def _collect_samples(self):
         """Collect sample solutions using WalkSAT with different seeds."""
         self.samples = []
 
-        for seed in range(self.num_samples):
-            solver = WalkSATSolver(
-                self.cnf,
-                noise=self.walksat_noise,
-                max_flips=self.walksat_max_flips,
-                max_tries=1,  # Single try per seed
-                seed=seed
+        seeds = range(self.num_samples)
+        compiled = _compile_formula(self.cnf)
+        n_jobs = self.n_jobs if self.n_jobs is not None else (os.cpu_count() or 1)
+
+        if n_jobs > 1 and self.num_samples >= PARALLEL_MIN_SAMPLES:
+            # Samples are independent and each run reseeds itself, so the
+            # pool yields exactly the serial results, in seed order
+            executor = _get_executor(n_jobs)
+            chunksize = max(1, self.num_samples // (4 * n_jobs))
+            solutions = executor.map(
+                _walksat_sample,
+                [compiled] * self.num_samples,
+                [self.walksat_noise] * self.num_samples,
+                [self.walksat_max_flips] * self.num_samples,
+                seeds,
+                chunksize=chunksize
+            )
+        else:
+            solutions = (
+                _walksat_sample(compiled, self.walksat_noise, self.walksat_max_flips, seed)
+                for seed in seeds
             )
 
-            solution = solver.solve()
-
+        for solution in solutions:
             if solution is not None:
                 self.samples.append(solution)
 
-            # Early stopping if we have enough diverse samples
-            if len(self.samples) >= self.num_samples:
-                break
-
     def _compute_statistics(self):
         """Compute per-variable statistics from samples."""
         if not self.samples:
             return
 
-        variables = self.samples[0].keys()
-
-        # Initialize counters
-        for var in variables:
-            self.variable_stats[var] = {'true': 0, 'false': 0}
+        # Every WalkSAT solution assigns the same variables, so the samples
+        # form a (num_samples x num_variables) matrix of bools. Transposing it
+        # and summing each column counts True values in C, instead of one
+        # dict increment per sample per variable.
+        variables = list(self.samples[0].keys())
+        if not variables:
+            return
 
-        # Count occurrences
-        for sample in self.samples:
-            for var, value in sample.items():
-                if value:
-                    self.variable_stats[var]['true'] += 1
-                else:
-                    self.variable_stats[var]['false'] += 1
+        if len(variables) == 1:
+            columns = [[sample[variables[0]] for sample in self.samples]]
+        else:
+            columns = zip(*map(itemgetter(*variables), self.samples))
 
-        # Compute confidence scores
+        # Count occurrences and compute confidence scores
         num_samples = len(self.samples)
-        for var, counts in self.variable_stats.items():
-            conf_true = counts['true'] / num_samples
-            conf_false = counts['false'] / num_samples
-            self.confidence_scores[var] = (conf_true, conf_false)
+        for var, column in zip(variables, columns):
+            true_count = sum(column)
+            false_count = num_samples - true_count
+            self.variable_stats[var] = {'true': true_count, 'false': false_count}
+            self.confidence_scores[var] = (true_count / num_samples, false_count / num_samples)
 
     def _identify_backbone(self):
         """Identify backbone variables based on confidence threshold."""
-        self.backbone = {}
-
-        for var, (conf_true, conf_false) in self.confidence_scores.items():
-            if conf_true >= self.confidence_threshold:
-                # Variable is almost always True -> backbone True
-                self.backbone[var] = True
-            elif conf_false >= self.confidence_threshold:
-                # Variable is almost always False -> backbone False
-                self.backbone[var] = False
-            # else: not confident enough, not backbone
+        if self.variable_stats:
+            self.backbone = decide_backbone_from_counts(
+                self.variable_stats, len(self.samples), self.confidence_threshold)
+        else:
+            self.backbone = decide_backbone(self.confidence_scores, self.confidence_threshold)
+        self._invalidate_derived()
 
     def get_statistics(self) -> Dict:
         """
@@ -160,6 +488,9 @@ class BackboneDetector:
         Returns:
             Dictionary with backbone statistics
         """
+        if self._statistics_cache is not None:
+            return dict(self._statistics_cache)
+
         total_vars = len(self.variable_stats)
         backbone_vars = len(self.backbone)
 
@@ -182,7 +513,7 @@ class BackboneDetector:
         else:
             search_space_reduction = 1
 
-        return {
+        self._statistics_cache = {
             'num_samples': len(self.samples),
             'num_variables': total_vars,
             'num_backbone': backbone_vars,
@@ -194,6 +525,7 @@ class BackboneDetector:
             'estimated_search_reduction': search_space_reduction,
             'reduction_factor': f"2^{total_vars} → 2^{total_vars - backbone_vars}"
         }
+        return dict(self._statistics_cache)
 
     def get_confidence_for_variable(self, variable: str) -> Tuple[float, float]:
         """
@@ -233,13 +565,8 @@ class BackboneDetector:
 
         return len(self.backbone) / total_vars
 
-    def visualize_confidence_data(self) -> Dict:
-        """
-        Export confidence data for visualization.
-
-        Returns:
-            Dictionary with visualization-ready confidence data
-        """
+    def _build_confidence_data(self) -> List[Dict]:
+        """Build per-variable confidence rows, highest confidence first."""
         # Sort variables by confidence (highest first)
         sorted_vars = sorted(
             self.confidence_scores.items(),
@@ -269,6 +596,21 @@ class BackboneDetector:
                 'entropy': entropy
             })
 
+        return confidence_data
+
+    def visualize_confidence_data(self) -> Dict:
+        """
+        Export confidence data for visualization.
+
+        Returns:
+            Dictionary with visualization-ready confidence data
+        """
+        if self._confidence_data_cache is None:
+            self._confidence_data_cache = self._build_confidence_data()
+
+        # Fresh row dicts so callers can annotate them without touching the cache
+        confidence_data = [dict(row) for row in self._confidence_data_cache]
+
         return {
             'confidence_data': confidence_data,
             'statistics': self.get_statistics(),
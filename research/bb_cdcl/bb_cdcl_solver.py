@@ -45,7 +45,9 @@ class BBCDCLSolver:
                  confidence_threshold: float = 0.95,
                  use_cdcl: bool = True,
                  max_backbone_conflicts: int = 10,
-                 adaptive_sampling: bool = True):
+                 adaptive_sampling: bool = True,
+                 n_jobs: Optional[int] = 1,
+                 detector: Optional[BackboneDetector] = None):
         """
         Initialize BB-CDCL solver.
 
@@ -56,6 +58,9 @@ class BBCDCLSolver:
             use_cdcl: Use CDCL for systematic search (else DPLL)
             max_backbone_conflicts: Max conflicts before unfixing backbone vars
             adaptive_sampling: Automatically adjust sample count based on problem difficulty
+            n_jobs: Worker processes for WalkSAT sampling (1 = serial, None = all cores)
+            detector: Detector that has already sampled this formula; its samples
+                are reused and only the threshold decision is redone
         """
         self.cnf = cnf
         self.num_samples_requested = num_samples
@@ -63,6 +68,7 @@ class BBCDCLSolver:
         self.use_cdcl = use_cdcl
         self.max_backbone_conflicts = max_backbone_conflicts
         self.adaptive_sampling = adaptive_sampling
+        self.n_jobs = n_jobs
 
         # Statistics (must be initialized before adaptive sampling)
         self.stats = {
@@ -90,11 +96,48 @@ class BBCDCLSolver:
             self.num_samples = 100  # Default fallback
 
         # Backbone detection
+        self.sampled_detector = detector
         self.detector: Optional[BackboneDetector] = None
         self.backbone: Dict[str, bool] = {}
         self.fixed_backbone: Dict[str, bool] = {}
         self.unfixed_backbone: Set[str] = set()
 
+    def fork(self, **overrides) -> 'BBCDCLSolver':
+        """
+        Create a fresh solver over the same formula, optionally changing settings.
+
+        The formula is shared by reference, and so are this solver's backbone
+        samples (once it has sampled, or if it was given a detector), so a
+        fork only re-decides the backbone instead of sampling again. Per-solve
+        state (backbone, fixed/unfixed variables, statistics) starts empty.
+        The shared samples are only kept if the fork uses the same sample
+        count (changing num_samples or adaptive_sampling may change it).
+
+        Args:
+            **overrides: Constructor arguments to change (e.g. confidence_threshold)
+
+        Returns:
+            New BBCDCLSolver
+        """
+        settings = {
+            'num_samples': self.num_samples_requested,
+            'confidence_threshold': self.confidence_threshold,
+            'use_cdcl': self.use_cdcl,
+            'max_backbone_conflicts': self.max_backbone_conflicts,
+            'adaptive_sampling': self.adaptive_sampling,
+            'n_jobs': self.n_jobs,
+            'detector': self.detector or self.sampled_detector,
+        }
+        settings.update(overrides)
+        forked = BBCDCLSolver(self.cnf, **settings)
+
+        shared = forked.sampled_detector
+        if ('detector' not in overrides and shared is not None
+                and shared.num_samples != forked.num_samples):
+            forked.sampled_detector = None
+
+        return forked
+
     def _compute_adaptive_sample_count(self) -> int:
         """
         Compute adaptive sample count based on problem difficulty.
@@ -173,12 +216,18 @@ class BBCDCLSolver:
 
         # Phase 1: Detect backbone
         backbone_start = time.time()
-        self.detector = BackboneDetector(
-            self.cnf,
-            num_samples=self.num_samples,
-            confidence_threshold=self.confidence_threshold
-        )
-        self.backbone = self.detector.detect_backbone()
+        if self.sampled_detector is not None:
+            # Reuse existing samples; only the threshold decision is redone
+            self.detector = self.sampled_detector.with_threshold(self.confidence_threshold)
+            self.backbone = self.detector.backbone
+        else:
+            self.detector = BackboneDetector(
+                self.cnf,
+                num_samples=self.num_samples,
+                confidence_threshold=self.confidence_threshold,
+                n_jobs=self.n_jobs
+            )
+            self.backbone = self.detector.detect_backbone()
         backbone_time = time.time() - backbone_start
 
         self.stats['backbone_detection_time'] = backbone_time
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test script for BBCDCLSolver.fork sample sharing.
+A fork must only reuse the parent's WalkSAT samples when it would draw the
+same number of samples itself.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from bsat import CNFExpression
+from bb_cdcl import BBCDCLSolver
+
+
+FORMULA = "(a | b) & (~a | c) & (b | ~c | d) & (~b | d) & (a | ~d | e)"
+
+
+def test_fork_reuses_samples_with_same_count():
+    cnf = CNFExpression.parse(FORMULA)
+    parent = BBCDCLSolver(cnf)
+    parent.solve()
+
+    forked = parent.fork(confidence_threshold=0.8)
+    assert forked.num_samples == parent.num_samples
+    assert forked.sampled_detector is parent.detector
+
+
+def test_fork_drops_samples_when_adaptive_count_changes():
+    cnf = CNFExpression.parse(FORMULA)
+    parent = BBCDCLSolver(cnf)  # Adaptive: few samples for an easy formula
+    parent.solve()
+
+    forked = parent.fork(adaptive_sampling=False)  # Fixed default of 100
+    assert forked.num_samples == 100
+    assert parent.num_samples != forked.num_samples
+    assert forked.sampled_detector is None
+
+    forked.solve()
+    assert forked.get_statistics()['num_samples'] == 100
+
+
+def test_fork_drops_samples_when_num_samples_changes():
+    cnf = CNFExpression.parse(FORMULA)
+    parent = BBCDCLSolver(cnf, num_samples=20)
+    parent.solve()
+
+    forked = parent.fork(num_samples=30)
+    assert forked.sampled_detector is None
+
+
+if __name__ == "__main__":
+    test_fork_reuses_samples_with_same_count()
+    test_fork_drops_samples_when_adaptive_count_changes()
+    test_fork_drops_samples_when_num_samples_changes()
+    print("All fork tests passed")
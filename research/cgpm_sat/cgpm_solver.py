@@ -307,12 +307,13 @@ class CGPMSolver:
 
         # Update every N clauses to reduce overhead
         if self.learned_clauses_count % self.update_frequency == 0:
-            self.graph.add_conflict_clause(conflict_clause)
             self.stats['graph_updates'] += 1
 
-            # Invalidate score cache since graph changed
-            self._cached_scores = None
-            self._max_degree_cache = None
+            # Invalidate score cache only if the graph's structure changed;
+            # a repeated conflict clause just bumps edge weights
+            if self.graph.add_conflict_clause(conflict_clause):
+                self._cached_scores = None
+                self._max_degree_cache = None
 
         self.stats['graph_construction_time'] += time.time() - start
 
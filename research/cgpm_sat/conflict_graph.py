@@ -17,6 +17,8 @@ conflicts more efficiently.
 
 import sys
 import os
+import heapq
+from array import array
 from typing import Dict, List, Optional, Set, Tuple
 from collections import defaultdict
 from dataclasses import dataclass
@@ -63,31 +65,50 @@ class ConflictGraph:
         self._pagerank_cache: Optional[Dict[str, float]] = None
         self._clustering_cache: Optional[Dict[str, float]] = None
         self._centrality_cache: Optional[Dict[str, float]] = None
+        self._statistics_cache: Optional[Dict] = None
 
-    def add_conflict_clause(self, clause: Clause):
+        # Compressed sparse rows over integer variable ids (rebuilt lazily
+        # when the edge set changes)
+        self._csr_cache: Optional[Tuple[List[str], List[int], array, array]] = None
+
+    def add_conflict_clause(self, clause: Clause) -> bool:
         """
         Add a conflict clause to the graph.
 
         Creates edges between all pairs of variables in the clause.
+        Clauses that repeat (the same conflict under different assignments)
+        only bump edge weights. The metrics depend on which edges exist, not
+        on their weights, so cached metrics are kept in that case.
 
         Args:
             clause: Conflict clause (learned or from formula)
+
+        Returns:
+            True if a new variable or edge was added
         """
         variables_in_clause = list(set(lit.variable for lit in clause.literals))
+        changed = False
 
         # Add all variables
         for var in variables_in_clause:
-            self.variables.add(var)
+            if var not in self.variables:
+                self.variables.add(var)
+                changed = True
 
         # Add edges between all pairs (conflict co-occurrence)
         for i, var1 in enumerate(variables_in_clause):
             for var2 in variables_in_clause[i+1:]:
+                if var2 not in self.adjacency.get(var1, ()):
+                    changed = True
                 # Undirected edge (both directions)
                 self.adjacency[var1][var2] += 1
                 self.adjacency[var2][var1] += 1
 
         # Invalidate caches
-        self._invalidate_caches()
+        if changed:
+            self._invalidate_caches()
+
+        return changed
 
     def add_formula(self, cnf: CNFExpression):
         """
@@ -136,7 +157,34 @@ class ConflictGraph:
         """
         return self.adjacency.get(var1, {}).get(var2, 0)
 
-    def compute_pagerank(self, iterations: int = 20, damping: float = 0.85) -> Dict[str, float]:
+    def _get_csr(self) -> Tuple[List[str], List[int], array, array]:
+        """
+        Get the graph in compressed sparse row form over integer ids.
+
+        Returns:
+            (variables, push_order, indptr, indices): variables in set order
+            (a variable's id is its position here); indices[indptr[v]:indptr[v+1]]
+            are the neighbor ids of v in adjacency order; push_order lists the
+            ids with at least one neighbor, in adjacency order
+        """
+        if self._csr_cache is None:
+            variables = list(self.variables)
+            var_id = {var: i for i, var in enumerate(variables)}
+
+            indptr = array('i', [0])
+            indices = array('i')
+            for var in variables:
+                indices.extend(var_id[neighbor] for neighbor in self.adjacency.get(var, ()))
+                indptr.append(len(indices))
+
+            push_order = [var_id[var] for var, neighbors in self.adjacency.items() if neighbors]
+
+            self._csr_cache = (variables, push_order, indptr, indices)
+
+        return self._csr_cache
+
+    def compute_pagerank(self, iterations: int = 20, damping: float = 0.85,
+                         tolerance: float = 0.0) -> Dict[str, float]:
         """
         Compute PageRank for all variables.
 
@@ -146,6 +194,8 @@ class ConflictGraph:
         Args:
             iterations: Number of PageRank iterations
             damping: Damping factor (0.85 typical)
+            tolerance: Stop early once an iteration changes the scores by at
+                most this much in L1 (0.0 = only at an exact fixed point)
 
         Returns:
             Dictionary mapping variables to PageRank scores
@@ -156,28 +206,33 @@ class ConflictGraph:
         if not self.variables:
             return {}
 
+        variables, push_order, indptr, indices = self._get_csr()
+
         # Initialize PageRank
-        n = len(self.variables)
-        pagerank = {var: 1.0 / n for var in self.variables}
+        n = len(variables)
+        pagerank = [1.0 / n] * n
+        teleport = (1 - damping) / n
 
-        # Power iteration
+        # Power iteration over the sparse rows: each variable pushes its share
+        # along its own edges, O(V + E) per iteration. Shares reach each
+        # variable in adjacency order, matching a pull over self.adjacency.
         for _ in range(iterations):
-            new_pagerank = {}
+            incoming = [0.0] * n
 
-            for var in self.variables:
-                # Incoming PageRank from neighbors
-                incoming = 0.0
-                for neighbor in self.adjacency:
-                    if var in self.adjacency[neighbor]:
-                        neighbor_degree = self.get_degree(neighbor)
-                        if neighbor_degree > 0:
-                            incoming += pagerank[neighbor] / neighbor_degree
-
-                # PageRank formula
-                new_pagerank[var] = (1 - damping) / n + damping * incoming
+            for source in push_order:
+                start, end = indptr[source], indptr[source + 1]
+                share = pagerank[source] / (end - start)
+                for var in indices[start:end]:
+                    incoming[var] += share
 
+            # PageRank formula
+            new_pagerank = [teleport + damping * x for x in incoming]
+            delta = sum(abs(new - old) for new, old in zip(new_pagerank, pagerank))
             pagerank = new_pagerank
+            if delta <= tolerance:
+                break
 
+        pagerank = dict(zip(variables, pagerank))
         self._pagerank_cache = pagerank
         return pagerank
 
@@ -221,9 +276,19 @@ class ConflictGraph:
         if self._clustering_cache is not None:
             return self._clustering_cache
 
+        variables, _, indptr, indices = self._get_csr()
+        neighbor_sets = [set(indices[indptr[v]:indptr[v + 1]]) for v in range(len(variables))]
+
         clustering = {}
-        for var in self.variables:
-            clustering[var] = self.compute_clustering_coefficient(var)
+        for var, neighbors in zip(variables, neighbor_sets):
+            k = len(neighbors)
+            if k < 2:
+                clustering[var] = 0.0
+                continue
+
+            # Each edge between two neighbors is seen from both ends
+            edges_between_neighbors = sum(len(neighbor_sets[n] & neighbors) for n in neighbors) // 2
+            clustering[var] = edges_between_neighbors / (k * (k - 1) / 2)
 
         self._clustering_cache = clustering
         return clustering
@@ -243,29 +308,30 @@ class ConflictGraph:
         if self._centrality_cache is not None:
             return self._centrality_cache
 
-        betweenness = {var: 0.0 for var in self.variables}
+        variables, _, indptr, indices = self._get_csr()
+        n = len(variables)
+        scores = [0.0] * n
 
-        # For each variable as a source
-        for source in self.variables:
-            # BFS to find distances
-            distances = {source: 0}
+        # For each variable as a source, BFS over integer ids
+        for source in range(n):
+            visited = [False] * n
+            visited[source] = True
             queue = [source]
-            visited = {source}
-
-            while queue:
-                current = queue.pop(0)
-                current_dist = distances[current]
 
-                for neighbor in self.get_neighbors(current):
-                    if neighbor not in visited:
-                        visited.add(neighbor)
-                        distances[neighbor] = current_dist + 1
+            for current in queue:
+                discovered = 0
+                for neighbor in indices[indptr[current]:indptr[current + 1]]:
+                    if not visited[neighbor]:
+                        visited[neighbor] = True
                         queue.append(neighbor)
+                        discovered += 1
+
+                # Increment betweenness for intermediate nodes
+                # (simplified: just count paths)
+                if current != source:
+                    scores[current] += discovered
 
-                        # Increment betweenness for intermediate nodes
-                        # (simplified: just count paths)
-                        if current != source:
-                            betweenness[current] += 1.0
+        betweenness = dict(zip(variables, scores))
 
         # Normalize
         n = len(self.variables)
@@ -332,8 +398,8 @@ class ConflictGraph:
             List of variable names (highest PageRank first)
         """
         pagerank = self.compute_pagerank()
-        sorted_vars = sorted(pagerank.items(), key=lambda x: x[1], reverse=True)
-        return [var for var, _ in sorted_vars[:k]]
+        top = heapq.nlargest(k, pagerank.items(), key=lambda x: x[1])
+        return [var for var, _ in top]
 
     def get_top_k_by_degree(self, k: int) -> List[str]:
         """
@@ -368,6 +434,8 @@ class ConflictGraph:
         self._pagerank_cache = None
         self._clustering_cache = None
         self._centrality_cache = None
+        self._csr_cache = None
+        self._statistics_cache = None
 
     def get_statistics(self) -> Dict:
         """
@@ -376,6 +444,9 @@ class ConflictGraph:
         Returns:
             Dictionary with graph statistics
         """
+        if self._statistics_cache is not None:
+            return dict(self._statistics_cache)
+
         if not self.variables:
             return {
                 'num_variables': 0,
@@ -398,13 +469,14 @@ class ConflictGraph:
         max_edges = n * (n - 1) / 2
         density = num_edges / max_edges if max_edges > 0 else 0.0
 
-        return {
+        self._statistics_cache = {
             'num_variables': len(self.variables),
             'num_edges': num_edges,
             'avg_degree': avg_degree,
             'max_degree': max_degree,
             'graph_density': density
         }
+        return dict(self._statistics_cache)
 
     def export_visualization_data(self) -> Dict:
         """
@@ -14,7 +14,7 @@ Algorithm:
 
 import sys
 import os
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from collections import defaultdict
 from itertools import product
 
@@ -51,7 +51,9 @@ class CoBDSATSolver:
                  min_communities: int = 2,
                  max_communities: int = 8,
                  max_interface_assignments: int = 1000,
-                 use_cdcl: bool = False):
+                 use_cdcl: bool = False,
+                 detector: Optional[CommunityDetector] = None,
+                 num_partition_attempts: int = 1):
         """
         Initialize CoBD-SAT solver.
 
@@ -61,15 +63,24 @@ class CoBDSATSolver:
             max_communities: Maximum communities to detect (default 8)
             max_interface_assignments: Max interface variable combinations to try (default 1000)
             use_cdcl: Use CDCL instead of DPLL for sub-problems (default False)
+            detector: CommunityDetector for cnf to share with other solvers; its
+                partition is reused when it was detected with the same
+                community bounds (default None, build a new one)
+            num_partition_attempts: Community detection runs to keep the
+                highest-modularity partition of, when building the detector
+                (default 1)
         """
         self.cnf = cnf
         self.min_communities = min_communities
         self.max_communities = max_communities
         self.max_interface_assignments = max_interface_assignments
         self.use_cdcl = use_cdcl
+        self.num_partition_attempts = num_partition_attempts
 
         # Community detection
-        self.detector = CommunityDetector(cnf)
+        if detector is None:
+            detector = CommunityDetector(cnf, num_attempts=num_partition_attempts)
+        self.detector = detector
         self.communities: Dict[str, int] = {}
         self.interface_variables: Set[str] = set()
         self.community_formulas: Dict[int, CNFExpression] = {}
@@ -86,6 +97,36 @@ class CoBDSATSolver:
             'fallback_reason': None
         }
 
+    def fork(self, **overrides) -> 'CoBDSATSolver':
+        """
+        Create a fresh solver over the same formula, optionally changing settings.
+
+        The formula and the community detector are shared, so a fork with the
+        same community bounds skips graph construction and community
+        detection. Per-solve state (communities, sub-formulas, statistics)
+        starts empty. Changing num_partition_attempts builds a new detector.
+
+        Args:
+            **overrides: Constructor arguments to change (e.g. max_interface_assignments)
+
+        Returns:
+            New CoBDSATSolver
+        """
+        settings = {
+            'min_communities': self.min_communities,
+            'max_communities': self.max_communities,
+            'max_interface_assignments': self.max_interface_assignments,
+            'use_cdcl': self.use_cdcl,
+            'detector': self.detector,
+            'num_partition_attempts': self.num_partition_attempts,
+        }
+        if (overrides.get('num_partition_attempts', self.num_partition_attempts)
+                != self.num_partition_attempts):
+            settings['detector'] = None
+        settings.update(overrides)
+
+        return CoBDSATSolver(self.cnf, **settings)
+
     def solve(self) -> Optional[Dict[str, bool]]:
         """
         Solve the SAT problem using community-based decomposition.
@@ -93,11 +134,14 @@ class CoBDSATSolver:
         Returns:
             Satisfying assignment if SAT, None if UNSAT
         """
-        # Detect communities
-        self.communities = self.detector.detect_communities(
-            min_communities=self.min_communities,
-            max_communities=self.max_communities
-        )
+        # Detect communities, unless a shared detector already has them
+        if self.detector.detected_bounds == (self.min_communities, self.max_communities):
+            self.communities = self.detector.get_variable_communities()
+        else:
+            self.communities = self.detector.detect_communities(
+                min_communities=self.min_communities,
+                max_communities=self.max_communities
+            )
 
         # Get statistics
         community_stats = self.detector.get_statistics()
@@ -191,10 +235,21 @@ class CoBDSATSolver:
                 comm_id = clause_communities[clause_id]
                 clauses_by_community[comm_id].append(clause)
 
-        # Build CNF for each community
+        # Build CNF for each community. Clauses densest in interface literals
+        # come first so that a conflicting interface assignment is detected
+        # after simplifying as few clauses as possible.
         for comm_id, clauses in clauses_by_community.items():
+            clauses.sort(key=self._interface_density, reverse=True)
             self.community_formulas[comm_id] = CNFExpression(clauses)
 
+    def _interface_density(self, clause: Clause) -> float:
+        """Fraction of a clause's literals that are on interface variables."""
+        if not clause.literals:
+            return 1.0
+        num_interface = sum(1 for lit in clause.literals
+                            if lit.variable in self.interface_variables)
+        return num_interface / len(clause.literals)
+
     def _solve_with_decomposition(self) -> Optional[Dict[str, bool]]:
         """
         Solve using community decomposition.
@@ -267,12 +322,13 @@ class CoBDSATSolver:
         for comm_id, formula in self.community_formulas.items():
             self.stats['community_solve_attempts'] += 1
 
-            # Simplify formula given interface assignment
-            simplified_clauses = self._simplify_clauses(formula.clauses, interface_assignment)
-
-            # Check for empty clause (conflict with interface assignment)
-            if any(not clause.literals for clause in simplified_clauses):
-                return None  # This interface assignment doesn't work
+            # Simplify formula given interface assignment, stopping at the
+            # first empty clause (conflict with interface assignment)
+            simplified_clauses = []
+            for clause in self._simplify_clauses(formula.clauses, interface_assignment):
+                if not clause.literals:
+                    return None  # This interface assignment doesn't work
+                simplified_clauses.append(clause)
 
             # Check if already satisfied
             if not simplified_clauses:
@@ -293,19 +349,20 @@ class CoBDSATSolver:
 
         return combined_solution
 
-    def _simplify_clauses(self, clauses: List[Clause], assignment: Dict[str, bool]) -> List[Clause]:
+    def _simplify_clauses(self, clauses: List[Clause],
+                          assignment: Dict[str, bool]) -> Iterator[Clause]:
         """
         Simplify clauses given a partial assignment (interface variables).
 
+        Clauses are produced lazily so callers can stop at the first conflict.
+
         Args:
             clauses: List of clauses to simplify
             assignment: Partial assignment (interface variables)
 
-        Returns:
-            Simplified clauses with interface variables removed
+        Yields:
+            Unsatisfied clauses with interface variables removed
         """
-        simplified = []
-
         for clause in clauses:
             # Check if clause is satisfied or simplify it
             clause_satisfied = False
@@ -327,9 +384,7 @@ class CoBDSATSolver:
                     new_literals.append(literal)
 
             if not clause_satisfied:
-                simplified.append(Clause(new_literals))
-
-        return simplified
+                yield Clause(new_literals)
 
     def get_statistics(self) -> Dict:
         """
@@ -9,11 +9,19 @@ The algorithm builds a bipartite graph where:
 - Edges connect variables to the clauses they appear in
 
 Communities are detected using a greedy modularity optimization algorithm
-similar to the Louvain method.
+similar to the Louvain method: local node moves, then coarsening communities
+into supernodes and repeating on the smaller graph.
 """
 
 from typing import Dict, List, Set, Tuple, Optional
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+from itertools import repeat
+import hashlib
+import heapq
+import os
+import pickle
 import random
 
 
@@ -23,38 +31,54 @@ class BipartiteGraph:
 
     One partition contains variables, the other contains clauses.
     Edges exist only between variables and clauses.
-    """
-
-    def __init__(self):
-        self.var_nodes: Set[str] = set()  # Variable nodes
-        self.clause_nodes: Set[str] = set()  # Clause nodes (labeled as 'C0', 'C1', etc.)
-        self.edges: Dict[str, Set[str]] = defaultdict(set)  # Adjacency list
-        self.degrees: Dict[str, int] = defaultdict(int)
-        self.total_edges = 0
-
-    def add_variable(self, var: str):
-        """Add a variable node."""
-        self.var_nodes.add(var)
-
-    def add_clause(self, clause_id: str):
-        """Add a clause node."""
-        self.clause_nodes.add(clause_id)
 
-    def add_edge(self, var: str, clause_id: str):
-        """Add an edge between variable and clause."""
-        self.edges[var].add(clause_id)
-        self.edges[clause_id].add(var)
-        self.degrees[var] += 1
-        self.degrees[clause_id] += 1
-        self.total_edges += 1
+    Variables and clauses are integer IDs (clause i is labeled 'C{i}' at the
+    API boundary). Variable -> clause adjacency is stored as contiguous CSR
+    int32 arrays, so neighbors() is an array slice.
+    """
 
-    def neighbors(self, node: str) -> Set[str]:
-        """Get neighbors of a node."""
-        return self.edges.get(node, set())
+    def __init__(self, num_variables: int, clause_var_ids: List[List[int]]):
+        """
+        Build the graph from each clause's variable IDs.
 
-    def get_all_nodes(self) -> Set[str]:
-        """Get all nodes (variables + clauses)."""
-        return self.var_nodes | self.clause_nodes
+        Args:
+            num_variables: Number of variables (IDs 0..num_variables-1)
+            clause_var_ids: Variable IDs of each clause, in clause order
+        """
+        self.num_variables = num_variables
+        self.num_clauses = len(clause_var_ids)
+
+        # Degrees count literal occurrences
+        self.clause_degrees = array('i', [len(var_ids) for var_ids in clause_var_ids])
+        self.var_degrees = array('i', [0]) * num_variables
+        self.total_edges = sum(self.clause_degrees)
+
+        # Pass 1: count distinct clauses per variable
+        counts = [0] * num_variables
+        unique_var_ids = []
+        for var_ids in clause_var_ids:
+            for var_id in var_ids:
+                self.var_degrees[var_id] += 1
+            unique = list(dict.fromkeys(var_ids))
+            unique_var_ids.append(unique)
+            for var_id in unique:
+                counts[var_id] += 1
+
+        self.indptr = array('i', [0]) * (num_variables + 1)
+        for var_id in range(num_variables):
+            self.indptr[var_id + 1] = self.indptr[var_id] + counts[var_id]
+
+        # Pass 2: fill clause IDs (ascending within each variable's row)
+        self.indices = array('i', [0]) * self.indptr[num_variables]
+        fill = list(self.indptr[:num_variables])
+        for clause_idx, unique in enumerate(unique_var_ids):
+            for var_id in unique:
+                self.indices[fill[var_id]] = clause_idx
+                fill[var_id] += 1
+
+    def neighbors(self, var_id: int) -> array:
+        """Get the clause IDs a variable appears in."""
+        return self.indices[self.indptr[var_id]:self.indptr[var_id + 1]]
 
 
 class VariableGraph:
@@ -63,37 +87,378 @@ class VariableGraph:
 
     Two variables are connected if they appear in the same clause.
     Edge weight = number of clauses they share.
+
+    Nodes are integer IDs 0..n-1. Edges are accumulated in a dict keyed by
+    the packed integer (min(u, v) << 32) | max(u, v) while the graph is
+    built, then frozen into CSR (compressed sparse row) adjacency
+    lists by finalize() so the Louvain hot path indexes flat lists instead
+    of hashing variable names.
     """
 
-    def __init__(self):
-        self.nodes: Set[str] = set()
-        self.edges: Dict[Tuple[str, str], int] = {}  # (var1, var2) -> weight
-        self.neighbors: Dict[str, Set[str]] = defaultdict(set)
-        self.degrees: Dict[str, int] = defaultdict(int)
+    def __init__(self, num_nodes: int = 0):
+        self.num_nodes = num_nodes
+        self.edges: Dict[int, int] = {}  # packed (u, v) with u < v -> weight
+        self.degrees: List[int] = [0] * num_nodes
         self.total_edges = 0
 
-    def add_node(self, var: str):
-        """Add a variable node."""
-        self.nodes.add(var)
+        # CSR adjacency: neighbors of u are indices[indptr[u]:indptr[u + 1]]
+        self.indptr: List[int] = [0] * (num_nodes + 1)
+        self.indices: List[int] = []
+        self.weights: List[int] = []
 
-    def add_edge(self, var1: str, var2: str):
+        # COO edge list (each undirected edge once), filled in by finalize()
+        self.edge_src: List[int] = []
+        self.edge_dst: List[int] = []
+        self.edge_weight: List[int] = []
+
+    def add_edge(self, u: int, v: int):
         """Add edge between two variables (increment weight if exists)."""
-        if var1 == var2:
+        if u == v:
             return
 
-        edge_key = tuple(sorted([var1, var2]))
+        edge_key = (u << 32) | v if u < v else (v << 32) | u
 
         if edge_key in self.edges:
             self.edges[edge_key] += 1
         else:
             self.edges[edge_key] = 1
-            self.neighbors[var1].add(var2)
-            self.neighbors[var2].add(var1)
             self.total_edges += 1
 
         # Update degrees (weighted)
-        self.degrees[var1] += 1
-        self.degrees[var2] += 1
+        self.degrees[u] += 1
+        self.degrees[v] += 1
+
+    def add_star(self, nodes: List[int]):
+        """
+        Connect a wide clause's variables through its first two variables.
+
+        Each variable is linked only to the two hubs, so a clause of width k
+        contributes O(k) edges instead of the k(k-1)/2 of a full clique.
+        """
+        hubs = nodes[:2]
+        if len(hubs) == 2:
+            self.add_edge(hubs[0], hubs[1])
+        for node in nodes[2:]:
+            for hub in hubs:
+                self.add_edge(node, hub)
+
+    def aggregate(self, supernode: array, num_supernodes: int) -> 'VariableGraph':
+        """
+        Build the coarsened graph with one supernode per community.
+
+        The weight between two supernodes is the summed weight of the edges
+        between their communities. Weight inside a community acts as a
+        self-loop: it stays in the supernode degree (which is the sum of its
+        members' degrees) but is left out of the adjacency. total_edges is
+        kept so modularity gains stay on the original graph's scale.
+
+        Args:
+            supernode: Supernode (dense community ID) of each node
+            num_supernodes: Number of supernodes
+
+        Returns:
+            Finalized coarsened VariableGraph
+        """
+        coarse = VariableGraph(num_supernodes)
+        coarse.total_edges = self.total_edges
+
+        for node, degree in enumerate(self.degrees):
+            coarse.degrees[supernode[node]] += degree
+
+        edges = coarse.edges
+        for u, v, weight in zip(self.edge_src, self.edge_dst, self.edge_weight):
+            su = supernode[u]
+            sv = supernode[v]
+            if su == sv:
+                continue  # Internal weight (self-loop), already in the degree
+            edge_key = (su << 32) | sv if su < sv else (sv << 32) | su
+            edges[edge_key] = edges.get(edge_key, 0) + weight
+
+        coarse.finalize()
+        return coarse
+
+    def save(self, path: str, fingerprint: str):
+        """
+        Write the finalized graph to disk (written atomically).
+
+        Args:
+            path: File to write
+            fingerprint: Identifies the formula the graph was built from
+        """
+        data = {
+            'fingerprint': fingerprint,
+            'num_nodes': self.num_nodes,
+            'total_edges': self.total_edges,
+        }
+        for name in ('degrees', 'indptr', 'indices', 'weights',
+                     'edge_src', 'edge_dst', 'edge_weight'):
+            data[name] = array('i', getattr(self, name))
+
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, fingerprint: str) -> Optional['VariableGraph']:
+        """
+        Read a graph written by save().
+
+        Only load caches you wrote yourself: the file is unpickled.
+
+        Args:
+            path: File to read
+            fingerprint: Expected formula fingerprint
+
+        Returns:
+            The finalized graph, or None if the file is missing, stale or
+            not a graph cache
+        """
+        try:
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError,
+                AttributeError, ImportError, IndexError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get('fingerprint') != fingerprint:
+            return None
+
+        try:
+            graph = cls(data['num_nodes'])
+            graph.total_edges = data['total_edges']
+            for name in ('degrees', 'indptr', 'indices', 'weights',
+                         'edge_src', 'edge_dst', 'edge_weight'):
+                setattr(graph, name, list(data[name]))
+            graph.edges = {(u << 32) | v: weight for u, v, weight
+                           in zip(graph.edge_src, graph.edge_dst, graph.edge_weight)}
+        except (KeyError, TypeError):
+            return None
+
+        return graph
+
+    def to_arrays(self) -> Tuple:
+        """
+        The finalized graph's counts and arrays, e.g. to send to worker processes.
+
+        Leaves out the edge dict, which community detection does not read.
+        """
+        return (self.num_nodes, self.total_edges, self.degrees, self.indptr, self.indices,
+                self.weights, self.edge_src, self.edge_dst, self.edge_weight)
+
+    @classmethod
+    def from_arrays(cls, arrays: Tuple) -> 'VariableGraph':
+        """Rebuild a finalized graph from to_arrays() (without the edge dict)."""
+        (num_nodes, total_edges, degrees, indptr, indices,
+         weights, edge_src, edge_dst, edge_weight) = arrays
+        graph = cls()
+        graph.num_nodes = num_nodes
+        graph.total_edges = total_edges
+        graph.degrees = degrees
+        graph.indptr = indptr
+        graph.indices = indices
+        graph.weights = weights
+        graph.edge_src = edge_src
+        graph.edge_dst = edge_dst
+        graph.edge_weight = edge_weight
+        return graph
+
+    def finalize(self):
+        """Build the CSR adjacency and COO edge lists from the accumulated edges."""
+        self.edge_src = [key >> 32 for key in self.edges]
+        self.edge_dst = [key & 0xFFFFFFFF for key in self.edges]
+        self.edge_weight = list(self.edges.values())
+
+        counts = [0] * self.num_nodes
+        for u in self.edge_src:
+            counts[u] += 1
+        for v in self.edge_dst:
+            counts[v] += 1
+
+        indptr = [0] * (self.num_nodes + 1)
+        for u in range(self.num_nodes):
+            indptr[u + 1] = indptr[u] + counts[u]
+
+        nnz = indptr[-1]
+        indices = [0] * nnz
+        weights = [0] * nnz
+        fill = indptr[:-1]
+        for u, v, weight in zip(self.edge_src, self.edge_dst, self.edge_weight):
+            k = fill[u]
+            indices[k] = v
+            weights[k] = weight
+            fill[u] = k + 1
+            k = fill[v]
+            indices[k] = u
+            weights[k] = weight
+            fill[v] = k + 1
+
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+
+
+# Graphs with fewer nodes than this always use the sequential local-moving pass
+PARALLEL_MIN_NODES = 10_000
+
+
+def _best_move(node: int, indptr: List[int], indices: List[int], weights: List[int],
+               degrees: List[int], communities: array, comm_degree_sum: List[int], m: int,
+               edges_to_comm: Dict[int, int]) -> int:
+    """
+    Find the neighboring community with the largest positive modularity gain.
+
+    Args:
+        node: Node to evaluate
+        indptr, indices, weights: CSR adjacency of the variable graph
+        degrees: Weighted degree of each node
+        communities: Community of each node
+        comm_degree_sum: Sum of member degrees per community
+        m: Total number of edges
+        edges_to_comm: Scratch dict, cleared and reused by the caller's loop
+
+    Returns:
+        Best community for the node (its current one if no move helps)
+    """
+    current_community = communities[node]
+    best_community = current_community
+    best_delta = 0.0
+
+    # Weighted edges from node to each neighboring community,
+    # accumulated in a single pass over its adjacency row
+    edges_to_comm.clear()
+    for k in range(indptr[node], indptr[node + 1]):
+        neighbor_community = communities[indices[k]]
+        edges_to_comm[neighbor_community] = edges_to_comm.get(neighbor_community, 0) + weights[k]
+
+    k_i = degrees[node]
+    edges_to_old = edges_to_comm.get(current_community, 0)
+    sum_old = comm_degree_sum[current_community]
+
+    # Try moving to each neighbor community
+    for target_community, edges_to_new in edges_to_comm.items():
+        if target_community == current_community:
+            continue
+
+        # Same formula as CommunityDetector._modularity_delta
+        delta_Q = (edges_to_new - edges_to_old) / m
+        delta_Q += k_i * (sum_old - comm_degree_sum[target_community] - k_i) / (2.0 * m * m)
+
+        if delta_Q > best_delta:
+            best_delta = delta_Q
+            best_community = target_community
+
+    return best_community
+
+
+def _local_moving_pass(order: List[int], indptr: List[int], indices: List[int],
+                       weights: List[int], degrees: List[int], communities: array,
+                       comm_degree_sum: List[int], m: int) -> int:
+    """
+    One Louvain local-moving sweep over the nodes in the given order.
+
+    Each node moves to the neighboring community with the largest positive
+    modularity gain. Works only on flat integer lists (CSR adjacency plus
+    per-node and per-community arrays), which are updated in place.
+
+    Args:
+        order: Node visiting order
+        indptr, indices, weights: CSR adjacency of the variable graph
+        degrees: Weighted degree of each node
+        communities: Community of each node (updated in place)
+        comm_degree_sum: Sum of member degrees per community (updated in place)
+        m: Total number of edges
+
+    Returns:
+        Number of nodes moved
+    """
+    moves = 0
+    edges_to_comm: Dict[int, int] = {}  # scratch accumulator, reused across nodes
+
+    for node in order:
+        current_community = communities[node]
+        best_community = _best_move(node, indptr, indices, weights, degrees,
+                                    communities, comm_degree_sum, m, edges_to_comm)
+
+        # Make the best move if it improves modularity
+        if best_community != current_community:
+            k_i = degrees[node]
+            communities[node] = best_community
+            comm_degree_sum[current_community] -= k_i
+            comm_degree_sum[best_community] += k_i
+            moves += 1
+
+    return moves
+
+
+# Read-only graph arrays installed in each parallel local-moving worker process
+_worker_graph: Optional[Tuple[List[int], List[int], List[int], List[int], int]] = None
+
+
+def _init_move_worker(indptr: List[int], indices: List[int], weights: List[int],
+                      degrees: List[int], m: int):
+    """Install the variable graph in a worker process (ProcessPoolExecutor initializer)."""
+    global _worker_graph
+    _worker_graph = (indptr, indices, weights, degrees, m)
+
+
+def _propose_moves(nodes: List[int], communities: array,
+                   comm_degree_sum: List[int]) -> List[Tuple[int, int]]:
+    """
+    Propose moves for a batch of nodes against a snapshot of the communities.
+
+    Runs in a worker process; nothing is applied here. The caller commits the
+    proposals serially, re-checking each against the live state.
+
+    Returns:
+        List of (node, target_community) pairs for nodes that want to move
+    """
+    indptr, indices, weights, degrees, m = _worker_graph
+    edges_to_comm: Dict[int, int] = {}
+    proposals = []
+    for node in nodes:
+        best_community = _best_move(node, indptr, indices, weights, degrees,
+                                    communities, comm_degree_sum, m, edges_to_comm)
+        if best_community != communities[node]:
+            proposals.append((node, best_community))
+    return proposals
+
+
+def _detection_attempt(graph: 'VariableGraph', seed: int,
+                       min_communities: int, max_communities: int) -> Tuple:
+    """
+    One seeded detection run on graph.
+
+    Runs on a bare detector that holds only the (read-only) variable graph
+    and its own partition state, so nothing formula-related is copied or
+    sent to worker processes.
+
+    Returns:
+        (modularity, communities, num_communities, community_members, comm_degree_sum)
+    """
+    attempt = CommunityDetector.__new__(CommunityDetector)
+    attempt.var_graph = graph
+    attempt.rng = random.Random(seed)
+    attempt.num_workers = 1  # Attempts are the unit of parallelism
+    attempt._merge_heap = None
+    attempt._detect_once(min_communities, max_communities)
+    return (attempt._compute_modularity(), attempt.communities, attempt.num_communities,
+            attempt.community_members, attempt.comm_degree_sum)
+
+
+# Variable graph installed in each detection-attempt worker process
+_worker_attempt_graph: Optional['VariableGraph'] = None
+
+
+def _init_attempt_worker(graph_arrays: Tuple):
+    """Rebuild the variable graph in a worker process (ProcessPoolExecutor initializer)."""
+    global _worker_attempt_graph
+    _worker_attempt_graph = VariableGraph.from_arrays(graph_arrays)
+
+
+def _pooled_detection_attempt(seed: int, min_communities: int, max_communities: int) -> Tuple:
+    """_detection_attempt on the worker's installed graph."""
+    return _detection_attempt(_worker_attempt_graph, seed, min_communities, max_communities)
 
 
 class CommunityDetector:
@@ -116,45 +481,116 @@ class CommunityDetector:
     - δ(c_i, c_j) = 1 if c_i == c_j else 0
     """
 
-    def __init__(self, cnf):
+    def __init__(self, cnf, max_clause_width: int = 20, seed: Optional[int] = None,
+                 num_workers: int = 1, cache_dir: Optional[str] = None,
+                 num_attempts: int = 1):
         """
         Initialize community detector with a CNF formula.
 
         Args:
             cnf: CNFExpression to analyze
+            max_clause_width: Clauses wider than this are projected as a star
+                instead of a clique (default 20)
+            seed: Random seed for the node visiting order (default None, drawn
+                from the global random module so random.seed() controls it)
+            num_workers: Worker processes for the local-moving phase; only used
+                on graphs with at least PARALLEL_MIN_NODES variables (default 1)
+            cache_dir: Directory for caching the projected variable graph across
+                runs on the same formula (default None, no caching)
+            num_attempts: Independent detection runs with different node orders;
+                the partition with the highest modularity is kept. With
+                num_workers > 1 the runs go to worker processes (default 1)
         """
         self.cnf = cnf
-        self.graph = BipartiteGraph()  # Keep for interface detection
-        self.var_graph = VariableGraph()  # NEW: projected variable graph
-        self.communities: Dict[str, int] = {}  # node -> community_id
-        self.community_members: Dict[int, Set[str]] = defaultdict(set)  # community_id -> nodes
+        self.max_clause_width = max_clause_width
+        self.num_workers = num_workers
+        self.num_attempts = num_attempts
+        self.cache_dir = cache_dir
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.rng = random.Random(seed)
+
+        # Variables are remapped to contiguous integer IDs for the hot path
+        self.var_names: List[str] = sorted(cnf.get_variables())
+        self.var_id: Dict[str, int] = {var: i for i, var in enumerate(self.var_names)}
+
+        self.var_graph = VariableGraph(len(self.var_names))  # NEW: projected variable graph
+        self.clause_var_ids: List[List[int]] = []  # clause index -> variable IDs
+        self.communities = array('i')  # var_id -> community_id (flat int32 array)
+        self.num_communities = 0
+        self.community_members: Dict[int, Set[int]] = defaultdict(set)  # community_id -> var_ids
+        self.comm_degree_sum: List[int] = []  # community_id -> sum of member degrees
+        self._merge_heap: Optional[List[Tuple[int, int]]] = None  # (size, community_id)
+
+        # (min_communities, max_communities) of the last detect_communities()
+        # run, None before the first; lets solvers sharing this detector
+        # reuse its partition
+        self.detected_bounds: Optional[Tuple[int, int]] = None
+
+        # Derived views of the assignment, rebuilt lazily after it changes
+        self._var_comm_cache: Optional[Dict[str, int]] = None
+        self._clause_comm_ids_cache: Optional[List[int]] = None
+        self._clause_comm_cache: Optional[Dict[str, int]] = None
+        self._interface_cache: Optional[Set[str]] = None
+        self._modularity_cache: Optional[float] = None
+
         self._build_graph()
 
     def _build_graph(self):
         """Build bipartite graph AND projected variable graph from CNF formula."""
-        # Add all variables
-        variables = sorted(self.cnf.get_variables())
-        for var in variables:
-            self.graph.add_variable(var)
-            self.var_graph.add_node(var)
-
-        # Add clauses and edges
-        for idx, clause in enumerate(self.cnf.clauses):
-            clause_id = f"C{idx}"
-            self.graph.add_clause(clause_id)
+        for clause in self.cnf.clauses:
+            # Get variables in this clause; also used for the bipartite graph
+            # and clause-community assignment
+            var_ids = [self.var_id[lit.variable] for lit in clause.literals]
+            self.clause_var_ids.append(var_ids)
+
+        # Projected graph: reuse a cached copy for the same formula if possible
+        if self.cache_dir is None:
+            self._project_clauses()
+        else:
+            fingerprint = self._graph_fingerprint()
+            cache_path = os.path.join(self.cache_dir, f"cobd_graph_{fingerprint[:16]}.pkl")
+            cached_graph = VariableGraph.load(cache_path, fingerprint)
+            if cached_graph is not None:
+                self.var_graph = cached_graph
+            else:
+                self._project_clauses()
+                os.makedirs(self.cache_dir, exist_ok=True)
+                self.var_graph.save(cache_path, fingerprint)
+
+        # Connect clauses to their variables (bipartite graph)
+        self.graph = BipartiteGraph(len(self.var_names), self.clause_var_ids)  # Keep for interface detection
+
+    def _project_clauses(self):
+        """Build the projected variable graph from the clause variable IDs."""
+        for var_ids in self.clause_var_ids:
+            # Connect variables to each other (projected graph)
+            # Two variables are connected if they appear in the same clause
+            if len(var_ids) > self.max_clause_width:
+                # Wide clause (e.g. cardinality encoding): avoid O(k^2) clique
+                self.var_graph.add_star(var_ids)
+                continue
+            for i in range(len(var_ids)):
+                for j in range(i + 1, len(var_ids)):
+                    self.var_graph.add_edge(var_ids[i], var_ids[j])
 
-            # Get variables in this clause
-            clause_vars = [lit.variable for lit in clause.literals]
+        self.var_graph.finalize()
 
-            # Connect clause to its variables (bipartite graph)
-            for var in clause_vars:
-                self.graph.add_edge(var, clause_id)
+    def _graph_fingerprint(self) -> str:
+        """
+        Hash everything the projected graph depends on.
 
-            # Connect variables to each other (projected graph)
-            # Two variables are connected if they appear in the same clause
-            for i in range(len(clause_vars)):
-                for j in range(i + 1, len(clause_vars)):
-                    self.var_graph.add_edge(clause_vars[i], clause_vars[j])
+        Covers the variable names, every clause's variable IDs and
+        max_clause_width, so any change to the formula's structure gives a
+        new fingerprint.
+        """
+        h = hashlib.sha256()
+        h.update(f"w={self.max_clause_width};n={len(self.var_names)};".encode())
+        h.update("\0".join(self.var_names).encode())
+        for var_ids in self.clause_var_ids:
+            h.update(array('i', var_ids).tobytes())
+            h.update(b"|")
+        return h.hexdigest()
 
     def detect_communities(self, min_communities: int = 2, max_communities: int = 10) -> Dict[str, int]:
         """
@@ -170,65 +606,201 @@ class CommunityDetector:
         Returns:
             Dictionary mapping variable names to community IDs
         """
-        # Initialize: each VARIABLE in its own community
-        nodes = list(self.var_graph.nodes)
-        self.communities = {node: i for i, node in enumerate(nodes)}
-        self.community_members = {i: {node} for i, node in enumerate(nodes)}
-
-        current_modularity = self._compute_modularity()
-        improved = True
-        iteration = 0
-        max_iterations = 100
-
-        while improved and iteration < max_iterations:
-            improved = False
-            iteration += 1
-
-            # Try moving each node to neighboring communities
-            random.shuffle(nodes)  # Random order for fairness
-
-            for node in nodes:
-                current_community = self.communities[node]
-                best_community = current_community
-                best_modularity = current_modularity
+        if self.num_attempts > 1:
+            self._detect_best_of_attempts(min_communities, max_communities)
+        else:
+            self._detect_once(min_communities, max_communities)
 
-                # Find neighboring communities (from variable graph)
-                neighbor_communities = set()
-                for neighbor in self.var_graph.neighbors.get(node, set()):
-                    neighbor_communities.add(self.communities[neighbor])
+        self.detected_bounds = (min_communities, max_communities)
+        return self.get_variable_communities()
 
-                # Try moving to each neighbor community
-                for target_community in neighbor_communities:
-                    if target_community == current_community:
-                        continue
+    def _detect_best_of_attempts(self, min_communities: int, max_communities: int):
+        """
+        Run num_attempts detections and keep the highest-modularity partition.
 
-                    # Try the move
-                    delta_Q = self._modularity_delta(node, current_community, target_community)
-                    new_modularity = current_modularity + delta_Q
+        Greedy modularity optimization depends on the node visiting order, so
+        a single run can settle on a poor partition. Each attempt gets its own
+        seed drawn from self.rng; ties go to the earliest attempt.
+        """
+        seeds = [self.rng.getrandbits(32) for _ in range(self.num_attempts)]
+
+        graph = self.var_graph
+        if self.num_workers > 1 and graph.num_nodes >= PARALLEL_MIN_NODES:
+            # Workers get the graph arrays once, then only a seed per attempt
+            max_workers = min(self.num_workers, len(seeds))
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_attempt_worker,
+                                     initargs=(graph.to_arrays(),)) as executor:
+                partitions = list(executor.map(_pooled_detection_attempt, seeds,
+                                               repeat(min_communities), repeat(max_communities)))
+        else:
+            partitions = [_detection_attempt(graph, seed, min_communities, max_communities)
+                          for seed in seeds]
 
-                    if new_modularity > best_modularity:
-                        best_modularity = new_modularity
-                        best_community = target_community
+        best = max(partitions, key=lambda partition: partition[0])
+        _, self.communities, self.num_communities, self.community_members, self.comm_degree_sum = best
+        self._merge_heap = None
+        self._invalidate_caches()
 
-                # Make the best move if it improves modularity
-                if best_community != current_community:
-                    self._move_node(node, current_community, best_community)
-                    current_modularity = best_modularity
-                    improved = True
+    def _detect_once(self, min_communities: int, max_communities: int):
+        """One detection run (see detect_communities), using self.rng for node order."""
+        # Initialize: each VARIABLE in its own community
+        nodes = list(range(self.var_graph.num_nodes))
+        self.communities = array('i', nodes)
+        self.community_members = {i: {i} for i in nodes}
+        self.comm_degree_sum = list(self.var_graph.degrees)
+        self._invalidate_caches()
+
+        graph = self.var_graph
+
+        # Only modularity deltas are needed to pick moves; the absolute value
+        # is computed on demand by get_statistics(). Skip local moving when
+        # no move is possible (no projected edges, e.g. only unit clauses).
+        improved = graph.total_edges > 0 and len(nodes) > 1
+
+        # Random order for fairness, drawn once and reused by every pass
+        if improved:
+            self.rng.shuffle(nodes)
+
+        executor = None
+        if improved and self.num_workers > 1 and graph.num_nodes >= PARALLEL_MIN_NODES:
+            executor = ProcessPoolExecutor(
+                max_workers=self.num_workers, initializer=_init_move_worker,
+                initargs=(graph.indptr, graph.indices, graph.weights,
+                          graph.degrees, graph.total_edges))
+
+        moved = False
+        try:
+            if improved:
+                moved = self._optimize_level(graph, self.communities, self.comm_degree_sum,
+                                             nodes, executor) > 0
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        # Coarsening (multi-level Louvain): while local moving still changes
+        # something, collapse each community into a supernode and repeat on
+        # the smaller graph. node_of_var maps each variable to its node in the
+        # current level graph (identity at level 0).
+        level_graph = graph
+        level_communities = self.communities
+        level_degree_sum = self.comm_degree_sum
+        node_of_var = None
+
+        while moved:
+            community_ids = sorted(set(level_communities))
+            if len(community_ids) == level_graph.num_nodes:
+                break  # Nothing merged at this level
+
+            dense_id = {old_id: new_id for new_id, old_id in enumerate(community_ids)}
+            supernode = array('i', [dense_id[comm_id] for comm_id in level_communities])
+            if node_of_var is None:
+                node_of_var = supernode
+            else:
+                node_of_var = array('i', [supernode[node] for node in node_of_var])
+
+            level_graph = level_graph.aggregate(supernode, len(community_ids))
+            level_communities = array('i', range(level_graph.num_nodes))
+            level_degree_sum = list(level_graph.degrees)
+
+            order = list(range(level_graph.num_nodes))
+            self.rng.shuffle(order)
+            moved = self._optimize_level(level_graph, level_communities, level_degree_sum,
+                                         order, None) > 0
+
+        # Project the coarsest level's communities back onto the variables
+        if node_of_var is not None:
+            self.communities = array('i', [level_communities[node] for node in node_of_var])
+            self.comm_degree_sum = level_degree_sum
+
+        # Rebuild member sets once instead of updating them on every move
+        self.community_members = defaultdict(set)
+        for node, comm_id in enumerate(self.communities):
+            self.community_members[comm_id].add(node)
 
         # Compact community IDs (remove empty communities)
         self._compact_communities()
 
         # If too many communities, merge smallest ones
-        while len(self.community_members) > max_communities:
+        while self.num_communities > max_communities:
             self._merge_smallest_communities()
 
         # If too few communities and possible to split, split largest
-        while len(self.community_members) < min_communities:
+        while self.num_communities < min_communities:
             if not self._split_largest_community():
                 break  # Can't split further
 
-        return self.communities
+    def _optimize_level(self, graph: VariableGraph, communities: array,
+                        comm_degree_sum: List[int], order: List[int],
+                        executor: Optional[ProcessPoolExecutor]) -> int:
+        """
+        Run local-moving passes on one level until no node moves.
+
+        Args:
+            graph: Graph of this level (the variable graph or a coarsened one)
+            communities: Community of each node of graph (updated in place)
+            comm_degree_sum: Sum of member degrees per community (updated in place)
+            order: Node visiting order, reused by every pass
+            executor: Worker pool for the variable graph level, or None
+
+        Returns:
+            Total number of moves made
+        """
+        total_moves = 0
+        iteration = 0
+        max_iterations = 100
+
+        while iteration < max_iterations:
+            iteration += 1
+
+            # Try moving each node to neighboring communities
+            if executor is not None:
+                moves = self._parallel_local_moving_pass(executor, order)
+            else:
+                moves = _local_moving_pass(order, graph.indptr, graph.indices, graph.weights,
+                                           graph.degrees, communities, comm_degree_sum,
+                                           graph.total_edges)
+            total_moves += moves
+            if moves == 0:
+                break
+
+        return total_moves
+
+    def _parallel_local_moving_pass(self, executor: ProcessPoolExecutor,
+                                    order: List[int]) -> int:
+        """
+        Local-moving sweep with move evaluation spread over worker processes.
+
+        The node order is split into one batch per worker. Each worker proposes
+        moves against the same snapshot of the communities; the proposals are
+        then committed serially, and each is re-checked against the current
+        state so that only moves that still increase modularity are applied.
+
+        Args:
+            executor: Pool whose workers were set up with _init_move_worker
+            order: Node visiting order
+
+        Returns:
+            Number of nodes moved
+        """
+        batch_size = -(-len(order) // self.num_workers)
+        futures = [executor.submit(_propose_moves, order[start:start + batch_size],
+                                   self.communities, self.comm_degree_sum)
+                   for start in range(0, len(order), batch_size)]
+
+        degrees = self.var_graph.degrees
+        moves = 0
+        for future in futures:
+            for node, target_community in future.result():
+                current_community = self.communities[node]
+                if target_community == current_community:
+                    continue
+                if self._modularity_delta(node, current_community, target_community) > 0:
+                    k_i = degrees[node]
+                    self.communities[node] = target_community
+                    self.comm_degree_sum[current_community] -= k_i
+                    self.comm_degree_sum[target_community] += k_i
+                    moves += 1
+        return moves
 
     def _compute_modularity(self) -> float:
         """
@@ -237,25 +809,35 @@ class CommunityDetector:
         FIXED: Uses projected variable graph for correct modularity!
 
         Q = 1/(2m) * Σ[A_ij - k_i*k_j/(2m)] * δ(c_i, c_j)
+
+        The value is cached until the community assignment changes.
         """
+        if self._modularity_cache is not None:
+            return self._modularity_cache
+
         if self.var_graph.total_edges == 0:
             return 0.0
 
         m = self.var_graph.total_edges
-        Q = 0.0
-
-        # Sum over all edges in variable graph
-        for (node_i, node_j), weight in self.var_graph.edges.items():
+        communities = self.communities
+        degrees = self.var_graph.degrees
+
+        # Sum over all edges in variable graph, accumulating the internal
+        # weight and degree products as exact integers in one pass
+        internal_weight = 0
+        degree_products = 0
+        for node_i, node_j, weight in zip(self.var_graph.edge_src,
+                                          self.var_graph.edge_dst,
+                                          self.var_graph.edge_weight):
             # Check if same community
-            if self.communities[node_i] == self.communities[node_j]:
-                k_i = self.var_graph.degrees[node_i]
-                k_j = self.var_graph.degrees[node_j]
-                # Weighted contribution
-                Q += weight - (k_i * k_j) / (2.0 * m)
+            if communities[node_i] == communities[node_j]:
+                internal_weight += weight
+                degree_products += degrees[node_i] * degrees[node_j]
 
-        return Q / (2.0 * m)
+        self._modularity_cache = (internal_weight - degree_products / (2.0 * m)) / (2.0 * m)
+        return self._modularity_cache
 
-    def _modularity_delta(self, node: str, old_community: int, new_community: int) -> float:
+    def _modularity_delta(self, node: int, old_community: int, new_community: int) -> float:
         """
         Compute change in modularity if node moves from old to new community.
 
@@ -268,25 +850,24 @@ class CommunityDetector:
         if m == 0:
             return 0.0
 
-        k_i = self.var_graph.degrees.get(node, 0)
+        k_i = self.var_graph.degrees[node]
 
-        # Sum of degrees in old and new communities
-        sum_old = sum(self.var_graph.degrees.get(n, 0) for n in self.community_members[old_community])
-        sum_new = sum(self.var_graph.degrees.get(n, 0) for n in self.community_members[new_community])
+        # Sum of degrees in old and new communities (maintained incrementally)
+        sum_old = self.comm_degree_sum[old_community]
+        sum_new = self.comm_degree_sum[new_community]
 
-        # Weighted edges from node to old community
+        # Weighted edges from node to old and new communities (CSR scan)
+        indices = self.var_graph.indices
+        weights = self.var_graph.weights
+        communities = self.communities
         edges_to_old = 0
-        for neighbor in self.var_graph.neighbors.get(node, set()):
-            if self.communities[neighbor] == old_community and neighbor != node:
-                edge_key = tuple(sorted([node, neighbor]))
-                edges_to_old += self.var_graph.edges.get(edge_key, 0)
-
-        # Weighted edges from node to new community
         edges_to_new = 0
-        for neighbor in self.var_graph.neighbors.get(node, set()):
-            if self.communities[neighbor] == new_community:
-                edge_key = tuple(sorted([node, neighbor]))
-                edges_to_new += self.var_graph.edges.get(edge_key, 0)
+        for k in range(self.var_graph.indptr[node], self.var_graph.indptr[node + 1]):
+            neighbor_community = communities[indices[k]]
+            if neighbor_community == old_community:
+                edges_to_old += weights[k]
+            elif neighbor_community == new_community:
+                edges_to_new += weights[k]
 
         # Modularity change (simplified formula with weights)
         delta_Q = (edges_to_new - edges_to_old) / m
@@ -294,12 +875,6 @@ class CommunityDetector:
 
         return delta_Q
 
-    def _move_node(self, node: str, old_community: int, new_community: int):
-        """Move node from old community to new community."""
-        self.community_members[old_community].remove(node)
-        self.community_members[new_community].add(node)
-        self.communities[node] = new_community
-
     def _compact_communities(self):
         """Remove empty communities and renumber sequentially."""
         # Find non-empty communities
@@ -308,9 +883,9 @@ class CommunityDetector:
         # Create new mapping
         new_id_map = {old_id: new_id for new_id, old_id in enumerate(non_empty)}
 
-        # Update communities
-        self.communities = {node: new_id_map[old_id]
-                           for node, old_id in self.communities.items()}
+        # Update communities; the community count is fixed from here on
+        self.communities = array('i', [new_id_map[old_id] for old_id in self.communities])
+        self.num_communities = len(non_empty)
 
         # Update community members
         new_members = defaultdict(set)
@@ -319,22 +894,46 @@ class CommunityDetector:
                 new_members[new_id_map[old_id]] = members
         self.community_members = new_members
 
+        # Rebuild community degree sums for the new IDs
+        self.comm_degree_sum = [self.comm_degree_sum[old_id] for old_id in non_empty]
+        self._merge_heap = None
+        self._invalidate_caches()
+
     def _merge_smallest_communities(self):
         """Merge the two smallest communities."""
         if len(self.community_members) < 2:
             return
 
-        # Find two smallest communities
-        sizes = [(cid, len(members)) for cid, members in self.community_members.items()]
-        sizes.sort(key=lambda x: x[1])
+        # Size heap is built once and kept across calls; entries for merged
+        # communities or outdated sizes are skipped lazily when popped
+        if self._merge_heap is None:
+            self._merge_heap = [(len(members), cid)
+                                for cid, members in self.community_members.items()]
+            heapq.heapify(self._merge_heap)
 
-        comm1, comm2 = sizes[0][0], sizes[1][0]
+        # Find two smallest communities
+        comm1 = self._pop_smallest_community()
+        comm2 = self._pop_smallest_community()
 
         # Merge comm2 into comm1
         for node in self.community_members[comm2]:
             self.communities[node] = comm1
         self.community_members[comm1].update(self.community_members[comm2])
         del self.community_members[comm2]
+        heapq.heappush(self._merge_heap, (len(self.community_members[comm1]), comm1))
+
+        self.comm_degree_sum[comm1] += self.comm_degree_sum[comm2]
+        self.comm_degree_sum[comm2] = 0
+        self.num_communities -= 1
+        self._invalidate_caches()
+
+    def _pop_smallest_community(self) -> int:
+        """Pop the smallest live community from the merge heap."""
+        while True:
+            size, cid = heapq.heappop(self._merge_heap)
+            members = self.community_members.get(cid)
+            if members is not None and len(members) == size:
+                return cid
 
     def _split_largest_community(self) -> bool:
         """
@@ -365,8 +964,25 @@ class CommunityDetector:
         self.community_members[new_id] = set(members[mid:])
         self.community_members[largest_id] = set(members[:mid])
 
+        moved_degree = sum(self.var_graph.degrees[node] for node in members[mid:])
+        if new_id == len(self.comm_degree_sum):
+            self.comm_degree_sum.append(0)
+        self.comm_degree_sum[new_id] = moved_degree
+        self.comm_degree_sum[largest_id] -= moved_degree
+        self.num_communities += 1
+        self._merge_heap = None
+        self._invalidate_caches()
+
         return True
 
+    def _invalidate_caches(self):
+        """Drop the cached community views after the assignment changes."""
+        self._var_comm_cache = None
+        self._clause_comm_ids_cache = None
+        self._clause_comm_cache = None
+        self._interface_cache = None
+        self._modularity_cache = None
+
     def get_variable_communities(self) -> Dict[str, int]:
         """
         Get community assignments for variables.
@@ -374,8 +990,7 @@ class CommunityDetector:
         Returns:
             Dictionary mapping variable names to community IDs
         """
-        # Since we only work with variables now, return all communities
-        return dict(self.communities)
+        return dict(self._variable_communities())
 
     def get_clause_communities(self) -> Dict[str, int]:
         """
@@ -386,24 +1001,7 @@ class CommunityDetector:
         Returns:
             Dictionary mapping clause IDs to community IDs
         """
-        clause_communities = {}
-
-        for idx, clause in enumerate(self.cnf.clauses):
-            clause_id = f"C{idx}"
-            clause_vars = [lit.variable for lit in clause.literals]
-
-            # Count which communities the clause's variables belong to
-            community_counts = defaultdict(int)
-            for var in clause_vars:
-                if var in self.communities:
-                    community_counts[self.communities[var]] += 1
-
-            # Assign clause to community with most variables
-            if community_counts:
-                best_community = max(community_counts.items(), key=lambda x: x[1])[0]
-                clause_communities[clause_id] = best_community
-
-        return clause_communities
+        return dict(self._clause_communities())
 
     def identify_interface_variables(self) -> Set[str]:
         """
@@ -414,23 +1012,66 @@ class CommunityDetector:
         Returns:
             Set of interface variable names
         """
-        interface_vars = set()
-        var_communities = self.get_variable_communities()
-        clause_communities = self.get_clause_communities()
+        return set(self._interface_variables())
+
+    def _variable_communities(self) -> Dict[str, int]:
+        """Cached variable name -> community mapping (do not mutate)."""
+        if self._var_comm_cache is None:
+            # Since we only work with variables now, return all communities
+            self._var_comm_cache = {self.var_names[i]: comm_id
+                                    for i, comm_id in enumerate(self.communities)}
+        return self._var_comm_cache
+
+    def _clause_community_ids(self) -> List[int]:
+        """Cached clause index -> community list, -1 for empty clauses (do not mutate)."""
+        if self._clause_comm_ids_cache is not None:
+            return self._clause_comm_ids_cache
 
-        for var in self.graph.var_nodes:
-            var_community = var_communities[var]
+        clause_comm_ids = [-1] * len(self.clause_var_ids)
+        communities = self.communities
 
+        for idx, var_ids in enumerate(self.clause_var_ids):
+            if not var_ids:
+                continue
+
+            # Count which communities the clause's variables belong to
+            community_counts: Dict[int, int] = {}
+            for var_id in var_ids:
+                comm_id = communities[var_id]
+                community_counts[comm_id] = community_counts.get(comm_id, 0) + 1
+
+            # Assign clause to community with most variables (first seen wins ties)
+            clause_comm_ids[idx] = max(community_counts, key=community_counts.get)
+
+        self._clause_comm_ids_cache = clause_comm_ids
+        return clause_comm_ids
+
+    def _clause_communities(self) -> Dict[str, int]:
+        """Cached clause ID -> community mapping (do not mutate)."""
+        if self._clause_comm_cache is None:
+            self._clause_comm_cache = {f"C{idx}": comm_id
+                                       for idx, comm_id in enumerate(self._clause_community_ids())
+                                       if comm_id >= 0}
+        return self._clause_comm_cache
+
+    def _interface_variables(self) -> Set[str]:
+        """Cached set of interface variables (do not mutate)."""
+        if self._interface_cache is not None:
+            return self._interface_cache
+
+        interface_vars = set()
+        clause_comm_ids = self._clause_community_ids()
+
+        for var_id in range(self.graph.num_variables):
             # Check clauses this variable appears in
-            communities_seen = set()
-            for neighbor in self.graph.neighbors(var):
-                if neighbor in clause_communities:
-                    communities_seen.add(clause_communities[neighbor])
+            communities_seen = {clause_comm_ids[clause_idx]
+                                for clause_idx in self.graph.neighbors(var_id)}
 
             # If variable connects to clauses in multiple communities, it's an interface
             if len(communities_seen) > 1:
-                interface_vars.add(var)
+                interface_vars.add(self.var_names[var_id])
 
+        self._interface_cache = interface_vars
         return interface_vars
 
     def get_statistics(self) -> Dict:
@@ -440,29 +1081,23 @@ class CommunityDetector:
         Returns:
             Dictionary with community statistics
         """
-        var_communities = self.get_variable_communities()
-        clause_communities = self.get_clause_communities()
-        interface_vars = self.identify_interface_variables()
-
-        # Count variables per community
-        vars_per_community = defaultdict(int)
-        for var, comm_id in var_communities.items():
-            vars_per_community[comm_id] += 1
+        clause_communities = self._clause_communities()
+        interface_vars = self._interface_variables()
 
-        # Count clauses per community
-        clauses_per_community = defaultdict(int)
-        for clause, comm_id in clause_communities.items():
-            clauses_per_community[comm_id] += 1
+        # Count variables and clauses per community straight off the id
+        # sequences (Counter keeps first-seen order, like the old loops)
+        vars_per_community = Counter(self.communities)
+        clauses_per_community = Counter(clause_communities.values())
 
         modularity = self._compute_modularity()
 
         return {
-            'num_communities': len(self.community_members),
+            'num_communities': self.num_communities,
             'modularity': modularity,
-            'num_variables': len(self.graph.var_nodes),
-            'num_clauses': len(self.graph.clause_nodes),
+            'num_variables': self.graph.num_variables,
+            'num_clauses': self.graph.num_clauses,
             'num_interface_variables': len(interface_vars),
-            'interface_percentage': 100.0 * len(interface_vars) / len(self.graph.var_nodes) if self.graph.var_nodes else 0,
+            'interface_percentage': 100.0 * len(interface_vars) / self.graph.num_variables if self.graph.num_variables else 0,
             'vars_per_community': dict(vars_per_community),
             'clauses_per_community': dict(clauses_per_community),
             'average_vars_per_community': sum(vars_per_community.values()) / len(vars_per_community) if vars_per_community else 0,
@@ -479,40 +1114,38 @@ class CommunityDetector:
         nodes = []
 
         # Add variable nodes
-        var_communities = self.get_variable_communities()
-        interface_vars = self.identify_interface_variables()
-        for var in self.graph.var_nodes:
+        var_communities = self._variable_communities()
+        interface_vars = self._interface_variables()
+        for var_id, var in enumerate(self.var_names):
             nodes.append({
                 'id': var,
                 'type': 'variable',
                 'community': var_communities[var],
                 'is_interface': var in interface_vars,
-                'degree': self.graph.degrees[var]
+                'degree': self.graph.var_degrees[var_id]
             })
 
         # Add clause nodes
-        clause_communities = self.get_clause_communities()
-        for clause_id in self.graph.clause_nodes:
+        clause_communities = self._clause_communities()
+        for clause_idx in range(self.graph.num_clauses):
+            clause_id = f"C{clause_idx}"
             nodes.append({
                 'id': clause_id,
                 'type': 'clause',
                 'community': clause_communities[clause_id],
                 'is_interface': False,
-                'degree': self.graph.degrees[clause_id]
+                'degree': self.graph.clause_degrees[clause_idx]
             })
 
-        # Add edges
+        # Add edges (bipartite, so listing each variable's clauses visits
+        # every edge exactly once)
         edges = []
-        processed = set()
-        for node_i in self.graph.get_all_nodes():
-            for node_j in self.graph.neighbors(node_i):
-                edge_key = tuple(sorted([node_i, node_j]))
-                if edge_key not in processed:
-                    edges.append({
-                        'source': node_i,
-                        'target': node_j
-                    })
-                    processed.add(edge_key)
+        for var_id, var in enumerate(self.var_names):
+            for clause_idx in self.graph.neighbors(var_id):
+                edges.append({
+                    'source': var,
+                    'target': f"C{clause_idx}"
+                })
 
         return {
             'nodes': nodes,
@@ -13,6 +13,7 @@ Key Concepts:
 
 from typing import Dict, List, Set, Tuple, Optional
 from collections import defaultdict
+from array import array
 import sys
 import os
 
@@ -28,9 +29,25 @@ class Message:
 
     A message contains information about which values of interface variables
     are compatible with a community being satisfiable.
+
+    The beliefs live in a pair of shared float arrays so that a
+    MessagePasser can aggregate them without touching each message;
+    a message created on its own gets a private one-slot pair.
     """
 
-    def __init__(self, from_community: int, to_community: int, variable: str):
+    __slots__ = ('from_community', 'to_community', 'variable',
+                 '_beliefs_true', '_beliefs_false', '_index')
+
+    # (true_compatible, false_compatible) -> (belief_true, belief_false)
+    _BELIEF_TABLE = {
+        (True, False): (1.0, 0.0),
+        (False, True): (0.0, 1.0),
+        (True, True): (0.5, 0.5),
+        (False, False): (0.0, 0.0),  # Neither compatible - conflict!
+    }
+
+    def __init__(self, from_community: int, to_community: int, variable: str,
+                 beliefs: Optional[Tuple[array, array]] = None, index: int = 0):
         """
         Initialize a message.
 
@@ -38,13 +55,33 @@ class Message:
             from_community: Source community ID
             to_community: Target community ID
             variable: Interface variable this message is about
+            beliefs: Shared (belief_true, belief_false) arrays, or None
+            index: Slot of this message in the shared arrays
         """
         self.from_community = from_community
         self.to_community = to_community
         self.variable = variable
         # Beliefs: probability that variable=True is compatible
-        self.belief_true = 0.5  # Initially neutral
-        self.belief_false = 0.5
+        if beliefs is None:
+            beliefs = (array('d', [0.5]), array('d', [0.5]))  # Initially neutral
+        self._beliefs_true, self._beliefs_false = beliefs
+        self._index = index
+
+    @property
+    def belief_true(self) -> float:
+        return self._beliefs_true[self._index]
+
+    @belief_true.setter
+    def belief_true(self, value: float):
+        self._beliefs_true[self._index] = value
+
+    @property
+    def belief_false(self) -> float:
+        return self._beliefs_false[self._index]
+
+    @belief_false.setter
+    def belief_false(self, value: float):
+        self._beliefs_false[self._index] = value
 
     def update_beliefs(self, true_compatible: bool, false_compatible: bool):
         """
@@ -54,18 +91,23 @@ class Message:
             true_compatible: Is variable=True compatible with sender?
             false_compatible: Is variable=False compatible with sender?
         """
-        if true_compatible and not false_compatible:
-            self.belief_true = 1.0
-            self.belief_false = 0.0
-        elif false_compatible and not true_compatible:
-            self.belief_true = 0.0
-            self.belief_false = 1.0
-        elif true_compatible and false_compatible:
-            self.belief_true = 0.5
-            self.belief_false = 0.5
-        else:  # Neither compatible - conflict!
-            self.belief_true = 0.0
-            self.belief_false = 0.0
+        self.belief_true, self.belief_false = Message.beliefs_for(
+            true_compatible, false_compatible)
+
+    @staticmethod
+    def beliefs_for(true_compatible: bool,
+                    false_compatible: bool) -> Tuple[float, float]:
+        """
+        Get the (belief_true, belief_false) pair for a compatibility check.
+
+        Args:
+            true_compatible: Is variable=True compatible with sender?
+            false_compatible: Is variable=False compatible with sender?
+
+        Returns:
+            Tuple of (belief_true, belief_false)
+        """
+        return Message._BELIEF_TABLE[bool(true_compatible), bool(false_compatible)]
 
     def is_forced(self) -> Optional[bool]:
         """
@@ -111,13 +153,77 @@ class MessagePasser:
         self.variable_communities = variable_communities
         self.clause_communities = clause_communities
 
-        # Message state
-        self.messages: Dict[Tuple[int, int, str], Message] = {}
+        # Interface variables are interned to dense integer ids; names are
+        # only used at the API boundary
+        self._var_names: List[str] = sorted(interface_variables)
+        self._var_id: Dict[str, int] = {var: var_id for var_id, var
+                                        in enumerate(self._var_names)}
+
+        # Unit literals of each community on interface variables, as
+        # bitsets over variable ids (bit v of _pos_units set for a unit
+        # clause (v), of _neg_units for (~v)), plus which communities
+        # contain an empty clause
+        self._pos_units: Dict[int, int] = {}
+        self._neg_units: Dict[int, int] = {}
+        self._has_empty_clause: Dict[int, bool] = {}
+        self._index_units()
+        # (community, variable id) -> (true_compatible, false_compatible);
+        # fixed for the lifetime of the passer, like the unit tables
+        self._compatibility_cache: Dict[Tuple[int, int], Tuple[bool, bool]] = {}
+
+        # Message state, stored as parallel arrays with one slot per
+        # message. Messages about each variable occupy a contiguous
+        # [start, end) range, and within it the messages from each sender
+        # are contiguous as well.
+        self._msg_from = array('i')
+        self._msg_to = array('i')
+        self._msg_var = array('i')  # Variable id
+        self._belief_true = array('d')
+        self._belief_false = array('d')
+        # Message range per variable id, None if it has no messages
+        self._var_spans: List[Optional[Tuple[int, int]]] = [None] * len(self._var_names)
+        # (from_community, variable id, start, end) for each sender range
+        self._sender_spans: List[Tuple[int, int, int, int]] = []
+        self._messages: Optional[Dict[Tuple[int, int, str], Message]] = None
         self._initialize_messages()
 
         # Beliefs about interface variables (aggregated from messages)
         self.interface_beliefs: Dict[str, Tuple[float, float]] = {}  # var -> (belief_true, belief_false)
 
+        # Running statistics, kept current by the update and aggregation
+        # steps so get_statistics() does not rescan
+        self._num_forced = 0
+        self._num_conflicts = 0
+
+    def _index_units(self):
+        """
+        Collect the unit literals of each community.
+
+        Assigning a single variable can only empty a clause whose literals
+        are all on that variable, i.e. a unit clause (possibly with the
+        literal repeated). Clauses holding both polarities are tautologies
+        and are skipped.
+        """
+        var_id = self._var_id
+        for comm_id, formula in self.community_formulas.items():
+            pos_units = 0
+            neg_units = 0
+            has_empty_clause = False
+            for clause in formula.clauses:
+                literals = {(lit.variable, lit.negated) for lit in clause.literals}
+                if not literals:
+                    has_empty_clause = True
+                elif len(literals) == 1:
+                    (var, negated), = literals
+                    if var in var_id:
+                        if negated:
+                            neg_units |= 1 << var_id[var]
+                        else:
+                            pos_units |= 1 << var_id[var]
+            self._pos_units[comm_id] = pos_units
+            self._neg_units[comm_id] = neg_units
+            self._has_empty_clause[comm_id] = has_empty_clause
+
     def _initialize_messages(self):
         """
         Initialize messages between communities.
@@ -125,24 +231,52 @@ class MessagePasser:
         For each interface variable, create messages from each community
         that uses it to all other communities that use it.
         """
-        # Find which communities each interface variable connects
-        var_to_communities = defaultdict(set)
-        for var in self.interface_variables:
-            # Find all communities this variable appears in
-            # (through the clauses they contain)
-            for comm_id, formula in self.community_formulas.items():
-                if var in formula.get_variables():
-                    var_to_communities[var].add(comm_id)
+        # Find which communities each interface variable connects (through
+        # the clauses they contain), visiting each community once. Each
+        # community is appended at most once per variable.
+        var_to_communities: Dict[str, List[int]] = defaultdict(list)
+        for comm_id, formula in self.community_formulas.items():
+            for var in formula.get_variables().intersection(self.interface_variables):
+                var_to_communities[var].append(comm_id)
 
         # Create messages
-        for var, communities in var_to_communities.items():
-            communities_list = list(communities)
+        for var_id, var in enumerate(self._var_names):
+            communities_list = var_to_communities.get(var, ())
+            if len(communities_list) < 2:
+                continue
+            start = len(self._belief_true)
             # Each community sends message to each other community
             for from_comm in communities_list:
+                sender_start = len(self._belief_true)
                 for to_comm in communities_list:
                     if from_comm != to_comm:
-                        msg = Message(from_comm, to_comm, var)
-                        self.messages[(from_comm, to_comm, var)] = msg
+                        self._msg_from.append(from_comm)
+                        self._msg_to.append(to_comm)
+                        self._msg_var.append(var_id)
+                        self._belief_true.append(0.5)  # Initially neutral
+                        self._belief_false.append(0.5)
+                self._sender_spans.append(
+                    (from_comm, var_id, sender_start, len(self._belief_true)))
+            self._var_spans[var_id] = (start, len(self._belief_true))
+
+    @property
+    def messages(self) -> Dict[Tuple[int, int, str], Message]:
+        """
+        Messages keyed by (from_community, to_community, variable).
+
+        The Message objects are views onto the passer's belief arrays,
+        built on first access. They are meant for reading: beliefs written
+        through them are not reflected in get_statistics().
+        """
+        if self._messages is None:
+            beliefs = (self._belief_true, self._belief_false)
+            self._messages = {}
+            for index, (from_comm, to_comm, var_id) in enumerate(
+                    zip(self._msg_from, self._msg_to, self._msg_var)):
+                var = self._var_names[var_id]
+                self._messages[(from_comm, to_comm, var)] = Message(
+                    from_comm, to_comm, var, beliefs, index)
+        return self._messages
 
     def propagate(self, max_iterations: int = 10) -> Dict[str, Optional[bool]]:
         """
@@ -158,17 +292,17 @@ class MessagePasser:
             Dictionary mapping interface variables to forced values
             (None if not forced)
         """
-        for iteration in range(max_iterations):
+        # A message depends only on its sender's formula and its variable,
+        # neither of which changes during propagation, so the first update
+        # already reaches the fixed point: a second pass would report no
+        # change. max_iterations only matters to allow zero iterations.
+        if max_iterations > 0:
             # Update all messages
-            changed = self._update_all_messages()
+            self._update_all_messages()
 
             # Aggregate beliefs
             self._aggregate_beliefs()
 
-            # Check for convergence
-            if not changed:
-                break
-
         # Extract forced assignments
         forced_assignments = {}
         for var in self.interface_variables:
@@ -185,25 +319,41 @@ class MessagePasser:
             True if any message changed, False otherwise
         """
         changed = False
-
-        for (from_comm, to_comm, var), msg in self.messages.items():
-            # Test if variable=True is compatible with from_community
-            true_compatible = self._is_compatible(from_comm, var, True)
-
-            # Test if variable=False is compatible with from_community
-            false_compatible = self._is_compatible(from_comm, var, False)
-
-            # Update message beliefs
-            old_beliefs = (msg.belief_true, msg.belief_false)
-            msg.update_beliefs(true_compatible, false_compatible)
-            new_beliefs = (msg.belief_true, msg.belief_false)
-
-            if old_beliefs != new_beliefs:
+        compatibility = self._compatibility_cache
+        belief_true = self._belief_true
+        belief_false = self._belief_false
+
+        # Compatibility depends only on the sender and the variable, so all
+        # messages in a sender range get the same beliefs
+        for from_comm, var_id, start, end in self._sender_spans:
+            key = (from_comm, var_id)
+            result = compatibility.get(key)
+            if result is None:
+                # Test if variable=True / variable=False is compatible
+                # with from_community
+                result = (self._is_compatible(from_comm, var_id, True),
+                          self._is_compatible(from_comm, var_id, False))
+                compatibility[key] = result
+
+            new_true, new_false = Message.beliefs_for(*result)
+            new_beliefs_true = array('d', [new_true]) * (end - start)
+            new_beliefs_false = array('d', [new_false]) * (end - start)
+
+            if (belief_true[start:end] != new_beliefs_true
+                    or belief_false[start:end] != new_beliefs_false):
+                # A sender range always shares one belief pair, so its
+                # first slot tells whether it was in conflict
+                was_conflict = belief_true[start] == 0.0 and belief_false[start] == 0.0
+                is_conflict = new_true == 0.0 and new_false == 0.0
+                self._num_conflicts += (end - start) * (is_conflict - was_conflict)
+
+                belief_true[start:end] = new_beliefs_true
+                belief_false[start:end] = new_beliefs_false
                 changed = True
 
         return changed
 
-    def _is_compatible(self, community_id: int, variable: str, value: bool) -> bool:
+    def _is_compatible(self, community_id: int, var_id: int, value: bool) -> bool:
         """
         Check if a variable assignment is compatible with a community.
 
@@ -212,7 +362,7 @@ class MessagePasser:
 
         Args:
             community_id: Community to check
-            variable: Variable to assign
+            var_id: Id of the interface variable to assign
             value: Value to assign
 
         Returns:
@@ -221,31 +371,14 @@ class MessagePasser:
         if community_id not in self.community_formulas:
             return True
 
-        formula = self.community_formulas[community_id]
-        assignment = {variable: value}
-
-        # Simplify and check for empty clause
-        for clause in formula.clauses:
-            clause_satisfied = False
-            all_false = True
-
-            for literal in clause.literals:
-                if literal.variable == variable:
-                    # Check if this literal is satisfied or falsified
-                    lit_value = (not value) if literal.negated else value
-                    if lit_value:
-                        clause_satisfied = True
-                        break
-                    # else: literal is false, continue
-                else:
-                    # Other variable in clause
-                    all_false = False
-
-            # If clause has only the variable and it's false, conflict
-            if all_false and not clause_satisfied:
-                return False
+        # An empty clause is falsified by any assignment
+        if self._has_empty_clause[community_id]:
+            return False
 
-        return True
+        # Only a unit clause can become empty: True falsifies a unit (~v),
+        # False falsifies a unit (v)
+        units = self._neg_units if value else self._pos_units
+        return not (units[community_id] >> var_id) & 1
 
     def _aggregate_beliefs(self):
         """
@@ -254,38 +387,42 @@ class MessagePasser:
         For each interface variable, combine messages from all communities.
         """
         self.interface_beliefs = {}
+        num_forced = 0
 
-        for var in self.interface_variables:
-            # Collect all messages about this variable
-            messages_about_var = [
-                msg for (from_c, to_c, v), msg in self.messages.items()
-                if v == var
-            ]
+        for var_id, var in enumerate(self._var_names):
+            span = self._var_spans[var_id]
 
-            if not messages_about_var:
+            if span is None:
                 # No messages - neutral belief
                 self.interface_beliefs[var] = (0.5, 0.5)
                 continue
 
+            start, end = span
+            beliefs_true = self._belief_true[start:end]
+            beliefs_false = self._belief_false[start:end]
+
             # Aggregate: If any message forces a value, use that
-            # Otherwise, average the beliefs
-            forced_true = any(msg.belief_true == 1.0 and msg.belief_false == 0.0
-                            for msg in messages_about_var)
-            forced_false = any(msg.belief_true == 0.0 and msg.belief_false == 1.0
-                             for msg in messages_about_var)
+            # Otherwise, average the beliefs. A belief of 1.0 only occurs
+            # in a forcing message, so the checks are plain C-level scans.
+            forced_true = 1.0 in beliefs_true
+            forced_false = 1.0 in beliefs_false
 
             if forced_true and not forced_false:
                 self.interface_beliefs[var] = (1.0, 0.0)
+                num_forced += 1
             elif forced_false and not forced_true:
                 self.interface_beliefs[var] = (0.0, 1.0)
+                num_forced += 1
             elif forced_true and forced_false:
                 # Conflict! Both values forced
                 self.interface_beliefs[var] = (0.0, 0.0)
             else:
                 # Average beliefs
-                avg_true = sum(msg.belief_true for msg in messages_about_var) / len(messages_about_var)
-                avg_false = sum(msg.belief_false for msg in messages_about_var) / len(messages_about_var)
-                self.interface_beliefs[var] = (avg_true, avg_false)
+                num_messages = end - start
+                self.interface_beliefs[var] = (sum(beliefs_true) / num_messages,
+                                               sum(beliefs_false) / num_messages)
+
+        self._num_forced = num_forced
 
     def _get_forced_value(self, variable: str) -> Optional[bool]:
         """
@@ -316,7 +453,7 @@ class MessagePasser:
         Returns:
             True if any variable has no compatible value
         """
-        return any(msg.indicates_conflict() for msg in self.messages.values())
+        return self._num_conflicts > 0
 
     def get_statistics(self) -> Dict:
         """
@@ -325,14 +462,11 @@ class MessagePasser:
         Returns:
             Dictionary with message passing statistics
         """
-        num_forced = sum(1 for var in self.interface_variables
-                        if self._get_forced_value(var) is not None)
-
-        num_conflicts = sum(1 for msg in self.messages.values()
-                           if msg.indicates_conflict())
+        num_forced = self._num_forced
+        num_conflicts = self._num_conflicts
 
         return {
-            'num_messages': len(self.messages),
+            'num_messages': len(self._belief_true),
             'num_interface_vars': len(self.interface_variables),
             'num_forced': num_forced,
             'forced_percentage': 100.0 * num_forced / len(self.interface_variables) if self.interface_variables else 0,
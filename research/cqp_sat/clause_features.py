@@ -11,10 +11,19 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 
-from typing import Dict, List, Set, Optional
+from typing import Deque, Dict, List, Tuple, Optional
+from collections import deque
 from bsat.cnf import Clause, Literal
 
 
+# Number of set bits in an int (int.bit_count() needs Python 3.10)
+if hasattr(int, 'bit_count'):
+    _popcount = int.bit_count
+else:
+    def _popcount(mask: int) -> int:
+        return bin(mask).count("1")
+
+
 class ClauseFeatures:
     """
     Features extracted from a learned clause for quality prediction.
@@ -22,6 +31,14 @@ class ClauseFeatures:
     Based on Glucose solver (Audemard & Simon 2009).
     """
 
+    # One instance per learned clause, so skip the per-instance __dict__
+    __slots__ = (
+        'clause', 'cid', 'size', 'lbd', 'activity', 'decision_level',
+        'age', 'propagation_count', 'conflict_count', 'used_recently',
+        'protected',
+        'lbd_history', '_lbd_sum', '_lbd_sum_sq',
+    )
+
     def __init__(self, clause: Clause):
         """
         Initialize clause features.
@@ -30,6 +47,7 @@ class ClauseFeatures:
             clause: The learned clause
         """
         self.clause = clause
+        self.cid: int = -1  # Learned clause id, assigned by the solver
 
         # Basic features
         self.size = len(clause.literals)  # Clause length
@@ -44,9 +62,29 @@ class ClauseFeatures:
         self.propagation_count: int = 0  # Times used for propagation
         self.conflict_count: int = 0  # Times in conflict analysis
         self.used_recently: bool = True  # Used in recent conflicts
+        self.protected: bool = False  # Locked in, never deleted (set by solver)
+
+        # LBD tracking (for stability), bounded to the last 10 values,
+        # with running sums over the history for its variance
+        self.lbd_history: Deque[int] = deque(maxlen=10)
+        self._lbd_sum: int = 0
+        self._lbd_sum_sq: int = 0
+
+    def record_lbd(self, lbd: int):
+        """
+        Append an LBD value to the history, evicting the oldest when full.
 
-        # LBD tracking (for stability)
-        self.lbd_history: List[int] = []
+        Args:
+            lbd: The LBD value to record
+        """
+        history = self.lbd_history
+        if len(history) == history.maxlen:
+            oldest = history[0]
+            self._lbd_sum -= oldest
+            self._lbd_sum_sq -= oldest * oldest
+        history.append(lbd)
+        self._lbd_sum += lbd
+        self._lbd_sum_sq += lbd * lbd
 
     def __repr__(self):
         return (
@@ -90,16 +128,19 @@ class ClauseFeatureExtractor:
         Returns:
             LBD score (lower is better quality)
         """
-        levels: Set[int] = set()
+        # Levels are collected as bits of an int; Python ints grow as
+        # needed, so deep levels just widen the mask
+        get_level = decision_levels.get
+        level_mask = 0
 
         for lit in clause.literals:
-            var = lit.variable
-            if var in decision_levels:
-                level = decision_levels[var]
-                levels.add(level)
+            level = get_level(lit.variable)
+            if level is None:
+                continue
+            level_mask |= 1 << level
 
         # LBD is the count of distinct levels
-        lbd = len(levels)
+        lbd = _popcount(level_mask)
 
         return lbd if lbd > 0 else 1
 
@@ -126,6 +167,40 @@ class ClauseFeatureExtractor:
 
         return total_activity
 
+    def _compute_lbd_and_activity(self,
+                                  clause: Clause,
+                                  decision_levels: Dict[str, int],
+                                  variable_activities: Dict[str, float]) -> Tuple[int, float]:
+        """
+        Compute LBD and activity together in a single pass over the literals.
+
+        Same results as compute_lbd() and compute_activity().
+
+        Args:
+            clause: The clause
+            decision_levels: Map from variable to decision level
+            variable_activities: Map from variable to activity score
+
+        Returns:
+            Tuple of (LBD, activity)
+        """
+        get_level = decision_levels.get
+        get_activity = variable_activities.get
+        level_mask = 0
+        total_activity = 0.0
+
+        for lit in clause.literals:
+            var = lit.variable
+            total_activity += get_activity(var, 0.0)
+            level = get_level(var)
+            if level is None:
+                continue
+            level_mask |= 1 << level
+
+        lbd = _popcount(level_mask)
+
+        return (lbd if lbd > 0 else 1), total_activity
+
     def extract_features(self,
                         clause: Clause,
                         decision_levels: Dict[str, int],
@@ -145,17 +220,15 @@ class ClauseFeatureExtractor:
         """
         features = ClauseFeatures(clause)
 
-        # Compute LBD (most important feature)
-        features.lbd = self.compute_lbd(clause, decision_levels)
-
-        # Compute activity
-        features.activity = self.compute_activity(clause, variable_activities)
+        # Compute LBD (most important feature) and activity in one pass
+        features.lbd, features.activity = self._compute_lbd_and_activity(
+            clause, decision_levels, variable_activities)
 
         # Record learning context
         features.decision_level = learned_at_level
 
         # Initialize LBD history
-        features.lbd_history.append(features.lbd)
+        features.record_lbd(features.lbd)
 
         return features
 
@@ -178,11 +251,38 @@ class ClauseFeatureExtractor:
         features.lbd = new_lbd
 
         # Track history (for computing variance/stability)
-        features.lbd_history.append(new_lbd)
+        features.record_lbd(new_lbd)
+
+    def update_lbd_batch(self,
+                         features_list: List[ClauseFeatures],
+                         decision_levels: Dict[str, int]):
+        """
+        Update LBD for many clauses at once, e.g. during a database sweep.
 
-        # Keep history bounded
-        if len(features.lbd_history) > 10:
-            features.lbd_history.pop(0)
+        Same result as calling update_lbd() on each entry, with the
+        level lookup bound once for the whole batch.
+
+        Args:
+            features_list: Clause features to update
+            decision_levels: Current variable to decision level map
+        """
+        get_level = decision_levels.get
+
+        for features in features_list:
+            level_mask = 0
+
+            for lit in features.clause.literals:
+                level = get_level(lit.variable)
+                if level is None:
+                    continue
+                level_mask |= 1 << level
+
+            new_lbd = _popcount(level_mask)
+            if new_lbd == 0:
+                new_lbd = 1
+
+            features.lbd = new_lbd
+            features.record_lbd(new_lbd)
 
     def compute_lbd_stability(self, features: ClauseFeatures) -> float:
         """
@@ -194,14 +294,14 @@ class ClauseFeatureExtractor:
         Returns:
             LBD variance (lower is more stable)
         """
-        if len(features.lbd_history) < 2:
+        n = len(features.lbd_history)
+        if n < 2:
             return 0.0
 
-        mean_lbd = sum(features.lbd_history) / len(features.lbd_history)
-        variance = sum((lbd - mean_lbd) ** 2 for lbd in features.lbd_history)
-        variance /= len(features.lbd_history)
-
-        return variance
+        # Var = E[x^2] - E[x]^2 from the running sums, kept in integers
+        # until the final division so it never goes negative
+        total = features._lbd_sum
+        return (n * features._lbd_sum_sq - total * total) / (n * n)
 
     def get_feature_summary(self, features: ClauseFeatures) -> dict:
         """Get summary of all features for analysis."""
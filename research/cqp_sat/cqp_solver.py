@@ -36,7 +36,12 @@ class CQPStats(CDCLStats):
         self.clauses_deleted = 0
         self.glue_clauses = 0  # LBD ≤ 2
         self.database_reductions = 0
-        self.avg_lbd = 0.0
+        self.lbd_sum = 0  # Sum of LBDs of all learned clauses
+
+    @property
+    def avg_lbd(self) -> float:
+        """Average LBD over all learned clauses."""
+        return self.lbd_sum / max(self.clauses_learned_total, 1)
 
     def __str__(self):
         base_stats = super().__str__()
@@ -113,11 +118,19 @@ class CQPSATSolver(CDCLSolver):
             )
             self.quality_predictor.glue_threshold = glue_threshold
 
-            # Track features for learned clauses
-            self.clause_features: Dict[Clause, ClauseFeatures] = {}
+            # Features of the learned clauses, parallel to
+            # self.clauses[self.num_original_clauses:], so clauses are
+            # found by position rather than by hashing their literals
+            self._learned_features: List[ClauseFeatures] = []
+            self._next_cid = 0
+            # Last get_quality_statistics() result over the learned clauses;
+            # cleared whenever the learned clauses or their features change
+            self._quality_stats_cache: Optional[dict] = None
 
-            # Decision level tracking (for LBD computation)
-            self.variable_decision_levels: Dict[str, int] = {}
+            # Decision level tracking (for LBD computation). Preallocated
+            # with every variable (None = never assigned, which LBD skips)
+            # so assignments only overwrite slots and never grow the table.
+            self.variable_decision_levels: Dict[str, Optional[int]] = dict.fromkeys(self.variables)
 
         # Extended statistics
         self.stats = CQPStats()
@@ -132,6 +145,11 @@ class CQPSATSolver(CDCLSolver):
         if self.use_quality_prediction:
             self.variable_decision_levels[variable] = self.decision_level
 
+    @property
+    def clause_features(self) -> Dict[Clause, ClauseFeatures]:
+        """Features of the current learned clauses, keyed by clause."""
+        return {features.clause: features for features in self._learned_features}
+
     def _add_learned_clause(self, clause: Clause):
         """
         Override to extract features and predict quality when learning clause.
@@ -139,31 +157,58 @@ class CQPSATSolver(CDCLSolver):
         Args:
             clause: The learned clause
         """
+        # Extract features and predict quality (before the parent adds the
+        # clause, so a limit-triggered reduction sees both lists in step)
+        if self.use_quality_prediction:
+            if len(clause.literals) <= self.glue_threshold:
+                # LBD never exceeds the clause size, so short clauses are
+                # glue whatever their levels: record the size as their LBD
+                # (an upper bound) instead of looking up each literal's level
+                features = ClauseFeatures(clause)
+                features.lbd = len(clause.literals) or 1
+                features.activity = self.feature_extractor.compute_activity(
+                    clause, self.vsids_scores)
+                features.decision_level = self.decision_level
+                features.record_lbd(features.lbd)
+                features.protected = True
+            else:
+                features = self.feature_extractor.extract_features(
+                    clause,
+                    self.variable_decision_levels,
+                    self.vsids_scores,
+                    self.decision_level
+                )
+                # Glue clauses are protected for good
+                features.protected = features.lbd <= self.glue_threshold
+
+            # Store features
+            features.cid = self._next_cid
+            self._next_cid += 1
+            self._learned_features.append(features)
+            self._quality_stats_cache = None
+
         # Call parent to add clause
         super()._add_learned_clause(clause)
 
         self.stats.clauses_learned_total += 1
 
-        # Extract features and predict quality
         if self.use_quality_prediction:
-            features = self.feature_extractor.extract_features(
-                clause,
-                self.variable_decision_levels,
-                self.vsids_scores,
-                self.decision_level
-            )
+            # Track glue clauses (the extractor always sets an LBD)
+            lbd = features.lbd
+            if lbd <= self.glue_threshold:
+                self.stats.glue_clauses += 1
 
-            # Store features
-            self.clause_features[clause] = features
+            # Running LBD sum; the average is derived on demand
+            self.stats.lbd_sum += lbd
 
-            # Track glue clauses
-            if features.lbd is not None and features.lbd <= self.glue_threshold:
-                self.stats.glue_clauses += 1
+    def _reduce_learned_clauses(self):
+        """Override to keep learned clause features in step with the parent's reduction."""
+        super()._reduce_learned_clauses()
 
-            # Update average LBD
-            if features.lbd is not None:
-                n = self.stats.clauses_learned_total
-                self.stats.avg_lbd = ((n - 1) * self.stats.avg_lbd + features.lbd) / n
+        if self.use_quality_prediction:
+            num_to_keep = self.learned_clause_limit // 2
+            self._learned_features = self._learned_features[-num_to_keep:]
+            self._quality_stats_cache = None
 
     def _should_reduce_database(self) -> bool:
         """
@@ -197,40 +242,50 @@ class CQPSATSolver(CDCLSolver):
             super()._reduce_database()
             return
 
-        # Get learned clauses (clauses after original ones)
-        learned_clauses = self.clauses[self.num_original_clauses:]
+        # Features of the learned clauses (clauses after original ones)
+        features_list = self._learned_features
 
-        if not learned_clauses:
+        if not features_list:
             return
 
-        # Update ages
-        for clause in learned_clauses:
-            if clause in self.clause_features:
-                self.clause_features[clause].age += 1
-
-        # Collect features for all learned clauses
-        features_list = []
-        for clause in learned_clauses:
-            if clause in self.clause_features:
-                features_list.append(self.clause_features[clause])
-
-        # Select clauses for deletion
-        target_count = int(len(learned_clauses) * 0.5)  # Keep 50%
-        to_delete = self.quality_predictor.select_for_deletion(
-            features_list,
-            target_count
-        )
+        # Ages (and possibly the clause set) change below
+        self._quality_stats_cache = None
+
+        # One pass over the learned clauses: update ages, then split them
+        # into protected and deletable. Protection is locked in (like
+        # Glucose), so a clause once protected stays protected.
+        should_protect = self.quality_predictor.should_protect
+        deletable = []
+        num_protected = 0
+        for features in features_list:
+            features.age += 1
+            if should_protect(features):
+                features.protected = True
+                num_protected += 1
+            else:
+                deletable.append(features)
+
+        # Select clauses for deletion: keep the best deletable clauses in
+        # the slots the protected ones leave under the target
+        target_count = int(len(features_list) * 0.5)  # Keep 50%
+        if num_protected >= target_count:
+            to_delete = []
+        else:
+            remaining_slots = target_count - num_protected
+            to_delete = self.quality_predictor.select_lowest_quality(
+                deletable,
+                len(deletable) - remaining_slots
+            )
 
-        # Delete low-quality clauses
-        deleted_count = 0
-        for features in to_delete:
-            clause = features.clause
-            if clause in self.clauses:
-                self.clauses.remove(clause)
-                # Only delete from clause_features if it exists
-                if clause in self.clause_features:
-                    del self.clause_features[clause]
-                deleted_count += 1
+        # Delete low-quality clauses: mark them by id, then rebuild the
+        # learned region in a single sweep
+        doomed = {features.cid for features in to_delete}
+        deleted_count = len(doomed)
+        if doomed:
+            kept = [features for features in features_list
+                    if features.cid not in doomed]
+            self._learned_features = kept
+            self.clauses[self.num_original_clauses:] = [features.clause for features in kept]
 
         self.stats.clauses_deleted += deleted_count
         self.stats.database_reductions += 1
@@ -318,17 +373,23 @@ class CQPSATSolver(CDCLSolver):
                     break
 
     def get_quality_statistics(self) -> dict:
-        """Get detailed clause quality statistics."""
+        """
+        Get detailed clause quality statistics.
+
+        The learned-clause figures are cached until the learned clauses
+        or their ages change.
+        """
         stats = {
             'enabled': self.use_quality_prediction,
             'lbd_threshold': self.lbd_threshold,
             'glue_threshold': self.glue_threshold,
         }
 
-        if self.use_quality_prediction and self.clause_features:
-            features_list = list(self.clause_features.values())
-            quality_stats = self.quality_predictor.get_statistics(features_list)
-            stats.update(quality_stats)
+        if self.use_quality_prediction and self._learned_features:
+            if self._quality_stats_cache is None:
+                self._quality_stats_cache = self.quality_predictor.get_statistics(
+                    self._learned_features)
+            stats.update(self._quality_stats_cache)
 
         return stats
 
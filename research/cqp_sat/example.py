@@ -14,7 +14,19 @@ from bsat import CNFExpression
 from cqp_sat import CQPSATSolver, solve_cqp_sat
 
 
+# Example formulas, parsed once in main()
+FORMULAS = {
+    'simple': "(a | b | c) & (~a | b) & (~b | c) & (a | ~c) & (~a | ~b | d)",
+    'comparison': "(x | y | z) & (~x | y) & (~y | z) & (x | ~z) & (~x | ~y | w) & (y | ~w)",
+    'convenience': "(a | b) & (~a | c) & (~b | ~c) & (c | d) & (~c | ~d)",
+}
+
+
 def main():
+    # Solvers copy the clause list and never mutate the CNF, so each
+    # parsed formula can be shared by every solver that uses it
+    fixtures = {name: CNFExpression.parse(formula) for name, formula in FORMULAS.items()}
+
     print("=" * 70)
     print("CQP-SAT: Clause Quality Prediction SAT Solver Example")
     print("Educational reimplementation of Glucose (Audemard & Simon 2009)")
@@ -24,11 +36,10 @@ def main():
     # Example 1: Simple SAT with quality tracking
     print("Example 1: Simple SAT with clause quality tracking")
     print("-" * 70)
-    formula1 = "(a | b | c) & (~a | b) & (~b | c) & (a | ~c) & (~a | ~b | d)"
-    print(f"Formula: {formula1}")
+    print(f"Formula: {FORMULAS['simple']}")
     print()
 
-    cnf1 = CNFExpression.parse(formula1)
+    cnf1 = fixtures['simple']
     solver1 = CQPSATSolver(cnf1, use_quality_prediction=True, glue_threshold=2)
 
     result1 = solver1.solve()
@@ -67,11 +78,10 @@ def main():
     # Example 2: With vs. without quality prediction
     print("Example 2: Comparing with/without quality prediction")
     print("-" * 70)
-    formula2 = "(x | y | z) & (~x | y) & (~y | z) & (x | ~z) & (~x | ~y | w) & (y | ~w)"
-    print(f"Formula: {formula2}")
+    print(f"Formula: {FORMULAS['comparison']}")
     print()
 
-    cnf2 = CNFExpression.parse(formula2)
+    cnf2 = fixtures['comparison']
 
     # Without quality prediction
     print("Without quality prediction (standard CDCL):")
@@ -109,11 +119,10 @@ def main():
     # Example 3: Using convenience function
     print("Example 3: Using solve_cqp_sat() convenience function")
     print("-" * 70)
-    formula3 = "(a | b) & (~a | c) & (~b | ~c) & (c | d) & (~c | ~d)"
-    print(f"Formula: {formula3}")
+    print(f"Formula: {FORMULAS['convenience']}")
     print()
 
-    cnf3 = CNFExpression.parse(formula3)
+    cnf3 = fixtures['convenience']
     result3 = solve_cqp_sat(cnf3, use_quality_prediction=True, glue_threshold=2)
 
     if result3:
@@ -12,6 +12,7 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 
+import heapq
 from typing import List, Optional
 from .clause_features import ClauseFeatures, ClauseFeatureExtractor
 
@@ -45,6 +46,10 @@ class QualityPredictor:
         # Glucose thresholds
         self.glue_threshold = 2  # LBD ≤ 2 = "glue clause" (always keep)
 
+        # LBD score per small integer LBD, rebuilt when the thresholds change
+        self._lbd_score_table: List[float] = []
+        self._lbd_score_table_key: Optional[tuple] = None
+
     def predict_quality(self, features: ClauseFeatures) -> float:
         """
         Predict clause quality score.
@@ -86,6 +91,81 @@ class QualityPredictor:
 
         return max(0.0, min(1.0, quality))
 
+    def predict_quality_batch(self, clause_features: List[ClauseFeatures]) -> List[float]:
+        """
+        Predict quality scores for many clauses in one call.
+
+        Same scores as predict_quality(), with the predictor's parameters
+        read once for the whole batch.
+
+        Args:
+            clause_features: List of clause features
+
+        Returns:
+            Quality scores (0.0 to 1.0), in the same order
+        """
+        glue_threshold = self.glue_threshold
+        lbd_threshold = self.lbd_threshold
+        activity_weight = self.activity_weight
+        age_penalty = self.age_penalty
+        lbd_scores = self._get_lbd_score_table()
+        table_size = len(lbd_scores)
+
+        qualities = []
+        append = qualities.append
+        for features in clause_features:
+            lbd = features.lbd
+            if lbd is None:
+                lbd_score = 0.5
+            elif 0 <= lbd < table_size:
+                lbd_score = lbd_scores[lbd]
+            elif lbd <= glue_threshold:
+                lbd_score = 1.0
+            else:
+                lbd_score = 1.0 - (lbd / lbd_threshold)
+                if lbd_score < 0.0:
+                    lbd_score = 0.0
+
+            activity_score = features.activity * activity_weight
+            if activity_score > 1.0:
+                activity_score = 1.0
+
+            age = features.age
+            age_factor = 1.0 - (age * age_penalty)
+            if age_factor < 0.5:
+                age_factor = 0.5
+
+            usage_bonus = (features.propagation_count + features.conflict_count) / (age if age > 1 else 1) * 0.2
+            if usage_bonus > 0.2:
+                usage_bonus = 0.2
+
+            quality = (lbd_score * 0.7 + activity_score * 0.2 + usage_bonus) * age_factor
+            append(0.0 if quality < 0.0 else 1.0 if quality > 1.0 else quality)
+
+        return qualities
+
+    def _get_lbd_score_table(self) -> List[float]:
+        """
+        Get the LBD score for each LBD from 0 up to the thresholds.
+
+        LBDs are small integers, so scoring them is a table lookup; the
+        table is capped at 256 entries and rebuilt when lbd_threshold or
+        glue_threshold changes.
+
+        Returns:
+            List mapping LBD to its score in predict_quality()
+        """
+        key = (self.glue_threshold, self.lbd_threshold)
+        if self._lbd_score_table_key != key:
+            glue_threshold, lbd_threshold = key
+            size = min(max(glue_threshold, lbd_threshold) + 1, 256)
+            self._lbd_score_table = [
+                1.0 if lbd <= glue_threshold else max(0.0, 1.0 - (lbd / lbd_threshold))
+                for lbd in range(size)
+            ]
+            self._lbd_score_table_key = key
+        return self._lbd_score_table
+
     def should_keep(self, features: ClauseFeatures, threshold: float = 0.5) -> bool:
         """
         Decide if a clause should be kept.
@@ -117,6 +197,10 @@ class QualityPredictor:
         Returns:
             True if clause should be protected
         """
+        # Clauses already locked in stay protected
+        if features.protected:
+            return True
+
         # Protect glue clauses
         if features.lbd is not None and features.lbd <= self.glue_threshold:
             return True
@@ -139,9 +223,11 @@ class QualityPredictor:
         Returns:
             Sorted list (best quality first)
         """
-        return sorted(clause_features,
-                     key=lambda f: self.predict_quality(f),
-                     reverse=True)
+        qualities = self.predict_quality_batch(clause_features)
+        order = sorted(range(len(clause_features)),
+                       key=qualities.__getitem__,
+                       reverse=True)
+        return [clause_features[i] for i in order]
 
     def select_for_deletion(self,
                            clause_features: List[ClauseFeatures],
@@ -162,22 +248,46 @@ class QualityPredictor:
             List of clause features to delete
         """
         # Separate protected clauses
-        protected = [f for f in clause_features if self.should_protect(f)]
-        deletable = [f for f in clause_features if not self.should_protect(f)]
+        protected = []
+        deletable = []
+        for f in clause_features:
+            if self.should_protect(f):
+                protected.append(f)
+            else:
+                deletable.append(f)
 
         # If protected clauses already exceed target, delete nothing
         if len(protected) >= target_count:
             return []
 
-        # Rank deletable clauses by quality
-        ranked_deletable = self.rank_clauses(deletable)
-
         # Keep best quality clauses up to target
         remaining_slots = target_count - len(protected)
-        to_keep = ranked_deletable[:remaining_slots]
-        to_delete = ranked_deletable[remaining_slots:]
+        return self.select_lowest_quality(deletable, len(deletable) - remaining_slots)
+
+    def select_lowest_quality(self,
+                              clause_features: List[ClauseFeatures],
+                              count: int) -> List[ClauseFeatures]:
+        """
+        Select the lowest quality clauses.
+
+        Only the worst ones are found, not a full ranking. Ties go the
+        same way as in rank_clauses (later clauses rank lower).
+
+        Args:
+            clause_features: List of clause features to choose from
+            count: Number of clauses to select
+
+        Returns:
+            List of the count lowest quality clause features
+        """
+        if count <= 0:
+            return []
+
+        qualities = self.predict_quality_batch(clause_features)
+        worst = heapq.nsmallest(count, range(len(clause_features)),
+                                key=lambda i: (qualities[i], -i))
 
-        return to_delete
+        return [clause_features[i] for i in worst]
 
     def get_statistics(self, clause_features: List[ClauseFeatures]) -> dict:
         """Get statistics about clause quality distribution."""
@@ -195,7 +305,7 @@ class QualityPredictor:
         glue_count = sum(1 for f in clause_features
                         if f.lbd is not None and f.lbd <= self.glue_threshold)
 
-        qualities = [self.predict_quality(f) for f in clause_features]
+        qualities = self.predict_quality_batch(clause_features)
         high_quality = sum(1 for q in qualities if q >= 0.7)
         medium_quality = sum(1 for q in qualities if 0.3 <= q < 0.7)
         low_quality = sum(1 for q in qualities if q < 0.3)
@@ -0,0 +1,81 @@
+"""
+Optional pysat reference backend for the example comparisons.
+
+The examples compare each research solver against one of bsat's own complete
+solvers. Passing --baseline=NAME (e.g. glucose4, cadical153) to an example
+driver swaps that comparison to the named pysat solver instead, which runs
+in C/C++ rather than Python. pysat is not a bsat dependency; without it the
+flag is ignored and the in-house solver is used.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from pysat.solvers import Solver as PySATSolver
+except ImportError:  # pysat is optional
+    PySATSolver = None
+
+
+# Selected pysat backend name (None = use the in-house solver)
+backend: Optional[str] = None
+
+
+def configure(argv: List[str]):
+    """Pick up a --baseline=NAME flag from the command line."""
+    for arg in argv:
+        if arg.startswith('--baseline='):
+            name = arg.split('=', 1)[1]
+            if PySATSolver is None:
+                print(f"Note: pysat is not installed; ignoring --baseline={name}")
+            else:
+                set_backend(name)
+
+
+def set_backend(name: Optional[str]):
+    """
+    Select the pysat backend (None = in-house solver).
+
+    Also the initializer for --parallel worker processes, which do not
+    inherit the selection under the spawn start method.
+    """
+    global backend
+    backend = name
+
+
+def to_pysat(cnf) -> Tuple[Dict[str, int], List[List[int]]]:
+    """
+    Map a CNFExpression to pysat's integer clauses.
+
+    Returns:
+        (var_id, clauses): variables numbered 1..n in sorted order, and the
+        clauses as signed integer lists
+    """
+    var_id = {var: i for i, var in enumerate(sorted(cnf.get_variables()), start=1)}
+    clauses = [[-var_id[lit.variable] if lit.negated else var_id[lit.variable]
+                for lit in clause.literals]
+               for clause in cnf.clauses]
+    return var_id, clauses
+
+
+def baseline_name(default: str) -> str:
+    """Name of the comparison solver that solve_baseline will run."""
+    return f"pysat {backend}" if backend else default
+
+
+def solve_baseline(cnf, solver_class) -> Optional[Dict[str, bool]]:
+    """
+    Solve with the selected pysat backend, or with solver_class(cnf) if none.
+
+    Returns:
+        Satisfying assignment if SAT, None if UNSAT
+    """
+    if backend is None:
+        return solver_class(cnf).solve()
+
+    var_id, clauses = to_pysat(cnf)
+    with PySATSolver(name=backend, bootstrap_with=clauses) as solver:
+        if not solver.solve():
+            return None
+        model = set(solver.get_model())
+
+    return {var: i in model for var, i in var_id.items()}
@@ -0,0 +1,88 @@
+"""
+Persistent result cache for the example drivers.
+
+Re-running an example script (during development, CI or documentation
+builds) repeats the same sampling and search on the same formulas. With
+--cache, solver results are stored in a shelve database under
+~/.cache/bsat/ keyed by solver, formula, parameters and a hash of the
+solver source, so repeat runs read them back instead of solving again and
+editing the solver invalidates its entries. Reported times are those of the
+run that filled the cache. Off by default.
+"""
+
+import os
+import shelve
+from functools import lru_cache
+from hashlib import blake2b
+from types import ModuleType
+from typing import Any, Callable, Iterable
+
+CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'bsat', 'examples.db')
+
+# Whether lookups hit the on-disk cache (set by the --cache flag)
+enabled = False
+
+
+def configure(argv):
+    """
+    Pick up a --cache flag from the command line.
+
+    Ignored together with --parallel: shelve databases do not support
+    concurrent writers.
+    """
+    global enabled
+    enabled = '--cache' in argv and '--parallel' not in argv
+
+
+@lru_cache(maxsize=None)
+def _source_hash(module: ModuleType) -> str:
+    """Hash of a module's source; for a package, of every .py file under it."""
+    paths = []
+    if hasattr(module, '__path__'):
+        for package_dir in module.__path__:
+            for root, dirs, files in os.walk(package_dir):
+                dirs.sort()
+                paths.extend(os.path.join(root, name) for name in sorted(files)
+                             if name.endswith('.py'))
+    else:
+        paths.append(module.__file__)
+
+    h = blake2b(digest_size=20)
+    for path in paths:
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def cache_key(*parts, sources: Iterable[ModuleType] = ()) -> str:
+    """
+    Stable key for a (solver, formula, parameters...) combination.
+
+    Args:
+        *parts: Values identifying the computation
+        sources: Modules or packages the result depends on; their source is
+            hashed into the key so code changes do not return stale results
+    """
+    versions = tuple(_source_hash(module) for module in sources)
+    return blake2b(repr((parts, versions)).encode('utf-8'), digest_size=20).hexdigest()
+
+
+def get_or_compute(key: str, compute_fn: Callable[[], Any]) -> Any:
+    """
+    Return the cached value for key, computing and storing it on a miss.
+
+    The database is not held open while compute_fn runs. When caching is
+    disabled this simply calls compute_fn.
+    """
+    if not enabled:
+        return compute_fn()
+
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    with shelve.open(CACHE_PATH) as db:
+        if key in db:
+            return db[key]
+
+    value = compute_fn()
+    with shelve.open(CACHE_PATH) as db:
+        db[key] = value
+    return value
@@ -0,0 +1,88 @@
+"""
+Helpers shared by the example drivers.
+
+Output decorations, formula parsing and the memoized reference solves (the
+"vs DPLL" / "vs CDCL" comparisons) are the same in every driver. Headers,
+banners and statistics are written with one sys.stdout.write each.
+"""
+
+import sys
+from functools import lru_cache
+from importlib import import_module
+from time import perf_counter_ns
+
+from bsat import CNFExpression
+
+HEADER_BAR = "=" * 70
+BLOCK_BAR = "█" * 70
+
+# Reference solvers by name: (module, class)
+REFERENCE_SOLVERS = {
+    'dpll': ('bsat.dpll', 'DPLLSolver'),
+    'cdcl': ('bsat.cdcl', 'CDCLSolver'),
+}
+
+# Small formula solved once before the timed examples
+WARMUP_FORMULA = "(w1 | w2) & (~w1 | w3) & (~w2 | ~w3)"
+
+
+def banner(title: str) -> str:
+    """Block-letter banner a driver prints before its examples."""
+    return "\n".join([
+        "\n" + BLOCK_BAR,
+        "█" + " " * 68 + "█",
+        "█" + f"  {title}".center(68) + "█",
+        "█" + "  Example Demonstrations".center(68) + "█",
+        "█" + " " * 68 + "█",
+        BLOCK_BAR,
+    ]) + "\n"
+
+
+def print_header(title):
+    """Print a formatted header."""
+    sys.stdout.write(f"\n{HEADER_BAR}\n  {title}\n{HEADER_BAR}\n")
+
+
+@lru_cache(maxsize=None)
+def parse_formula(formula_str):
+    """
+    Parse a formula string once per process.
+
+    The solvers only read the CNF, so every example (and every setting in a
+    sweep) can share the parsed object.
+    """
+    return CNFExpression.parse(formula_str)
+
+
+@lru_cache(maxsize=128)
+def solve_reference(formula_str, solver):
+    """
+    Solve formula_str with a reference solver and return (result, solve time).
+
+    The comparison run is memoized, so calling an example again in the same
+    process reuses the first result and its time instead of searching again.
+    The solver module is imported on first use.
+
+    Args:
+        formula_str: Formula to solve
+        solver: Key of REFERENCE_SOLVERS ('dpll' or 'cdcl')
+    """
+    module_name, class_name = REFERENCE_SOLVERS[solver]
+    solver_class = getattr(import_module(module_name), class_name)
+
+    instance = solver_class(parse_formula(formula_str))
+    start = perf_counter_ns()
+    result = instance.solve()
+    return result, (perf_counter_ns() - start) / 1e9
+
+
+def warm_up(solver_class, reference):
+    """
+    Solve a tiny formula once with solver_class and the reference solver.
+
+    The first solve in a process also pays one-time costs (lazy imports,
+    cold caches); doing it up front keeps them out of the first example's
+    comparison.
+    """
+    solver_class(parse_formula(WARMUP_FORMULA)).solve()
+    solve_reference(WARMUP_FORMULA, reference)
@@ -8,38 +8,61 @@ of formulas, showing when backbone detection helps and when it doesn't.
 
 import sys
 import os
+import io
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
 from time import time
 
 # Add paths for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+import bsat
+import bb_cdcl
 from bsat import CNFExpression
-from bsat.dpll import DPLLSolver
-from bb_cdcl import BBCDCLSolver
+from bsat.cnf import Clause, Literal
+from bb_cdcl import BBCDCLSolver, BackboneDetector
 
+import _baseline  # optional pysat reference backend
+import _cache  # optional on-disk result cache
+from _common import HEADER_BAR, banner, print_header
 
-def print_header(title):
-    """Print a formatted header."""
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70)
+BANNER = banner("BB-CDCL: Backbone-Based CDCL Solver")
 
 
 def print_stats(stats):
     """Print solver statistics in a formatted way."""
-    print("\nStatistics:")
-    print(f"  Samples Collected: {stats['num_samples']}")
-    print(f"  Backbone Detected: {stats['num_backbone_detected']} vars ({stats['backbone_percentage']:.1f}%)")
-    print(f"  Backbone Fixed: {stats['num_backbone_fixed']} vars")
-    print(f"  Used Backbone: {stats['used_backbone']}")
+    lines = []
+    lines.append("\nStatistics:")
+    lines.append(f"  Samples Collected: {stats['num_samples']}")
+    lines.append(f"  Backbone Detected: {stats['num_backbone_detected']} vars ({stats['backbone_percentage']:.1f}%)")
+    lines.append(f"  Backbone Fixed: {stats['num_backbone_fixed']} vars")
+    lines.append(f"  Used Backbone: {stats['used_backbone']}")
     if stats['used_backbone']:
-        print(f"  Search Space Reduction: 2^n → 2^n/{stats['search_space_reduction']}")
-        print(f"  Backbone Conflicts: {stats['backbone_conflicts']}")
-        print(f"  Backbone Backtracks: {stats['backbone_backtracks']}")
-    print(f"  Backbone Detection Time: {stats['backbone_detection_time']:.4f}s")
-    print(f"  Systematic Search Time: {stats['systematic_search_time']:.4f}s")
-    print(f"  Total Time: {stats['total_time']:.4f}s")
+        lines.append(f"  Search Space Reduction: 2^n → 2^n/{stats['search_space_reduction']}")
+        lines.append(f"  Backbone Conflicts: {stats['backbone_conflicts']}")
+        lines.append(f"  Backbone Backtracks: {stats['backbone_backtracks']}")
+    lines.append(f"  Backbone Detection Time: {stats['backbone_detection_time']:.4f}s")
+    lines.append(f"  Systematic Search Time: {stats['systematic_search_time']:.4f}s")
+    lines.append(f"  Total Time: {stats['total_time']:.4f}s")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def run_bb_cdcl(cnf, **params):
+    """
+    Solve with BB-CDCL and return (result, statistics, visualization data).
+
+    Goes through the on-disk example cache when --cache is given.
+    """
+    def compute():
+        solver = BBCDCLSolver(cnf, **params)
+        result = solver.solve()
+        return result, solver.get_statistics(), solver.get_visualization_data()
+
+    key = _cache.cache_key('BBCDCLSolver', str(cnf), sorted(params.items()),
+                           sources=(bb_cdcl, bsat))
+    return _cache.get_or_compute(key, compute)
 
 
 def example_1_strong_backbone():
@@ -51,6 +74,8 @@ def example_1_strong_backbone():
 
     Expected: High backbone detection, significant speedup
     """
+    from bsat.dpll import DPLLSolver  # only this example runs the reference solver
+
     print_header("Example 1: Strong Backbone Formula")
 
     formula_str = "(a) & (~a | b) & (~b | c) & (~c | d) & (d | e | f)"
@@ -72,11 +97,10 @@ def example_1_strong_backbone():
     print(f"Time: {bb_time:.4f}s")
     print_stats(bb_solver.get_statistics())
 
-    # Compare with DPLL
-    print("\nSolving with standard DPLL for comparison...")
-    dpll_solver = DPLLSolver(cnf)
+    # Compare with DPLL (or a pysat solver, see --baseline)
+    print(f"\nSolving with {_baseline.baseline_name('standard DPLL')} for comparison...")
     start = time()
-    result_dpll = dpll_solver.solve()
+    result_dpll = _baseline.solve_baseline(cnf, DPLLSolver)
     dpll_time = time() - start
 
     print(f"Result: {'SAT' if result_dpll else 'UNSAT'}")
@@ -104,14 +128,13 @@ def example_2_partial_backbone():
     cnf = CNFExpression.parse(formula_str)
 
     # Solve with BB-CDCL
-    bb_solver = BBCDCLSolver(cnf, num_samples=50)
-    result = bb_solver.solve()
+    result, stats, _ = run_bb_cdcl(cnf, num_samples=50)
 
     print(f"\nResult: {'SAT' if result else 'UNSAT'}")
     if result:
         print(f"Solution: {result}")
 
-    print_stats(bb_solver.get_statistics())
+    print_stats(stats)
 
 
 def example_3_no_backbone():
@@ -131,14 +154,39 @@ def example_3_no_backbone():
     cnf = CNFExpression.parse(formula_str)
 
     # Solve with BB-CDCL
-    bb_solver = BBCDCLSolver(cnf, num_samples=50)
-    result = bb_solver.solve()
+    result, stats, _ = run_bb_cdcl(cnf, num_samples=50)
 
     print(f"\nResult: {'SAT' if result else 'UNSAT'}")
     if result:
         print(f"Solution: {result}")
 
-    print_stats(bb_solver.get_statistics())
+    print_stats(stats)
+
+
+def planning_formula(horizon):
+    """
+    Build a planning formula directly from clauses (no string parsing).
+
+    s_t is the state reached at step t and a_t the action taken at step t.
+    The initial state s0 is fixed and the goal state s_horizon must hold.
+    Construction is O(horizon).
+    """
+    s = [f"s{t}" for t in range(horizon + 1)]
+    a = [f"a{t}" for t in range(horizon)]
+
+    clauses = [
+        Clause([Literal(s[0], False)]),                       # Initial: s0
+        Clause([Literal(s[0], True), Literal(a[0], False)]),  # s0 → a0
+    ]
+    for t in range(horizon):
+        # Transition t → t+1
+        clauses.append(Clause([Literal(a[t], True), Literal(s[t + 1], False)]))
+        clauses.append(Clause([Literal(s[t], True), Literal(s[t + 1], False)]))
+        if t + 1 < horizon:
+            clauses.append(Clause([Literal(s[t + 1], False), Literal(a[t + 1], False)]))
+    clauses.append(Clause([Literal(s[horizon], False)]))      # Goal
+
+    return CNFExpression(clauses)
 
 
 def example_4_planning_backbone():
@@ -151,31 +199,21 @@ def example_4_planning_backbone():
     """
     print_header("Example 4: Planning Formula with Goal Backbone")
 
-    # Initial: s0=T, a0 forced
-    # Goal: s3=T forces backwards
-    initial = "(s0) & (~s0 | a0)"
-    trans01 = "(~a0 | s1) & (~s0 | s1)"
-    trans12 = "(~a1 | s2) & (~s1 | s2)"
-    trans23 = "(~a2 | s3) & (~s2 | s3)"
-    goal = "(s3)"
-
-    formula_str = f"{initial} & {trans01} & (s1 | a1) & {trans12} & (s2 | a2) & {trans23} & {goal}"
     print(f"\nFormula (planning with fixed initial and goal):")
     print(f"  Initial: s0=T")
     print(f"  Goal: s3=T")
     print(f"  Expected backbone: All state variables s0, s1, s2, s3 = True")
 
-    cnf = CNFExpression.parse(formula_str)
+    cnf = planning_formula(horizon=3)
 
     # Solve with BB-CDCL
-    bb_solver = BBCDCLSolver(cnf, num_samples=50)
-    result = bb_solver.solve()
+    result, stats, _ = run_bb_cdcl(cnf, num_samples=50)
 
     print(f"\nResult: {'SAT' if result else 'UNSAT'}")
     if result:
         print(f"Solution: {result}")
 
-    print_stats(bb_solver.get_statistics())
+    print_stats(stats)
 
 
 def example_5_confidence_thresholds():
@@ -193,10 +231,16 @@ def example_5_confidence_thresholds():
 
     thresholds = [0.85, 0.90, 0.95, 0.99]
 
+    # Sampling does not depend on the threshold: sample once, then fork
+    # solvers that only redo the backbone decision for each threshold
+    detector = BackboneDetector(cnf, num_samples=50)
+    detector.detect_backbone()
+    template = BBCDCLSolver(cnf, num_samples=50, detector=detector)
+
     for threshold in thresholds:
         print(f"\n--- Confidence Threshold: {threshold:.2f} ({threshold*100:.0f}%) ---")
 
-        bb_solver = BBCDCLSolver(cnf, num_samples=50, confidence_threshold=threshold)
+        bb_solver = template.fork(confidence_threshold=threshold)
         result = bb_solver.solve()
 
         stats = bb_solver.get_statistics()
@@ -219,14 +263,10 @@ def example_6_visualization_data():
     cnf = CNFExpression.parse(formula_str)
 
     # Solve with BB-CDCL
-    bb_solver = BBCDCLSolver(cnf, num_samples=50)
-    result = bb_solver.solve()
+    result, _, viz_data = run_bb_cdcl(cnf, num_samples=50)
 
     print(f"\nResult: {'SAT' if result else 'UNSAT'}")
 
-    # Get visualization data
-    viz_data = bb_solver.get_visualization_data()
-
     print("\nPer-Variable Confidence Scores:")
     print(f"{'Variable':<10} {'Conf(T)':<10} {'Conf(F)':<10} {'Max':<10} {'Backbone?':<12} {'Value':<10}")
     print("-" * 70)
@@ -263,42 +303,67 @@ def example_7_unsat_instance():
 
     # Solve with BB-CDCL
     print("\nSolving with BB-CDCL...")
-    bb_solver = BBCDCLSolver(cnf, num_samples=50)
-    result = bb_solver.solve()
+    result, stats, _ = run_bb_cdcl(cnf, num_samples=50)
 
     print(f"\nResult: {'SAT' if result else 'UNSAT'}")
 
-    stats = bb_solver.get_statistics()
     print(f"\nNote: Collected {stats['num_samples']} samples")
     if stats['num_samples'] == 0:
         print("  → WalkSAT found no solutions (good sign for UNSAT)")
     else:
         print("  → WalkSAT may have found false solutions (incomplete solver)")
 
-    print_stats(bb_solver.get_statistics())
+    print_stats(stats)
+
+
+EXAMPLES = [
+    example_1_strong_backbone,
+    example_2_partial_backbone,
+    example_3_no_backbone,
+    example_4_planning_backbone,
+    example_5_confidence_thresholds,
+    example_6_visualization_data,
+    example_7_unsat_instance,
+]
+
+
+def _run_captured(example):
+    """Run one example and return everything it printed."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        example()
+    return buffer.getvalue()
 
 
 def main():
-    """Run all examples."""
-    print("\n" + "█" * 70)
-    print("█" + " " * 68 + "█")
-    print("█" + "  BB-CDCL: Backbone-Based CDCL Solver".center(68) + "█")
-    print("█" + "  Example Demonstrations".center(68) + "█")
-    print("█" + " " * 68 + "█")
-    print("█" * 70)
+    """
+    Run all examples.
+
+    Flags: --parallel runs them in worker processes; --baseline=NAME compares
+    against the named pysat solver (e.g. glucose4, cadical153) if installed;
+    --cache reuses solver results stored by earlier runs.
+    """
+    parallel = '--parallel' in sys.argv[1:]
+    _baseline.configure(sys.argv[1:])
+    _cache.configure(sys.argv[1:])
+
+    sys.stdout.write(BANNER)
 
     try:
-        example_1_strong_backbone()
-        example_2_partial_backbone()
-        example_3_no_backbone()
-        example_4_planning_backbone()
-        example_5_confidence_thresholds()
-        example_6_visualization_data()
-        example_7_unsat_instance()
-
-        print("\n" + "=" * 70)
-        print("  All examples completed successfully!")
-        print("=" * 70 + "\n")
+        if parallel:
+            # Examples are independent; run them in worker processes and
+            # print each one's captured output in the usual order
+            max_workers = min(len(EXAMPLES), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=_baseline.set_backend,
+                                     initargs=(_baseline.backend,)) as executor:
+                for output in executor.map(_run_captured, EXAMPLES):
+                    sys.stdout.write(output)
+        else:
+            for example in EXAMPLES:
+                example()
+
+        sys.stdout.write(f"\n{HEADER_BAR}\n  All examples completed successfully!\n{HEADER_BAR}\n\n")
 
     except Exception as e:
         print(f"\n❌ Error: {e}")
@@ -8,6 +8,9 @@ showing how graph metrics guide variable selection and when this helps.
 
 import sys
 import os
+import io
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
 from time import time
 
 # Add paths for imports
@@ -15,36 +18,37 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from bsat import CNFExpression
-from bsat.cdcl import CDCLSolver
+from bsat.cnf import Clause, Literal
 from cgpm_sat import CGPMSolver
 
+import _baseline  # optional pysat reference backend
+from _common import HEADER_BAR, banner, print_header
 
-def print_header(title):
-    """Print a formatted header."""
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70)
+BANNER = banner("CGPM-SAT: Conflict Graph Pattern Mining SAT")
 
 
 def print_stats(stats):
     """Print solver statistics in a formatted way."""
-    print("\nStatistics:")
-    print(f"  Decisions Made: {stats['decisions_made']}")
-    print(f"  Graph Influenced Decisions: {stats['graph_influenced_decisions']} ({stats['graph_influence_rate']:.1f}%)")
-    print(f"  Graph Updates: {stats['graph_updates']}")
-    print(f"  Graph Queries: {stats['graph_queries']}")
-    print(f"  Graph Construction Time: {stats['graph_construction_time']:.4f}s")
-    print(f"  Total Time: {stats['total_time']:.4f}s")
-    print(f"  Graph Overhead: {stats['graph_overhead_percentage']:.1f}%")
+    lines = []
+    lines.append("\nStatistics:")
+    lines.append(f"  Decisions Made: {stats['decisions_made']}")
+    lines.append(f"  Graph Influenced Decisions: {stats['graph_influenced_decisions']} ({stats['graph_influence_rate']:.1f}%)")
+    lines.append(f"  Graph Updates: {stats['graph_updates']}")
+    lines.append(f"  Graph Queries: {stats['graph_queries']}")
+    lines.append(f"  Graph Construction Time: {stats['graph_construction_time']:.4f}s")
+    lines.append(f"  Total Time: {stats['total_time']:.4f}s")
+    lines.append(f"  Graph Overhead: {stats['graph_overhead_percentage']:.1f}%")
 
     # Graph statistics
     graph_stats = stats['graph_statistics']
-    print(f"\n  Conflict Graph:")
-    print(f"    Variables: {graph_stats['num_variables']}")
-    print(f"    Edges: {graph_stats['num_edges']}")
-    print(f"    Avg Degree: {graph_stats['avg_degree']:.2f}")
-    print(f"    Max Degree: {graph_stats['max_degree']}")
-    print(f"    Density: {graph_stats['graph_density']:.4f}")
+    lines.append(f"\n  Conflict Graph:")
+    lines.append(f"    Variables: {graph_stats['num_variables']}")
+    lines.append(f"    Edges: {graph_stats['num_edges']}")
+    lines.append(f"    Avg Degree: {graph_stats['avg_degree']:.2f}")
+    lines.append(f"    Max Degree: {graph_stats['max_degree']}")
+    lines.append(f"    Density: {graph_stats['graph_density']:.4f}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def example_1_structured_conflicts():
@@ -54,6 +58,8 @@ def example_1_structured_conflicts():
     Some variables appear in many clauses together, creating clear graph structure.
     Expected: Graph metrics identify important variables.
     """
+    from bsat.cdcl import CDCLSolver  # only this example runs the reference solver
+
     print_header("Example 1: Structured Conflicts")
 
     # Formula where 'a' is central (appears with many others)
@@ -80,11 +86,10 @@ def example_1_structured_conflicts():
     top_vars = cgpm_solver.get_top_variables_by_graph(k=3)
     print(f"\nTop 3 variables by PageRank: {top_vars}")
 
-    # Compare with pure CDCL
-    print("\nSolving with pure CDCL for comparison...")
-    cdcl_solver = CDCLSolver(cnf)
+    # Compare with pure CDCL (or a pysat solver, see --baseline)
+    print(f"\nSolving with {_baseline.baseline_name('pure CDCL')} for comparison...")
     start = time()
-    result_cdcl = cdcl_solver.solve()
+    result_cdcl = _baseline.solve_baseline(cnf, CDCLSolver)
     cdcl_time = time() - start
 
     print(f"Result: {'SAT' if result_cdcl else 'UNSAT'}")
@@ -129,20 +134,23 @@ def example_3_circuit_like():
     """
     print_header("Example 3: Circuit-like Structure")
 
-    # Circuit: AND gates and connections
-    gate1 = "(~a | ~b | g1)"  # g1 = a AND b
-    gate2 = "(~c | ~d | g2)"  # g2 = c AND d
-    output = "(~g1 | ~g2 | out)"  # out = g1 AND g2
-    inputs = "(a) & (b) & (c)"  # Fixed inputs
-
-    formula_str = f"{gate1} & {gate2} & {output} & {inputs}"
+    # Circuit: AND gates and connections, built directly from clauses
+    def and_gate(x, y, out):
+        return Clause([Literal(x, True), Literal(y, True), Literal(out, False)])
+
+    cnf = CNFExpression([
+        and_gate('a', 'b', 'g1'),       # g1 = a AND b
+        and_gate('c', 'd', 'g2'),       # g2 = c AND d
+        and_gate('g1', 'g2', 'out'),    # out = g1 AND g2
+        Clause([Literal('a', False)]),  # Fixed inputs
+        Clause([Literal('b', False)]),
+        Clause([Literal('c', False)]),
+    ])
     print(f"\nFormula (circuit with 2 AND gates):")
     print(f"  g1 = a AND b")
     print(f"  g2 = c AND d")
     print(f"  out = g1 AND g2")
 
-    cnf = CNFExpression.parse(formula_str)
-
     # Solve with CGPM-SAT
     cgpm_solver = CGPMSolver(cnf, graph_weight=0.7, update_frequency=5)
     result = cgpm_solver.solve()
@@ -318,28 +326,53 @@ def example_8_disable_graph():
     print_stats(solver.get_statistics())
 
 
+EXAMPLES = [
+    example_1_structured_conflicts,
+    example_2_no_structure,
+    example_3_circuit_like,
+    example_4_graph_weight_comparison,
+    example_5_update_frequency,
+    example_6_graph_metrics,
+    example_7_graph_visualization_export,
+    example_8_disable_graph,
+]
+
+
+def _run_captured(example):
+    """Run one example and return everything it printed."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        example()
+    return buffer.getvalue()
+
+
 def main():
-    """Run all examples."""
-    print("\n" + "█" * 70)
-    print("█" + " " * 68 + "█")
-    print("█" + "  CGPM-SAT: Conflict Graph Pattern Mining SAT".center(68) + "█")
-    print("█" + "  Example Demonstrations".center(68) + "█")
-    print("█" + " " * 68 + "█")
-    print("█" * 70)
+    """
+    Run all examples.
+
+    Flags: --parallel runs them in worker processes; --baseline=NAME compares
+    against the named pysat solver (e.g. glucose4, cadical153) if installed.
+    """
+    parallel = '--parallel' in sys.argv[1:]
+    _baseline.configure(sys.argv[1:])
+
+    sys.stdout.write(BANNER)
 
     try:
-        example_1_structured_conflicts()
-        example_2_no_structure()
-        example_3_circuit_like()
-        example_4_graph_weight_comparison()
-        example_5_update_frequency()
-        example_6_graph_metrics()
-        example_7_graph_visualization_export()
-        example_8_disable_graph()
-
-        print("\n" + "=" * 70)
-        print("  All examples completed successfully!")
-        print("=" * 70 + "\n")
+        if parallel:
+            # Examples are independent; run them in worker processes and
+            # print each one's captured output in the usual order
+            max_workers = min(len(EXAMPLES), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=_baseline.set_backend,
+                                     initargs=(_baseline.backend,)) as executor:
+                for output in executor.map(_run_captured, EXAMPLES):
+                    sys.stdout.write(output)
+        else:
+            for example in EXAMPLES:
+                example()
+
+        sys.stdout.write(f"\n{HEADER_BAR}\n  All examples completed successfully!\n{HEADER_BAR}\n\n")
 
     except Exception as e:
         print(f"\n❌ Error: {e}")
@@ -8,36 +8,60 @@ various types of formulas, showing when it excels and when it falls back.
 
 import sys
 import os
-from time import time
+from functools import lru_cache
+from time import perf_counter_ns
 
 # Add paths for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from bsat import CNFExpression
-from bsat.dpll import DPLLSolver
-from cobd_sat import CoBDSATSolver
+from cobd_sat import CoBDSATSolver, CommunityDetector
 
+from _common import (HEADER_BAR, banner, print_header, parse_formula,
+                     solve_reference, warm_up)
 
-def print_header(title):
-    """Print a formatted header."""
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70)
+BANNER = banner("CoBD-SAT: Community-Based Decomposition SAT Solver")
+
+# print_stats templates, filled straight from the statistics dict
+STATS_TEMPLATE = (
+    "\nStatistics:\n"
+    "  Communities: {num_communities}\n"
+    "  Modularity Q: {modularity:.3f}\n"
+    "  Interface Variables: {num_interface_vars} ({interface_percentage:.1f}%)\n"
+    "  Used Decomposition: {used_decomposition}\n"
+)
+FALLBACK_TEMPLATE = "  Fallback Reason: {fallback_reason}\n"
+DECOMPOSITION_TEMPLATE = (
+    "  Interface Assignments Tried: {interface_assignments_tried}\n"
+    "  Community Solve Attempts: {community_solve_attempts}\n"
+)
+
+
+# Community detection runs per formula; the highest-modularity partition is kept
+PARTITION_ATTEMPTS = 4
+
+
+@lru_cache(maxsize=None)
+def _detector(formula_str):
+    """
+    Community detector for a formula, shared by every CoBD solve of it.
+
+    Once a solve has detected communities, later solves of the same formula
+    with the same community bounds reuse that partition instead of rebuilding
+    the graph and running modularity optimization again.
+    """
+    return CommunityDetector(parse_formula(formula_str), num_attempts=PARTITION_ATTEMPTS)
 
 
 def print_stats(stats):
     """Print solver statistics in a formatted way."""
-    print("\nStatistics:")
-    print(f"  Communities: {stats['num_communities']}")
-    print(f"  Modularity Q: {stats['modularity']:.3f}")
-    print(f"  Interface Variables: {stats['num_interface_vars']} ({stats['interface_percentage']:.1f}%)")
-    print(f"  Used Decomposition: {stats['used_decomposition']}")
-    if not stats['used_decomposition'] and stats['fallback_reason']:
-        print(f"  Fallback Reason: {stats['fallback_reason']}")
+    text = STATS_TEMPLATE.format_map(stats)
     if stats['used_decomposition']:
-        print(f"  Interface Assignments Tried: {stats['interface_assignments_tried']}")
-        print(f"  Community Solve Attempts: {stats['community_solve_attempts']}")
+        text += DECOMPOSITION_TEMPLATE.format_map(stats)
+    elif stats['fallback_reason']:
+        text += FALLBACK_TEMPLATE.format_map(stats)
+
+    sys.stdout.write(text)
 
 
 def example_1_modular_formula():
@@ -56,14 +80,14 @@ def example_1_modular_formula():
     formula_str = "(a | b) & (a | c) & (b | c) & (c | d) & (d | e) & (d | f) & (e | f)"
     print(f"\nFormula: {formula_str}")
 
-    cnf = CNFExpression.parse(formula_str)
+    cnf = parse_formula(formula_str)
 
     # Solve with CoBD-SAT
     print("\nSolving with CoBD-SAT...")
-    cobd_solver = CoBDSATSolver(cnf)
-    start = time()
+    cobd_solver = CoBDSATSolver(cnf, detector=_detector(formula_str))
+    start = perf_counter_ns()
     result = cobd_solver.solve()
-    cobd_time = time() - start
+    cobd_time = (perf_counter_ns() - start) / 1e9
 
     print(f"Result: {'SAT' if result else 'UNSAT'}")
     if result:
@@ -73,10 +97,7 @@ def example_1_modular_formula():
 
     # Compare with standard DPLL
     print("\nSolving with standard DPLL for comparison...")
-    dpll_solver = DPLLSolver(cnf)
-    start = time()
-    result_dpll = dpll_solver.solve()
-    dpll_time = time() - start
+    result_dpll, dpll_time = solve_reference(formula_str, 'dpll')
 
     print(f"Result: {'SAT' if result_dpll else 'UNSAT'}")
     print(f"Time: {dpll_time:.4f}s")
@@ -99,10 +120,10 @@ def example_2_chain_formula():
     formula_str = "(a) & (~a | b) & (~b | c) & (~c | d) & (~d | e) & (~e | f)"
     print(f"\nFormula: {formula_str}")
 
-    cnf = CNFExpression.parse(formula_str)
+    cnf = parse_formula(formula_str)
 
     # Solve with CoBD-SAT
-    cobd_solver = CoBDSATSolver(cnf, max_communities=6)
+    cobd_solver = CoBDSATSolver(cnf, max_communities=6, detector=_detector(formula_str))
     result = cobd_solver.solve()
 
     print(f"\nResult: {'SAT' if result else 'UNSAT'}")
@@ -127,10 +148,10 @@ def example_3_random_formula():
     formula_str = "(a | b | c) & (a | d | e) & (b | d | f) & (c | e | f) & (a | b | f) & (c | d | e) & (~a | ~b | d) & (~c | ~d | f) & (~e | ~f | b)"
     print(f"\nFormula: {formula_str}")
 
-    cnf = CNFExpression.parse(formula_str)
+    cnf = parse_formula(formula_str)
 
     # Solve with CoBD-SAT
-    cobd_solver = CoBDSATSolver(cnf)
+    cobd_solver = CoBDSATSolver(cnf, detector=_detector(formula_str))
     result = cobd_solver.solve()
 
     print(f"\nResult: {'SAT' if result else 'UNSAT'}")
@@ -167,17 +188,17 @@ def example_4_circuit_like():
     # Module 4: Output combining
     m4 = "(out1 | out2) & (~out1 | final) & (~out2 | final)"
 
-    formula_str = f"{m1} & {m2} & {m3} & {m4}"
+    formula_str = " & ".join((m1, m2, m3, m4))
     print(f"\nFormula (4 modules):")
     print(f"  Module 1 (Input):  {m1}")
     print(f"  Module 2 (Logic1): {m2}")
     print(f"  Module 3 (Logic2): {m3}")
     print(f"  Module 4 (Output): {m4}")
 
-    cnf = CNFExpression.parse(formula_str)
+    cnf = parse_formula(formula_str)
 
     # Solve with CoBD-SAT
-    cobd_solver = CoBDSATSolver(cnf, max_communities=4)
+    cobd_solver = CoBDSATSolver(cnf, max_communities=4, detector=_detector(formula_str))
     result = cobd_solver.solve()
 
     print(f"\nResult: {'SAT' if result else 'UNSAT'}")
@@ -229,7 +250,7 @@ def example_5_planning_like():
     # Time 3: Goal
     t3 = "(s3)"
 
-    formula_str = f"{t0} & {trans01} & {t1} & {trans12} & {t2} & {trans23} & {t3}"
+    formula_str = " & ".join((t0, trans01, t1, trans12, t2, trans23, t3))
     print(f"\nFormula (4 time steps):")
     print(f"  T0: {t0}")
     print(f"  T0→T1: {trans01}")
@@ -239,10 +260,10 @@ def example_5_planning_like():
     print(f"  T2→T3: {trans23}")
     print(f"  T3: {t3}")
 
-    cnf = CNFExpression.parse(formula_str)
+    cnf = parse_formula(formula_str)
 
     # Solve with CoBD-SAT
-    cobd_solver = CoBDSATSolver(cnf, max_communities=4)
+    cobd_solver = CoBDSATSolver(cnf, max_communities=4, detector=_detector(formula_str))
     result = cobd_solver.solve()
 
     print(f"\nResult: {'SAT' if result else 'UNSAT'}")
@@ -263,8 +284,8 @@ def example_6_visualization_data():
     formula_str = "(a | b) & (b | c) & (c | d) & (d | e) & (e | f)"
     print(f"\nFormula: {formula_str}")
 
-    cnf = CNFExpression.parse(formula_str)
-    solver = CoBDSATSolver(cnf)
+    cnf = parse_formula(formula_str)
+    solver = CoBDSATSolver(cnf, detector=_detector(formula_str))
     result = solver.solve()
 
     # Get visualization data
@@ -275,35 +296,41 @@ def example_6_visualization_data():
     print(f"  Edges: {len(viz_data['edges'])}")
     print(f"\nNode types:")
 
-    var_nodes = [n for n in viz_data['nodes'] if n['type'] == 'variable']
-    clause_nodes = [n for n in viz_data['nodes'] if n['type'] == 'clause']
+    # One pass over the nodes: count each type, keep the first 3 as samples
+    var_nodes, clause_nodes = [], []
+    num_var_nodes = num_clause_nodes = 0
+    for node in viz_data['nodes']:
+        node_type = node['type']
+        if node_type == 'variable':
+            num_var_nodes += 1
+            if len(var_nodes) < 3:
+                var_nodes.append(node)
+        elif node_type == 'clause':
+            num_clause_nodes += 1
+            if len(clause_nodes) < 3:
+                clause_nodes.append(node)
 
-    print(f"  Variables: {len(var_nodes)}")
-    print(f"  Clauses: {len(clause_nodes)}")
+    print(f"  Variables: {num_var_nodes}")
+    print(f"  Clauses: {num_clause_nodes}")
 
-    print(f"\nSample variable nodes:")
-    for node in var_nodes[:3]:
-        print(f"    {node}")
+    sys.stdout.write("\nSample variable nodes:\n")
+    sys.stdout.writelines(f"    {node}\n" for node in var_nodes)
 
-    print(f"\nSample clause nodes:")
-    for node in clause_nodes[:3]:
-        print(f"    {node}")
+    sys.stdout.write("\nSample clause nodes:\n")
+    sys.stdout.writelines(f"    {node}\n" for node in clause_nodes)
 
-    print(f"\nCommunity distribution:")
-    for comm_id, members in viz_data['statistics']['vars_per_community'].items():
-        print(f"  Community {comm_id}: {members} variables")
+    sys.stdout.write("\nCommunity distribution:\n")
+    sys.stdout.writelines(f"  Community {comm_id}: {members} variables\n"
+                          for comm_id, members in viz_data['statistics']['vars_per_community'].items())
 
 
 def main():
     """Run all examples."""
-    print("\n" + "█" * 70)
-    print("█" + " " * 68 + "█")
-    print("█" + "  CoBD-SAT: Community-Based Decomposition SAT Solver".center(68) + "█")
-    print("█" + "  Example Demonstrations".center(68) + "█")
-    print("█" + " " * 68 + "█")
-    print("█" * 70)
+    sys.stdout.write(BANNER)
 
     try:
+        warm_up(CoBDSATSolver, 'dpll')
+
         example_1_modular_formula()
         example_2_chain_formula()
         example_3_random_formula()
@@ -311,9 +338,7 @@ def main():
         example_5_planning_like()
         example_6_visualization_data()
 
-        print("\n" + "=" * 70)
-        print("  All examples completed successfully!")
-        print("=" * 70 + "\n")
+        sys.stdout.write(f"\n{HEADER_BAR}\n  All examples completed successfully!\n{HEADER_BAR}\n\n")
 
     except Exception as e:
         print(f"\n❌ Error: {e}")
@@ -8,44 +8,95 @@ of formulas, showing when lookahead helps and when it adds overhead.
 
 import sys
 import os
-from time import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from time import perf_counter_ns
 
 # Add paths for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from bsat import CNFExpression
-from bsat.cdcl import CDCLSolver
-from la_cdcl import LACDCLSolver
+from la_cdcl import LACDCLSolver, prepare_formula
 
+from _common import (HEADER_BAR, banner, print_header, parse_formula,
+                     solve_reference, warm_up)
 
-def print_header(title):
-    """Print a formatted header."""
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70)
+BANNER = banner("LA-CDCL: Lookahead-Enhanced CDCL Solver")
+
+# print_stats template, filled straight from the statistics dict (including
+# the nested lookahead engine statistics)
+STATS_TEMPLATE = (
+    "\nStatistics:\n"
+    "  Decisions Made: {decisions_made}\n"
+    "  Lookahead Used: {lookahead_used} ({lookahead_percentage:.1f}%)\n"
+    "  Lookahead Skipped: {lookahead_skipped}\n"
+    "  Total Conflicts: {conflicts_total}\n"
+    "  Lookahead Time: {lookahead_time:.4f}s\n"
+    "  CDCL Time: {cdcl_time:.4f}s\n"
+    "  Total Time: {total_time:.4f}s\n"
+    "  Lookahead Overhead: {lookahead_overhead_percentage:.1f}%\n"
+    "\n"
+    "  Lookahead Engine:\n"
+    "    Total Lookaheads: {lookahead_engine_stats[total_lookaheads]}\n"
+    "    Cache Hits: {lookahead_engine_stats[cache_hits]}\n"
+    "    Cache Misses: {lookahead_engine_stats[cache_misses]}\n"
+    "    Cache Hit Rate: {lookahead_engine_stats[cache_hit_rate]:.1f}%\n"
+    "    Avg Propagations/Lookahead: {lookahead_engine_stats[avg_propagations_per_lookahead]:.2f}\n"
+)
+
+
+# Sweep settings run in worker processes when --parallel is given
+parallel_sweeps = False
+
+
+@lru_cache(maxsize=None)
+def _prepare(formula_str):
+    """Formula data shared by every solver of a sweep (see prepare_formula)."""
+    return prepare_formula(parse_formula(formula_str))
+
+
+def _timed_solve(solver):
+    """Run solver and return (result, statistics, solve time)."""
+    start = perf_counter_ns()
+    result = solver.solve()
+    solve_time = (perf_counter_ns() - start) / 1e9
+    return result, solver.get_statistics(), solve_time
+
+
+def _run_la(formula_str, params):
+    """Solve one sweep setting and return (result, statistics, solve time)."""
+    prepared = _prepare(formula_str)
+    return _timed_solve(LACDCLSolver(prepared.cnf, prepared=prepared, **params))
+
+
+def run_sweep(formula_str, settings):
+    """
+    Solve formula_str once per LACDCLSolver keyword set in settings.
+
+    Serially, one solver is built and reset to each setting in turn (see
+    LACDCLSolver.reset_search_state). The settings are independent, so with
+    --parallel they are spread over worker processes instead. The formula
+    is passed as a string, which every worker parses once. Results come
+    back in the order of settings.
+    """
+    if not parallel_sweeps:
+        prepared = _prepare(formula_str)
+        solver = LACDCLSolver(prepared.cnf, prepared=prepared, **settings[0])
+        runs = []
+        for params in settings:
+            solver.reset_search_state(**params)
+            runs.append(_timed_solve(solver))
+        return runs
+
+    max_workers = min(len(settings), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_run_la, repeat(formula_str), settings))
 
 
 def print_stats(stats):
     """Print solver statistics in a formatted way."""
-    print("\nStatistics:")
-    print(f"  Decisions Made: {stats['decisions_made']}")
-    print(f"  Lookahead Used: {stats['lookahead_used']} ({stats['lookahead_percentage']:.1f}%)")
-    print(f"  Lookahead Skipped: {stats['lookahead_skipped']}")
-    print(f"  Total Conflicts: {stats['conflicts_total']}")
-    print(f"  Lookahead Time: {stats['lookahead_time']:.4f}s")
-    print(f"  CDCL Time: {stats['cdcl_time']:.4f}s")
-    print(f"  Total Time: {stats['total_time']:.4f}s")
-    print(f"  Lookahead Overhead: {stats['lookahead_overhead_percentage']:.1f}%")
-
-    # Lookahead engine stats
-    la_stats = stats['lookahead_engine_stats']
-    print(f"\n  Lookahead Engine:")
-    print(f"    Total Lookaheads: {la_stats['total_lookaheads']}")
-    print(f"    Cache Hits: {la_stats['cache_hits']}")
-    print(f"    Cache Misses: {la_stats['cache_misses']}")
-    print(f"    Cache Hit Rate: {la_stats['cache_hit_rate']:.1f}%")
-    print(f"    Avg Propagations/Lookahead: {la_stats['avg_propagations_per_lookahead']:.2f}")
+    sys.stdout.write(STATS_TEMPLATE.format_map(stats))
 
 
 def example_1_hard_sat():
@@ -62,14 +113,14 @@ def example_1_hard_sat():
     print(f"\nFormula: {formula_str}")
     print("Expected: Lookahead helps make better decisions")
 
-    cnf = CNFExpression.parse(formula_str)
+    cnf = parse_formula(formula_str)
 
     # Solve with LA-CDCL
     print("\nSolving with LA-CDCL (depth=2, candidates=5)...")
     la_solver = LACDCLSolver(cnf, lookahead_depth=2, num_candidates=5)
-    start = time()
+    start = perf_counter_ns()
     result = la_solver.solve()
-    la_time = time() - start
+    la_time = (perf_counter_ns() - start) / 1e9
 
     print(f"\nResult: {'SAT' if result else 'UNSAT'}")
     if result:
@@ -79,10 +130,7 @@ def example_1_hard_sat():
 
     # Compare with pure CDCL
     print("\nSolving with pure CDCL for comparison...")
-    cdcl_solver = CDCLSolver(cnf)
-    start = time()
-    result_cdcl = cdcl_solver.solve()
-    cdcl_time = time() - start
+    result_cdcl, cdcl_time = solve_reference(formula_str, 'cdcl')
 
     print(f"Result: {'SAT' if result_cdcl else 'UNSAT'}")
     print(f"Time: {cdcl_time:.4f}s")
@@ -104,14 +152,14 @@ def example_2_easy_sat():
     print(f"\nFormula: {formula_str}")
     print("Expected: Lookahead adds overhead (no benefit)")
 
-    cnf = CNFExpression.parse(formula_str)
+    cnf = parse_formula(formula_str)
 
     # Solve with LA-CDCL
     print("\nSolving with LA-CDCL...")
     la_solver = LACDCLSolver(cnf, lookahead_depth=2, num_candidates=5)
-    start = time()
+    start = perf_counter_ns()
     result = la_solver.solve()
-    la_time = time() - start
+    la_time = (perf_counter_ns() - start) / 1e9
 
     print(f"\nResult: {'SAT' if result else 'UNSAT'}")
     if result:
@@ -121,10 +169,7 @@ def example_2_easy_sat():
 
     # Compare with pure CDCL
     print("\nSolving with pure CDCL for comparison...")
-    cdcl_solver = CDCLSolver(cnf)
-    start = time()
-    result_cdcl = cdcl_solver.solve()
-    cdcl_time = time() - start
+    result_cdcl, cdcl_time = solve_reference(formula_str, 'cdcl')
 
     print(f"Result: {'SAT' if result_cdcl else 'UNSAT'}")
     print(f"Time: {cdcl_time:.4f}s")
@@ -147,7 +192,7 @@ def example_3_propagation_heavy():
     print(f"\nFormula: {formula_str}")
     print("Expected: Lookahead reveals long propagation chains")
 
-    cnf = CNFExpression.parse(formula_str)
+    cnf = parse_formula(formula_str)
 
     # Solve with LA-CDCL
     la_solver = LACDCLSolver(cnf, lookahead_depth=3, num_candidates=5)
@@ -172,19 +217,12 @@ def example_4_depth_comparison():
     formula_str = "(a | b | c) & (~a | d | e) & (~b | ~d | f) & (~c | ~e | ~f) & (a | ~b | d) & (~a | c | ~e)"
     print(f"\nFormula: {formula_str}")
 
-    cnf = CNFExpression.parse(formula_str)
-
     depths = [1, 2, 3]
+    runs = run_sweep(formula_str, [dict(lookahead_depth=depth, num_candidates=5)
+                                   for depth in depths])
 
-    for depth in depths:
+    for depth, (result, stats, solve_time) in zip(depths, runs):
         print(f"\n--- Lookahead Depth: {depth} ---")
-
-        solver = LACDCLSolver(cnf, lookahead_depth=depth, num_candidates=5)
-        start = time()
-        result = solver.solve()
-        solve_time = time() - start
-
-        stats = solver.get_statistics()
         print(f"  Result: {'SAT' if result else 'UNSAT'}")
         print(f"  Time: {solve_time:.4f}s")
         print(f"  Decisions: {stats['decisions_made']}")
@@ -205,19 +243,12 @@ def example_5_candidate_comparison():
     formula_str = "(a | b | c) & (~a | d) & (~b | e) & (~c | f) & (d | e | f) & (~d | ~e) & (~e | ~f)"
     print(f"\nFormula: {formula_str}")
 
-    cnf = CNFExpression.parse(formula_str)
-
     candidates_list = [1, 3, 5, 10]
+    runs = run_sweep(formula_str, [dict(lookahead_depth=2, num_candidates=num_candidates)
+                                   for num_candidates in candidates_list])
 
-    for num_candidates in candidates_list:
+    for num_candidates, (result, stats, solve_time) in zip(candidates_list, runs):
         print(f"\n--- Number of Candidates: {num_candidates} ---")
-
-        solver = LACDCLSolver(cnf, lookahead_depth=2, num_candidates=num_candidates)
-        start = time()
-        result = solver.solve()
-        solve_time = time() - start
-
-        stats = solver.get_statistics()
         print(f"  Result: {'SAT' if result else 'UNSAT'}")
         print(f"  Time: {solve_time:.4f}s")
         print(f"  Total Lookaheads: {stats['lookahead_engine_stats']['total_lookaheads']}")
@@ -236,19 +267,12 @@ def example_6_adaptive_frequency():
     formula_str = "(a | b | c | d) & (~a | ~b | e) & (~c | ~d | f) & (e | f | g) & (~e | ~f | ~g) & (a | ~c | ~e)"
     print(f"\nFormula: {formula_str}")
 
-    cnf = CNFExpression.parse(formula_str)
-
     frequencies = [1, 3, 5]
+    runs = run_sweep(formula_str, [dict(lookahead_depth=2, num_candidates=5, lookahead_frequency=freq)
+                                   for freq in frequencies])
 
-    for freq in frequencies:
+    for freq, (result, stats, solve_time) in zip(frequencies, runs):
         print(f"\n--- Lookahead Frequency: Every {freq} decision(s) ---")
-
-        solver = LACDCLSolver(cnf, lookahead_depth=2, num_candidates=5, lookahead_frequency=freq)
-        start = time()
-        result = solver.solve()
-        solve_time = time() - start
-
-        stats = solver.get_statistics()
         print(f"  Result: {'SAT' if result else 'UNSAT'}")
         print(f"  Time: {solve_time:.4f}s")
         print(f"  Lookahead Used: {stats['lookahead_used']} / {stats['decisions_made']}")
@@ -267,7 +291,7 @@ def example_7_disable_lookahead():
     formula_str = "(a | b) & (~a | c) & (~b | d) & (~c | ~d) & (a | d)"
     print(f"\nFormula: {formula_str}")
 
-    cnf = CNFExpression.parse(formula_str)
+    cnf = parse_formula(formula_str)
 
     # LA-CDCL with lookahead disabled
     print("\nSolving with LA-CDCL (lookahead disabled)...")
@@ -292,7 +316,7 @@ def example_8_visualization_data():
     formula_str = "(a | b | c) & (~a | d) & (~b | e) & (~c | ~d | ~e)"
     print(f"\nFormula: {formula_str}")
 
-    cnf = CNFExpression.parse(formula_str)
+    cnf = parse_formula(formula_str)
 
     # Solve with LA-CDCL
     solver = LACDCLSolver(cnf, lookahead_depth=2, num_candidates=5)
@@ -316,15 +340,20 @@ def example_8_visualization_data():
 
 
 def main():
-    """Run all examples."""
-    print("\n" + "█" * 70)
-    print("█" + " " * 68 + "█")
-    print("█" + "  LA-CDCL: Lookahead-Enhanced CDCL Solver".center(68) + "█")
-    print("█" + "  Example Demonstrations".center(68) + "█")
-    print("█" + " " * 68 + "█")
-    print("█" * 70)
+    """
+    Run all examples.
+
+    Flags: --parallel runs the settings of the depth, candidate and frequency
+    sweeps (examples 4-6) in worker processes.
+    """
+    global parallel_sweeps
+    parallel_sweeps = '--parallel' in sys.argv[1:]
+
+    sys.stdout.write(BANNER)
 
     try:
+        warm_up(LACDCLSolver, 'cdcl')
+
         example_1_hard_sat()
         example_2_easy_sat()
         example_3_propagation_heavy()
@@ -334,9 +363,7 @@ def main():
         example_7_disable_lookahead()
         example_8_visualization_data()
 
-        print("\n" + "=" * 70)
-        print("  All examples completed successfully!")
-        print("=" * 70 + "\n")
+        sys.stdout.write(f"\n{HEADER_BAR}\n  All examples completed successfully!\n{HEADER_BAR}\n\n")
 
     except Exception as e:
         print(f"\n❌ Error: {e}")
@@ -5,6 +5,6 @@ A SAT solver that enhances CDCL with lookahead to make better variable selection
 Before branching, performs shallow lookahead on top candidates to predict which leads to fewer conflicts.
 """
 
-from .la_cdcl_solver import LACDCLSolver, solve_la_cdcl
+from .la_cdcl_solver import LACDCLSolver, PreparedFormula, prepare_formula, solve_la_cdcl
 
-__all__ = ['LACDCLSolver', 'solve_la_cdcl']
+__all__ = ['LACDCLSolver', 'PreparedFormula', 'prepare_formula', 'solve_la_cdcl']
@@ -25,6 +25,7 @@ import sys
 import os
 from typing import Dict, List, Optional, Set, Tuple
 from collections import defaultdict
+from dataclasses import dataclass
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
@@ -32,7 +33,40 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 from bsat.cnf import CNFExpression, Clause, Literal
 from bsat.cdcl import CDCLSolver
 
-from .lookahead_engine import LookaheadEngine, LookaheadResult
+from .lookahead_engine import LookaheadEngine, LookaheadResult, freeze_clauses
+
+
+@dataclass(frozen=True)
+class PreparedFormula:
+    """
+    Formula-derived data that does not change during search.
+
+    Building it walks every clause once. Solvers created with the same
+    PreparedFormula (e.g. the settings of a parameter sweep) share it and
+    skip that work.
+    """
+    cnf: CNFExpression
+    variables: Tuple[str, ...]  # In the order decisions scan them
+    clause_key: Tuple  # Frozen clauses, the formula part of lookahead cache keys
+
+
+def prepare_formula(cnf: CNFExpression) -> PreparedFormula:
+    """
+    Precompute the formula data LACDCLSolver needs.
+
+    Args:
+        cnf: CNF formula
+
+    Returns:
+        PreparedFormula to pass to LACDCLSolver(..., prepared=...)
+    """
+    all_vars = set()
+    for clause in cnf.clauses:
+        for literal in clause.literals:
+            all_vars.add(literal.variable)
+
+    return PreparedFormula(cnf=cnf, variables=tuple(all_vars),
+                           clause_key=freeze_clauses(cnf))
 
 
 class LACDCLSolver:
@@ -57,7 +91,8 @@ class LACDCLSolver:
                  num_candidates: int = 5,
                  use_lookahead: bool = True,
                  lookahead_frequency: Optional[int] = None,
-                 adaptive_lookahead: bool = True):
+                 adaptive_lookahead: bool = True,
+                 prepared: Optional[PreparedFormula] = None):
         """
         Initialize LA-CDCL solver.
 
@@ -68,34 +103,54 @@ class LACDCLSolver:
             use_lookahead: Whether to use lookahead (can disable for comparison)
             lookahead_frequency: Use lookahead every N decisions (None = adaptive)
             adaptive_lookahead: Automatically adjust frequency based on conflict rate
+            prepared: prepare_formula(cnf), to share across solvers (default: build it)
         """
         self.cnf = cnf
-        self.lookahead_depth = lookahead_depth
-        self.num_candidates = num_candidates
-        self.use_lookahead = use_lookahead
-        self.adaptive_lookahead = adaptive_lookahead
+        if prepared is None or prepared.cnf is not cnf:
+            prepared = prepare_formula(cnf)
+        self.prepared = prepared
+
+        # Settings as given, so reset_search_state can re-apply them
+        self._settings = {
+            'lookahead_depth': lookahead_depth,
+            'num_candidates': num_candidates,
+            'use_lookahead': use_lookahead,
+            'lookahead_frequency': lookahead_frequency,
+            'adaptive_lookahead': adaptive_lookahead,
+        }
+
+        # Lookahead engine
+        self.lookahead = LookaheadEngine(
+            lookahead_depth=lookahead_depth,
+            num_candidates=num_candidates
+        )
+        self.lookahead.use_formula(cnf, prepared.clause_key)
+
+        # Base CDCL solver, only needed with lookahead disabled (built on first use)
+        self._base_solver: Optional[CDCLSolver] = None
+
+        self.recent_window_size = 20  # Window for conflict rate tracking
+        self._init_search_state()
+
+    def _init_search_state(self):
+        """Apply the settings and start with fresh adaptive tracking and statistics."""
+        self.lookahead_depth = self._settings['lookahead_depth']
+        self.num_candidates = self._settings['num_candidates']
+        self.use_lookahead = self._settings['use_lookahead']
+        self.adaptive_lookahead = self._settings['adaptive_lookahead']
 
         # Lookahead frequency (adaptive or fixed)
+        lookahead_frequency = self._settings['lookahead_frequency']
         if lookahead_frequency is not None:
             self.lookahead_frequency = lookahead_frequency
             self.adaptive_lookahead = False  # Disable adaptive if explicit frequency
-        elif adaptive_lookahead:
+        elif self.adaptive_lookahead:
             self.lookahead_frequency = 1  # Start with always
         else:
             self.lookahead_frequency = 1  # Default
 
-        # Lookahead engine
-        self.lookahead = LookaheadEngine(
-            lookahead_depth=lookahead_depth,
-            num_candidates=num_candidates
-        )
-
-        # Base CDCL solver (we'll use its infrastructure)
-        self.base_solver = CDCLSolver(cnf)
-
         # Adaptive lookahead tracking
         self.recent_decisions = []  # Track recent decision outcomes
-        self.recent_window_size = 20  # Window for conflict rate tracking
         self.frequency_adjustments = 0  # Count of frequency changes
 
         # Statistics
@@ -113,6 +168,40 @@ class LACDCLSolver:
             'avg_lookahead_frequency': 1.0
         }
 
+    def reset_search_state(self, **overrides):
+        """
+        Prepare the solver for another solve(), optionally with new settings.
+
+        The formula data (prepared formula, the lookahead engine's clause
+        keys and occurrence lists) is kept; statistics, adaptive tracking and
+        the lookahead cache start over, so the next solve() behaves exactly
+        like a new solver built with the updated settings. Parameter sweeps
+        use this to set the formula up once.
+
+        Args:
+            **overrides: Any of lookahead_depth, num_candidates, use_lookahead,
+                lookahead_frequency, adaptive_lookahead
+
+        Raises:
+            TypeError: For a keyword that is not a search setting
+        """
+        unknown = overrides.keys() - self._settings.keys()
+        if unknown:
+            raise TypeError(f"Unknown search setting(s): {', '.join(sorted(unknown))}")
+
+        self._settings.update(overrides)
+        self.lookahead.reset(lookahead_depth=self._settings['lookahead_depth'],
+                             num_candidates=self._settings['num_candidates'])
+        self._base_solver = None
+        self._init_search_state()
+
+    @property
+    def base_solver(self) -> CDCLSolver:
+        """Plain CDCL solver over the same formula (we'll use its infrastructure)."""
+        if self._base_solver is None:
+            self._base_solver = CDCLSolver(self.cnf)
+        return self._base_solver
+
     def solve(self) -> Optional[Dict[str, bool]]:
         """
         Solve using LA-CDCL.
@@ -193,10 +282,7 @@ class LACDCLSolver:
         # For simplicity, we'll use the base CDCL solver but with guidance
 
         # Get all variables
-        all_vars = set()
-        for clause in self.cnf.clauses:
-            for literal in clause.literals:
-                all_vars.add(literal.variable)
+        all_vars = self.prepared.variables
 
         # Track assignment
         assignment = {}
@@ -13,6 +13,8 @@ that looks more promising (fewer conflicts, more propagations).
 Complexity:
 - Lookahead depth d, candidates k: O(k × 2^d × propagation_cost)
 - Typical: d=2, k=5-10, so ~20-40 shallow propagations
+- Clause states are computed once per decision; a probe then only visits
+  the clauses its assigned variables occur in (see ProbeState)
 - Overhead: 5-10% of total time
 - Benefit: 20-50% fewer conflicts in systematic search
 """
@@ -21,12 +23,134 @@ import sys
 import os
 from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
-from copy import deepcopy
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 
-from bsat.cnf import CNFExpression, Clause, Literal
+from bsat.cnf import CNFExpression, Literal
+
+
+def clause_literal_tuples(cnf: CNFExpression) -> List[Tuple[Tuple[str, bool], ...]]:
+    """Each clause of cnf, in order, as a tuple of (variable, negated) pairs."""
+    return [tuple((lit.variable, lit.negated) for lit in clause.literals)
+            for clause in cnf.clauses]
+
+
+def freeze_clauses(cnf: CNFExpression) -> Tuple:
+    """
+    Hashable, order-independent form of a formula's clauses.
+
+    Args:
+        cnf: CNF formula
+
+    Returns:
+        Sorted tuple of clauses, each a tuple of (variable, negated) pairs
+    """
+    return tuple(sorted(clause_literal_tuples(cnf)))
+
+
+class ProbeState:
+    """
+    Clause counters for probing assignments on top of a base assignment.
+
+    For every clause this tracks how many literals are true and how many are
+    unassigned (a repeated literal counts each time, like a clause scan).
+    Assigning a variable only touches the clauses it occurs in, and undo()
+    rolls a probe back, so all probes of one decision share a single pass
+    over the formula instead of rescanning every clause per probe and per
+    propagation round.
+
+    A clause is unit when it has no true literal and exactly one unassigned
+    literal; it is satisfied when it has a true literal.
+    """
+
+    def __init__(self, clause_literals: List[Tuple[Tuple[str, bool], ...]],
+                 occurrences: Dict[str, List[Tuple[int, bool]]],
+                 assignment: Dict[str, bool]):
+        """
+        Compute the clause counters under the base assignment.
+
+        Args:
+            clause_literals: (variable, negated) pairs of each clause
+            occurrences: Variable -> (clause index, negated) of each occurrence
+            assignment: Base assignment (copied)
+        """
+        self.clause_literals = clause_literals
+        self.occurrences = occurrences
+        self.assignment = dict(assignment)
+
+        self.true_count: List[int] = []
+        self.unassigned_count: List[int] = []
+        self.num_satisfied = 0
+        base_units = []
+
+        for idx, literals in enumerate(clause_literals):
+            num_true = 0
+            num_unassigned = 0
+            for var, negated in literals:
+                if var not in assignment:
+                    num_unassigned += 1
+                elif assignment[var] != negated:
+                    num_true += 1
+            self.true_count.append(num_true)
+            self.unassigned_count.append(num_unassigned)
+            if num_true:
+                self.num_satisfied += 1
+            elif num_unassigned == 1:
+                base_units.append(idx)
+
+        self.base_units = base_units  # Unit under the base assignment
+        self.trail: List[str] = []  # Variables assigned since the base
+        self.touched: Set[int] = set()  # Clauses whose counters changed
+
+    def assign(self, var: str, value: bool):
+        """Assign an unassigned variable and update its clauses' counters."""
+        self.assignment[var] = value
+        self.trail.append(var)
+        true_count = self.true_count
+        unassigned_count = self.unassigned_count
+        for idx, negated in self.occurrences.get(var, ()):
+            unassigned_count[idx] -= 1
+            if value != negated:
+                if not true_count[idx]:
+                    self.num_satisfied += 1
+                true_count[idx] += 1
+            self.touched.add(idx)
+
+    def undo(self):
+        """Unassign everything assigned since the base assignment."""
+        true_count = self.true_count
+        unassigned_count = self.unassigned_count
+        while self.trail:
+            var = self.trail.pop()
+            value = self.assignment.pop(var)
+            for idx, negated in self.occurrences.get(var, ()):
+                unassigned_count[idx] += 1
+                if value != negated:
+                    true_count[idx] -= 1
+                    if not true_count[idx]:
+                        self.num_satisfied -= 1
+        self.touched.clear()
+
+    def unit_clauses(self) -> List[int]:
+        """Indices of the clauses that are currently unit, in clause order."""
+        touched = self.touched
+        true_count = self.true_count
+        unassigned_count = self.unassigned_count
+
+        units = [idx for idx in self.base_units if idx not in touched]
+        units.extend(idx for idx in touched
+                     if not true_count[idx] and unassigned_count[idx] == 1)
+        units.sort()
+        return units
+
+    def first_unassigned(self, idx: int) -> Optional[Tuple[str, bool]]:
+        """First literal of clause idx whose variable is unassigned, if any."""
+        assignment = self.assignment
+        for literal in self.clause_literals[idx]:
+            if literal[0] not in assignment:
+                return literal
+        return None
 
 
 @dataclass
@@ -76,6 +200,14 @@ class LookaheadEngine:
         # Key: (frozen_clauses, frozen_assignment) -> (propagations, conflicts)
         self.propagation_cache: Dict[Tuple, Tuple[int, int]] = {}
 
+        # Formula part of the cache keys, for the CNF it was last built from
+        self._keyed_cnf: Optional[CNFExpression] = None
+        self._clause_key: Tuple = ()
+
+        # Clause literals and occurrence lists of that CNF, built on first probe
+        self._clause_literals: Optional[List[Tuple[Tuple[str, bool], ...]]] = None
+        self._occurrences: Dict[str, List[Tuple[int, bool]]] = {}
+
         # Statistics
         self.stats = {
             'total_lookaheads': 0,
@@ -85,6 +217,39 @@ class LookaheadEngine:
             'total_conflicts_detected': 0
         }
 
+    def use_formula(self, cnf: CNFExpression, clause_key: Optional[Tuple] = None):
+        """
+        Set the formula whose clauses go into the cache keys.
+
+        The frozen clause set only depends on the formula, so it is built once
+        per CNF instead of on every lookahead. Pass clause_key to reuse one
+        that was already built (see la_cdcl_solver.prepare_formula).
+
+        Args:
+            cnf: CNF formula that will be passed to evaluate_candidates
+            clause_key: Precomputed frozen clauses of cnf (default: build them)
+        """
+        self._keyed_cnf = cnf
+        self._clause_key = clause_key if clause_key is not None else freeze_clauses(cnf)
+        self._clause_literals = None
+        self._occurrences = {}
+
+    def _probe_state(self, cnf: CNFExpression,
+                     assignment: Dict[str, bool]) -> ProbeState:
+        """Clause counters of cnf under assignment, ready for probing."""
+        if cnf is not self._keyed_cnf:
+            self.use_formula(cnf)
+
+        if self._clause_literals is None:
+            self._clause_literals = clause_literal_tuples(cnf)
+            occurrences: Dict[str, List[Tuple[int, bool]]] = {}
+            for idx, literals in enumerate(self._clause_literals):
+                for var, negated in literals:
+                    occurrences.setdefault(var, []).append((idx, negated))
+            self._occurrences = occurrences
+
+        return ProbeState(self._clause_literals, self._occurrences, assignment)
+
     def evaluate_candidates(self,
                            cnf: CNFExpression,
                            candidates: List[str],
@@ -101,6 +266,7 @@ class LookaheadEngine:
             List of LookaheadResult objects, sorted by score (best first)
         """
         results = []
+        state = None  # Clause counters under current_assignment, shared by all probes
 
         # Limit candidates
         candidates_to_try = candidates[:self.num_candidates]
@@ -110,9 +276,12 @@ class LookaheadEngine:
             if var in current_assignment:
                 continue
 
+            if state is None:
+                state = self._probe_state(cnf, current_assignment)
+
             # Try both True and False
             for value in [True, False]:
-                result = self._evaluate_assignment(cnf, var, value, current_assignment)
+                result = self._evaluate_assignment(cnf, var, value, current_assignment, state)
                 results.append(result)
                 self.stats['total_lookaheads'] += 1
 
@@ -125,44 +294,51 @@ class LookaheadEngine:
                             cnf: CNFExpression,
                             variable: str,
                             value: bool,
-                            current_assignment: Dict[str, bool]) -> LookaheadResult:
+                            current_assignment: Dict[str, bool],
+                            state: Optional[ProbeState] = None) -> LookaheadResult:
         """
         Evaluate a single variable assignment using shallow lookahead.
 
         Args:
             cnf: Current CNF formula
-            variable: Variable to assign
+            variable: Variable to assign (unassigned in current_assignment)
             value: Value to try
             current_assignment: Current partial assignment
+            state: Clause counters under current_assignment, to share between
+                probes (default: compute them)
 
         Returns:
             LookaheadResult with evaluation metrics
         """
-        # Create temporary assignment
-        temp_assignment = dict(current_assignment)
-        temp_assignment[variable] = value
+        if state is None:
+            state = self._probe_state(cnf, current_assignment)
+
+        # Temporary assignment (state.assignment is current + variable=value)
+        state.assign(variable, value)
+
+        # Count reduced clauses (clauses satisfied by this assignment)
+        reduced_clauses = state.num_satisfied
 
         # Check cache
-        cache_key = self._make_cache_key(cnf, temp_assignment)
+        cache_key = self._make_cache_key(cnf, state.assignment)
         if cache_key in self.propagation_cache:
             num_propagations, num_conflicts = self.propagation_cache[cache_key]
             self.stats['cache_hits'] += 1
         else:
             # Perform shallow lookahead
             num_propagations, num_conflicts = self._shallow_propagate(
-                cnf, temp_assignment, depth=self.lookahead_depth
+                state, depth=self.lookahead_depth
             )
 
             # Cache result
             self.propagation_cache[cache_key] = (num_propagations, num_conflicts)
             self.stats['cache_misses'] += 1
 
+        state.undo()
+
         self.stats['total_propagations'] += num_propagations
         self.stats['total_conflicts_detected'] += num_conflicts
 
-        # Count reduced clauses (clauses satisfied by this assignment)
-        reduced_clauses = self._count_reduced_clauses(cnf, temp_assignment)
-
         # Compute score
         score = self._compute_score(num_propagations, num_conflicts, reduced_clauses)
 
@@ -176,15 +352,17 @@ class LookaheadEngine:
         )
 
     def _shallow_propagate(self,
-                          cnf: CNFExpression,
-                          assignment: Dict[str, bool],
+                          state: ProbeState,
                           depth: int) -> Tuple[int, int]:
         """
         Perform shallow unit propagation up to given depth.
 
+        Each round propagates the clauses that are unit at its start, in
+        clause order. Only clauses touched by the probe's assignments are
+        re-examined, via the occurrence lists.
+
         Args:
-            cnf: CNF formula
-            assignment: Current assignment
+            state: Clause counters under the probe's assignment (extended in place)
             depth: Maximum depth to propagate
 
         Returns:
@@ -193,126 +371,29 @@ class LookaheadEngine:
         num_propagations = 0
         num_conflicts = 0
 
-        current_assignment = dict(assignment)
-
         for _ in range(depth):
             # Find unit clauses
-            unit_clauses = self._find_unit_clauses(cnf, current_assignment)
+            unit_clauses = state.unit_clauses()
 
             if not unit_clauses:
                 break  # No more unit propagations
 
             # Propagate each unit clause
-            for clause in unit_clauses:
-                # Find the unassigned literal
-                unassigned_literal = None
-                for literal in clause.literals:
-                    if literal.variable not in current_assignment:
-                        unassigned_literal = literal
-                        break
+            for idx in unit_clauses:
+                # Find the unassigned literal; an earlier propagation in
+                # this round may have assigned it already
+                unassigned_literal = state.first_unassigned(idx)
 
                 if unassigned_literal is None:
                     continue
 
                 # Assign to satisfy the unit clause
-                value = not unassigned_literal.negated
-
-                # Check for conflict
-                if unassigned_literal.variable in current_assignment:
-                    if current_assignment[unassigned_literal.variable] != value:
-                        num_conflicts += 1
-                        continue
-
-                current_assignment[unassigned_literal.variable] = value
+                variable, negated = unassigned_literal
+                state.assign(variable, not negated)
                 num_propagations += 1
 
         return num_propagations, num_conflicts
 
-    def _find_unit_clauses(self,
-                          cnf: CNFExpression,
-                          assignment: Dict[str, bool]) -> List[Clause]:
-        """
-        Find all unit clauses under current assignment.
-
-        A clause is unit if:
-        - Exactly one literal is unassigned
-        - All other literals are false
-
-        Args:
-            cnf: CNF formula
-            assignment: Current assignment
-
-        Returns:
-            List of unit clauses
-        """
-        unit_clauses = []
-
-        for clause in cnf.clauses:
-            unassigned_count = 0
-            all_others_false = True
-
-            for literal in clause.literals:
-                if literal.variable not in assignment:
-                    unassigned_count += 1
-                else:
-                    # Check if literal is true
-                    var_value = assignment[literal.variable]
-                    literal_value = (not var_value) if literal.negated else var_value
-
-                    if literal_value:
-                        # Clause is satisfied
-                        all_others_false = False
-                        break
-
-            if unassigned_count == 1 and all_others_false:
-                unit_clauses.append(clause)
-
-        return unit_clauses
-
-    def _count_reduced_clauses(self,
-                              cnf: CNFExpression,
-                              assignment: Dict[str, bool]) -> int:
-        """
-        Count how many clauses are satisfied by assignment.
-
-        Args:
-            cnf: CNF formula
-            assignment: Current assignment
-
-        Returns:
-            Number of satisfied clauses
-        """
-        count = 0
-
-        for clause in cnf.clauses:
-            if self._is_clause_satisfied(clause, assignment):
-                count += 1
-
-        return count
-
-    def _is_clause_satisfied(self,
-                            clause: Clause,
-                            assignment: Dict[str, bool]) -> bool:
-        """
-        Check if clause is satisfied by assignment.
-
-        Args:
-            clause: Clause to check
-            assignment: Current assignment
-
-        Returns:
-            True if clause is satisfied
-        """
-        for literal in clause.literals:
-            if literal.variable in assignment:
-                var_value = assignment[literal.variable]
-                literal_value = (not var_value) if literal.negated else var_value
-
-                if literal_value:
-                    return True
-
-        return False
-
     def _compute_score(self,
                       num_propagations: int,
                       num_conflicts: int,
@@ -357,14 +438,10 @@ class LookaheadEngine:
         Returns:
             Hashable cache key
         """
-        # Create frozen representation of clauses
-        clause_tuples = []
-        for clause in cnf.clauses:
-            literal_tuples = tuple(
-                (lit.variable, lit.negated) for lit in clause.literals
-            )
-            clause_tuples.append(literal_tuples)
-        frozen_clauses = tuple(sorted(clause_tuples))
+        # Frozen representation of clauses, rebuilt only for a new formula
+        if cnf is not self._keyed_cnf:
+            self.use_formula(cnf)
+        frozen_clauses = self._clause_key
 
         # Create frozen representation of assignment
         frozen_assignment = tuple(sorted(assignment.items()))
@@ -398,6 +475,27 @@ class LookaheadEngine:
             'avg_propagations_per_lookahead': avg_propagations
         }
 
+    def reset(self,
+              lookahead_depth: Optional[int] = None,
+              num_candidates: Optional[int] = None):
+        """
+        Empty the cache and statistics, keeping the formula data.
+
+        The clause keys and occurrence lists stay valid for the same CNF, so
+        a reset engine skips rebuilding them.
+
+        Args:
+            lookahead_depth: New lookahead depth (default: unchanged)
+            num_candidates: New number of candidates (default: unchanged)
+        """
+        if lookahead_depth is not None:
+            self.lookahead_depth = lookahead_depth
+        if num_candidates is not None:
+            self.num_candidates = num_candidates
+
+        self.propagation_cache = {}
+        self.stats = dict.fromkeys(self.stats, 0)
+
     def clear_cache(self):
         """Clear propagation cache (call when backtracking significantly)."""
         self.propagation_cache.clear()
@@ -1,39 +1,78 @@
 """Boolean Satisfiability (SAT) package for CNF expressions."""
 
+from importlib import import_module
+
 from .cnf import Literal, Clause, CNFExpression
-from .davis_putnam import DavisPutnamSolver, solve_davis_putnam, get_davis_putnam_stats, DavisPutnamStats
-from .twosatsolver import TwoSATSolver, solve_2sat, is_2sat_satisfiable, is_2sat
-from .dpll import DPLLSolver, solve_sat, find_all_sat_solutions, count_sat_solutions
-from .hornsat import HornSATSolver, solve_horn_sat, is_horn_formula
-from .xorsat import XORSATSolver, solve_xorsat, get_xorsat_stats
-from .walksat import WalkSATSolver, solve_walksat, get_walksat_stats
-from .cdcl import CDCLSolver, solve_cdcl, get_cdcl_stats
-from .schoening import SchoeningSolver, solve_schoening, get_schoening_stats
-from .reductions import (
-    reduce_to_3sat,
-    extract_original_solution,
-    solve_with_reduction,
-    is_3sat,
-    get_max_clause_size,
-    ReductionStats
-)
-from .dimacs import (
-    parse_dimacs,
-    to_dimacs,
-    read_dimacs_file,
-    write_dimacs_file,
-    parse_dimacs_solution,
-    solution_to_dimacs,
-    DIMACSParseError
-)
-from .preprocessing import (
-    SATPreprocessor,
-    preprocess_cnf,
-    decompose_into_components,
-    decompose_and_preprocess,
-    PreprocessingResult,
-    PreprocessingStats
-)
+
+# Solvers and utilities are loaded on first access (PEP 562), so importing the
+# package, or one solver module from it, does not import every other solver.
+_LAZY_EXPORTS = {
+    'DavisPutnamSolver': 'davis_putnam',
+    'solve_davis_putnam': 'davis_putnam',
+    'get_davis_putnam_stats': 'davis_putnam',
+    'DavisPutnamStats': 'davis_putnam',
+    'TwoSATSolver': 'twosatsolver',
+    'solve_2sat': 'twosatsolver',
+    'is_2sat_satisfiable': 'twosatsolver',
+    'is_2sat': 'twosatsolver',
+    'DPLLSolver': 'dpll',
+    'solve_sat': 'dpll',
+    'find_all_sat_solutions': 'dpll',
+    'count_sat_solutions': 'dpll',
+    'HornSATSolver': 'hornsat',
+    'solve_horn_sat': 'hornsat',
+    'is_horn_formula': 'hornsat',
+    'XORSATSolver': 'xorsat',
+    'solve_xorsat': 'xorsat',
+    'get_xorsat_stats': 'xorsat',
+    'WalkSATSolver': 'walksat',
+    'solve_walksat': 'walksat',
+    'get_walksat_stats': 'walksat',
+    'CDCLSolver': 'cdcl',
+    'solve_cdcl': 'cdcl',
+    'get_cdcl_stats': 'cdcl',
+    'SchoeningSolver': 'schoening',
+    'solve_schoening': 'schoening',
+    'get_schoening_stats': 'schoening',
+    'reduce_to_3sat': 'reductions',
+    'extract_original_solution': 'reductions',
+    'solve_with_reduction': 'reductions',
+    'is_3sat': 'reductions',
+    'get_max_clause_size': 'reductions',
+    'ReductionStats': 'reductions',
+    'parse_dimacs': 'dimacs',
+    'to_dimacs': 'dimacs',
+    'read_dimacs_file': 'dimacs',
+    'write_dimacs_file': 'dimacs',
+    'parse_dimacs_solution': 'dimacs',
+    'solution_to_dimacs': 'dimacs',
+    'DIMACSParseError': 'dimacs',
+    'SATPreprocessor': 'preprocessing',
+    'preprocess_cnf': 'preprocessing',
+    'decompose_into_components': 'preprocessing',
+    'decompose_and_preprocess': 'preprocessing',
+    'PreprocessingResult': 'preprocessing',
+    'PreprocessingStats': 'preprocessing',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is not None:
+        value = getattr(import_module(f'.{module_name}', __name__), name)
+    elif name in _LAZY_EXPORTS.values():
+        # Submodules were reachable as attributes when everything loaded eagerly
+        value = import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     'Literal',
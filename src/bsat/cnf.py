@@ -2,6 +2,7 @@
 
 import json
 import re
+from functools import lru_cache
 from typing import Set, Dict, List, Tuple
 from itertools import product
 
@@ -302,50 +303,63 @@ class CNFExpression:
         Returns:
             CNF expression object
         """
-        # Normalize the expression
-        expr = expression.strip()
-
-        # Replace various notation styles with standard symbols
-        expr = re.sub(r'\bNOT\b', '¬', expr, flags=re.IGNORECASE)
-        expr = re.sub(r'\bOR\b', '∨', expr, flags=re.IGNORECASE)
-        expr = re.sub(r'\bAND\b', '∧', expr, flags=re.IGNORECASE)
-        expr = expr.replace('~', '¬')
-        expr = expr.replace('!', '¬')
-        expr = expr.replace('|', '∨')
-        expr = expr.replace('&', '∧')
-
-        # Split by conjunction (AND)
-        clause_strs = re.split(r'\s*∧\s*', expr)
-
-        clauses = []
-        for clause_str in clause_strs:
-            clause_str = clause_str.strip()
-
-            # Remove outer parentheses if present
-            if clause_str.startswith('(') and clause_str.endswith(')'):
-                clause_str = clause_str[1:-1].strip()
-
-            # Split by disjunction (OR)
-            literal_strs = re.split(r'\s*∨\s*', clause_str)
-
-            literals = []
-            for lit_str in literal_strs:
-                lit_str = lit_str.strip()
-
-                # Check for negation
-                negated = False
-                if lit_str.startswith('¬'):
-                    negated = True
-                    lit_str = lit_str[1:].strip()
-
-                # Extract variable name
-                match = re.match(r'^([a-zA-Z_][a-zA-Z0-9_]*)$', lit_str)
-                if not match:
-                    raise ValueError(f"Invalid variable name: {lit_str}")
-
-                variable = match.group(1)
-                literals.append(Literal(variable, negated))
-
-            clauses.append(Clause(literals))
-
-        return cls(clauses)
+        # Tokenizing is memoized by string content; each call still gets its
+        # own Clause and Literal objects, so callers may mutate the result.
+        return cls([Clause([Literal(variable, negated) for variable, negated in clause])
+                    for clause in _parse_literals(expression)])
+
+
+@lru_cache(maxsize=256)
+def _parse_literals(expression: str) -> Tuple[Tuple[Tuple[str, bool], ...], ...]:
+    """
+    Tokenize a CNF string into (variable, negated) pairs per clause.
+
+    Backs CNFExpression.parse; results are immutable so they can be cached.
+    """
+    # Normalize the expression
+    expr = expression.strip()
+
+    # Replace various notation styles with standard symbols
+    expr = re.sub(r'\bNOT\b', '¬', expr, flags=re.IGNORECASE)
+    expr = re.sub(r'\bOR\b', '∨', expr, flags=re.IGNORECASE)
+    expr = re.sub(r'\bAND\b', '∧', expr, flags=re.IGNORECASE)
+    expr = expr.replace('~', '¬')
+    expr = expr.replace('!', '¬')
+    expr = expr.replace('|', '∨')
+    expr = expr.replace('&', '∧')
+
+    # Split by conjunction (AND)
+    clause_strs = re.split(r'\s*∧\s*', expr)
+
+    clauses = []
+    for clause_str in clause_strs:
+        clause_str = clause_str.strip()
+
+        # Remove outer parentheses if present
+        if clause_str.startswith('(') and clause_str.endswith(')'):
+            clause_str = clause_str[1:-1].strip()
+
+        # Split by disjunction (OR)
+        literal_strs = re.split(r'\s*∨\s*', clause_str)
+
+        literals = []
+        for lit_str in literal_strs:
+            lit_str = lit_str.strip()
+
+            # Check for negation
+            negated = False
+            if lit_str.startswith('¬'):
+                negated = True
+                lit_str = lit_str[1:].strip()
+
+            # Extract variable name
+            match = re.match(r'^([a-zA-Z_][a-zA-Z0-9_]*)$', lit_str)
+            if not match:
+                raise ValueError(f"Invalid variable name: {lit_str}")
+
+            variable = match.group(1)
+            literals.append((variable, negated))
+
+        clauses.append(tuple(literals))
+
+    return tuple(clauses)
@@ -0,0 +1,57 @@
+"""
+Tests for CNF expression parsing
+"""
+
+import unittest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bsat import CNFExpression, Clause, Literal
+
+
+class TestCNFParse(unittest.TestCase):
+    """Test CNFExpression.parse."""
+
+    def test_simple_formula(self):
+        """Test parsing a simple formula."""
+        cnf = CNFExpression.parse("(a | ~b) & (b | c)")
+
+        self.assertEqual(len(cnf.clauses), 2)
+        self.assertEqual(cnf.clauses[0].literals[0].variable, 'a')
+        self.assertFalse(cnf.clauses[0].literals[0].negated)
+        self.assertEqual(cnf.clauses[0].literals[1].variable, 'b')
+        self.assertTrue(cnf.clauses[0].literals[1].negated)
+
+    def test_repeated_parse_returns_distinct_objects(self):
+        """Test that parsing the same string twice shares no objects."""
+        formula = "(x | y) & (~x | z)"
+        first = CNFExpression.parse(formula)
+        second = CNFExpression.parse(formula)
+
+        self.assertIsNot(first, second)
+        self.assertIsNot(first.clauses, second.clauses)
+        for clause1, clause2 in zip(first.clauses, second.clauses):
+            self.assertIsNot(clause1, clause2)
+            self.assertIsNot(clause1.literals, clause2.literals)
+            for lit1, lit2 in zip(clause1.literals, clause2.literals):
+                self.assertIsNot(lit1, lit2)
+
+    def test_mutation_does_not_leak_through_cache(self):
+        """Test that mutating a parsed formula does not affect later parses."""
+        formula = "(p | q) & (~p | r)"
+        first = CNFExpression.parse(formula)
+
+        first.clauses[0].literals.append(Literal('s', True))
+        first.clauses[1].literals[0].negated = False
+        first.clauses.append(Clause([Literal('t')]))
+
+        second = CNFExpression.parse(formula)
+        self.assertEqual(len(second.clauses), 2)
+        self.assertEqual([lit.variable for lit in second.clauses[0].literals], ['p', 'q'])
+        self.assertTrue(second.clauses[1].literals[0].negated)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+"""
+Tests for the bsat package namespace (lazily loaded exports)
+"""
+
+import unittest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import bsat
+
+
+class TestPackageExports(unittest.TestCase):
+    """Test that the public names resolve on demand."""
+
+    def test_all_names_resolve(self):
+        """Test that every name in __all__ is reachable as an attribute."""
+        for name in bsat.__all__:
+            with self.subTest(name=name):
+                self.assertIsNotNone(getattr(bsat, name))
+
+    def test_star_import(self):
+        """Test that from bsat import * binds every name in __all__."""
+        namespace = {}
+        exec('from bsat import *', namespace)
+
+        for name in bsat.__all__:
+            self.assertIn(name, namespace)
+        self.assertIs(namespace['CDCLSolver'], bsat.CDCLSolver)
+
+    def test_unknown_name(self):
+        """Test that an unknown attribute raises AttributeError."""
+        with self.assertRaises(AttributeError):
+            getattr(bsat, 'NoSuchSolver')
+        self.assertFalse(hasattr(bsat, 'no_such_function'))
+
+    def test_dir_lists_lazy_exports(self):
+        """Test that dir() includes exports that have not been loaded yet."""
+        listed = dir(bsat)
+        for name in bsat.__all__:
+            self.assertIn(name, listed)
+
+
+if __name__ == '__main__':
+    unittest.main()